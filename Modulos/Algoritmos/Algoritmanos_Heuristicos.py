@@ -6,6 +6,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
+from utils.tareas import obtener_ejecutor, BarraTarea
 
 class Algoritmos_Heuristicos(QWidget):
     def __init__(self):
@@ -30,8 +31,8 @@ class Algoritmos_Heuristicos(QWidget):
         self.peso_in = QSpinBox(); self.peso_in.setPrefix("Peso: "); self.peso_in.setMaximum(100)
         self.val_in = QSpinBox(); self.val_in.setPrefix("Valor: "); self.val_in.setMaximum(200)
         row1.addWidget(self.peso_in); row1.addWidget(self.val_in)
-        btn_add = QPushButton("➕ Añadir ítem"); btn_add.clicked.connect(self.add_item)
-        row1.addWidget(btn_add)
+        self.btn_add = QPushButton("➕ Añadir ítem"); self.btn_add.clicked.connect(self.add_item)
+        row1.addWidget(self.btn_add)
         row1.addWidget(QLabel("Capacidad:"))
         self.cap_spin = QSpinBox(); self.cap_spin.setValue(self.capacidad); self.cap_spin.setMaximum(500)
         self.cap_spin.valueChanged.connect(lambda v: setattr(self, "capacidad", v))
@@ -42,10 +43,14 @@ class Algoritmos_Heuristicos(QWidget):
         self.combo = QComboBox()
         self.combo.addItems(["Voraz", "Local", "Tabú", "Enfriamiento", "Gradiente", "Hormigas", "Genético"])
         row2.addWidget(self.combo)
-        run = QPushButton("▶️ Ejecutar"); run.clicked.connect(self.run)
-        clear = QPushButton("🧹 Limpiar"); clear.clicked.connect(self.clear)
-        row2.addWidget(run); row2.addWidget(clear)
+        self.btn_run = QPushButton("▶️ Ejecutar"); self.btn_run.clicked.connect(self.run)
+        self.btn_clear = QPushButton("🧹 Limpiar"); self.btn_clear.clicked.connect(self.clear)
+        row2.addWidget(self.btn_run); row2.addWidget(self.btn_clear)
         layout.addLayout(row2)
+
+        # Progreso del algoritmo que corre en segundo plano
+        self.barra_tarea = BarraTarea()
+        layout.addWidget(self.barra_tarea)
         
         btn_volver = QPushButton("🔙 Volver")
         btn_volver.setStyleSheet("padding: 6px; font-weight: bold; background-color: #444; color: white; border-radius: 6px;")
@@ -95,25 +100,51 @@ class Algoritmos_Heuristicos(QWidget):
             self.res.setText("⚠️ Añade al menos un ítem")
             return
 
-        if algo == "Voraz": sol, val = self.greedy()
-        elif algo == "Local": sol, val = self.local_search()
-        elif algo == "Tabú": sol, val = self.taboo_search()
-        elif algo == "Enfriamiento": sol, val = self.simulated_annealing()
-        elif algo == "Gradiente": sol, val = self.gradient_descent()
-        elif algo == "Hormigas": sol, val = self.ant_colony()
-        elif algo == "Genético": sol, val = self.genetic_algorithm()
-        else: sol, val = [], 0
+        metodos = {
+            "Voraz": self.greedy, "Local": self.local_search, "Tabú": self.taboo_search,
+            "Enfriamiento": self.simulated_annealing, "Gradiente": self.gradient_descent,
+            "Hormigas": self.ant_colony, "Genético": self.genetic_algorithm,
+        }
+        metodo = metodos.get(algo)
+        if metodo is None:
+            self.show_solution(algo, ([], 0))
+            return
+
+        # El algoritmo corre en un hilo; mientras tanto no se pueden modificar los ítems.
+        # Cada método recibe "control" y lo revisa en su ciclo principal: Cancelar lo detiene ahí
+        self.set_controls_enabled(False)
+        tarea = obtener_ejecutor().ejecutar(
+            metodo,
+            al_resultado=lambda resultado: self.show_solution(algo, resultado),
+            al_error=lambda e: self.res.append(f"\n❌ Error en {algo}: {e}"),
+            al_cancelar=lambda: self.res.append(f"\n⏹️ Método {algo} cancelado"),
+            al_terminar=lambda: self.set_controls_enabled(True),
+        )
+        self.barra_tarea.seguir(tarea)
 
+    def set_controls_enabled(self, habilitado):
+        for control in (self.btn_run, self.btn_add, self.btn_clear, self.combo, self.cap_spin):
+            control.setEnabled(habilitado)
+
+    def show_solution(self, algo, resultado):
+        sol, val = resultado
         self.res.append(f"\n✅ Método: {algo}")
         self.res.append("🎯 Solución obtenida:")
         for peso, valor in sol:
             self.res.append(f"• Peso: {peso} - Valor: {valor}")
         self.res.append(f"💰 Valor total: {val}")
 
-    def greedy(self):
+    # Revisa la cancelación y, si se conoce el total de pasos, informa el avance
+    def avanzar(self, control, paso=None, total=None):
+        if control is None: return
+        control.verificar()
+        if total: control.progreso(100 * paso / total)
+
+    def greedy(self, control=None):
         items = sorted(self.items, key=lambda iv: iv[1] / iv[0], reverse=True)
         sol = []; val = 0; cap = self.capacidad
-        for p, v in items:
+        for k, (p, v) in enumerate(items):
+            self.avanzar(control, k, len(items))
             if p <= cap: sol.append((p, v)); cap -= p; val += v
         return sol, val
 
@@ -138,9 +169,10 @@ class Algoritmos_Heuristicos(QWidget):
                 else: sol[i] = 0
         return sol
 
-    def local_search(self):
+    def local_search(self, control=None):
         sol = self.fix(self.random_sol()); best = self.fitness(sol); improved = True
         while improved:
+            self.avanzar(control)
             improved = False
             for i in range(len(sol)):
                 nsol = sol[:]; nsol[i] = 1 - nsol[i]
@@ -148,10 +180,11 @@ class Algoritmos_Heuristicos(QWidget):
                 if fv > best: sol, best, improved = nsol, fv, True; break
         return [self.items[i] for i in range(len(sol)) if sol[i]], best
 
-    def taboo_search(self):
+    def taboo_search(self, control=None):
         sol = self.fix(self.random_sol()); best = sol[:]; best_val = self.fitness(sol)
         tabu = []; it = 0
         while it < 50:
+            self.avanzar(control, it, 50)
             neighbors = []
             for i in range(len(sol)):
                 ns = sol[:]; ns[i] = 1 - ns[i]; neighbors.append(ns)
@@ -167,10 +200,12 @@ class Algoritmos_Heuristicos(QWidget):
             it += 1
         return [self.items[i] for i in range(len(best)) if best[i]], best_val
 
-    def simulated_annealing(self):
+    def simulated_annealing(self, control=None):
         sol = self.fix(self.random_sol()); best_sol = sol[:]; best_val = self.fitness(sol)
         T = 100.0; alpha = 0.95
+        pasos = math.ceil(math.log(0.1 / T) / math.log(alpha)); k = 0
         while T > 0.1:
+            self.avanzar(control, k, pasos); k += 1
             i = random.randrange(len(sol))
             ns = sol[:]; ns[i] = 1 - ns[i]; ns = self.fix(ns)
             f0 = self.fitness(sol); f1 = self.fitness(ns)
@@ -179,10 +214,11 @@ class Algoritmos_Heuristicos(QWidget):
             T *= alpha
         return [self.items[i] for i in range(len(best_sol)) if best_sol[i]], best_val
 
-    def gradient_descent(self):
+    def gradient_descent(self, control=None):
         sol = self.fix(self.random_sol()); best_val = self.fitness(sol)
         improved = True
         while improved:
+            self.avanzar(control)
             improved = False
             for i in range(len(sol)):
                 ns = sol[:]; ns[i] = 1 - ns[i]; ns = self.fix(ns)
@@ -190,9 +226,10 @@ class Algoritmos_Heuristicos(QWidget):
                 if fv > best_val: sol, best_val, improved = ns, fv, True; break
         return [self.items[i] for i in range(len(sol)) if sol[i]], best_val
 
-    def ant_colony(self):
+    def ant_colony(self, control=None):
         n = len(self.items); pher = np.ones(n); best_val = -1
-        for _ in range(30):
+        for k in range(30):
+            self.avanzar(control, k, 30)
             sol = [0] * n; cap = self.capacidad
             probs = pher / pher.sum()
             for i in range(n):
@@ -205,11 +242,12 @@ class Algoritmos_Heuristicos(QWidget):
                 if best_sol[i] == 1: pher[i] += 1
         return [self.items[i] for i in range(len(best_sol)) if best_sol[i]], best_val
 
-    def genetic_algorithm(self):
+    def genetic_algorithm(self, control=None):
         n = len(self.items)
         pop = [self.fix(self.random_sol()) for _ in range(20)]
         def select(): return sorted(pop, key=lambda s: self.fitness(s), reverse=True)[:2]
-        for _ in range(50):
+        for k in range(50):
+            self.avanzar(control, k, 50)
             a, b = select(); cut = random.randrange(n)
             child = self.fix(a[:cut] + b[cut:])
             if random.random() < 0.1:
@@ -220,6 +258,7 @@ class Algoritmos_Heuristicos(QWidget):
         return [self.items[i] for i in range(n) if best[i]], self.fitness(best)
     
     def volver(self):
+        self.barra_tarea.cancelar()
         from Modulos.menu_general.menu_general import MenuGeneral
         self.menu = MenuGeneral()
         self.menu.show()
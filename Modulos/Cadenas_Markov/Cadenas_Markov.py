@@ -2,10 +2,23 @@ import sys
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout,
-    QHBoxLayout, QTableWidget, QTableWidgetItem, QSpinBox, QTextEdit
+    QHBoxLayout, QSpinBox, QTextEdit
 )
 from PyQt5.QtCore import Qt
 
+# Editor de matrices virtualizado (pegar desde el portapapeles y rellenar de una vez)
+from utils.editor_matriz import EditorMatriz
+
+
+# Distribuciones π₀, π₁, ..., π_pasos de la cadena con matriz de transición P (π_{n+1} = π_n P)
+def evolucionar_markov(pi, P, pasos):
+    distribuciones = [pi]
+    for _ in range(pasos):
+        pi = pi @ P
+        distribuciones.append(pi)
+    return distribuciones
+
+
 class CadenasMarkov(QWidget):
     def __init__(self):
         super().__init__()
@@ -26,7 +39,7 @@ class CadenasMarkov(QWidget):
         config_layout = QHBoxLayout()
         self.spin_dim = QSpinBox()
         self.spin_dim.setMinimum(2)
-        self.spin_dim.setMaximum(10)
+        self.spin_dim.setMaximum(1000)
         self.spin_dim.setValue(3)
         self.spin_dim.setPrefix("Estados: ")
         self.spin_dim.valueChanged.connect(self.generar_tablas)
@@ -38,8 +51,9 @@ class CadenasMarkov(QWidget):
         config_layout.addWidget(self.spin_pasos)
         layout.addLayout(config_layout)
 
-        self.tabla_P = QTableWidget()
-        self.tabla_pi = QTableWidget()
+        self.tabla_P = EditorMatriz()
+        self.tabla_pi = EditorMatriz(herramientas=False)
+        self.tabla_pi.setMaximumHeight(90)
         layout.addWidget(QLabel("Matriz de Transición P:"))
         layout.addWidget(self.tabla_P)
         layout.addWidget(QLabel("Vector de Estado Inicial π₀:"))
@@ -90,11 +104,6 @@ class CadenasMarkov(QWidget):
 
     def generar_tablas(self):
         n = self.spin_dim.value()
-        self.tabla_P.setRowCount(n)
-        self.tabla_P.setColumnCount(n)
-        self.tabla_pi.setRowCount(1)
-        self.tabla_pi.setColumnCount(n)
-
         ejemplo_P = [
             [0.5, 0.3, 0.2],
             [0.1, 0.6, 0.3],
@@ -102,46 +111,34 @@ class CadenasMarkov(QWidget):
         ]
         ejemplo_pi0 = [1, 0, 0]
 
-        for i in range(n):
-            for j in range(n):
-                valor = str(ejemplo_P[i][j]) if i < 3 and j < 3 else "0.0"
-                self.tabla_P.setItem(i, j, QTableWidgetItem(valor))
-            valor_pi = str(ejemplo_pi0[i]) if i < 3 else "0.0"
-            self.tabla_pi.setItem(0, i, QTableWidgetItem(valor_pi))
+        # El ejemplo ocupa la esquina superior izquierda; el resto de las celdas queda en 0
+        P = np.zeros((n, n))
+        pi = np.zeros((1, n))
+        k = min(n, 3)
+        P[:k, :k] = np.array(ejemplo_P)[:k, :k]
+        pi[0, :k] = ejemplo_pi0[:k]
+        self.tabla_P.establecer_matriz(P)
+        self.tabla_pi.establecer_matriz(pi)
 
         self.resultado.clear()
 
+    # El editor solo acepta números, así que la tabla siempre se puede leer
     def leer_tabla(self, tabla):
-        filas = tabla.rowCount()
-        cols = tabla.columnCount()
-        matriz = np.zeros((filas, cols))
-        for i in range(filas):
-            for j in range(cols):
-                item = tabla.item(i, j)
-                if item is not None:
-                    try:
-                        matriz[i, j] = float(item.text())
-                    except ValueError:
-                        return None
-        return matriz
+        return tabla.matriz()
 
     def calcular_markov(self):
         P = self.leer_tabla(self.tabla_P)
         pi = self.leer_tabla(self.tabla_pi)
 
-        if P is None or pi is None:
-            self.resultado.setText("❌ Error en los datos.")
-            return
-
         if not np.allclose(P.sum(axis=1), 1):
             self.resultado.setText("❌ Cada fila de la matriz debe sumar 1.")
             return
 
         pasos = self.spin_pasos.value()
+        distribuciones = evolucionar_markov(pi, P, pasos)
         texto = f"π₀ = {pi.tolist()}\n"
         for n in range(1, pasos + 1):
-            pi = pi @ P
-            texto += f"\nπ{n} = {np.round(pi, 4).tolist()}"
+            texto += f"\nπ{n} = {np.round(distribuciones[n], 4).tolist()}"
         self.resultado.setText(texto)
 
     def limpiar(self):
@@ -8,17 +8,64 @@ import numpy as np
 import matplotlib.pyplot as plt
 # Se importa una herramienta que permite mostrar gráficos de matplotlib dentro de la ventana
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-# Se importa sympy, que sirve para trabajar con fórmulas matemáticas de forma simbólica
-from sympy import *
+# Se importa sympy, que sirve para trabajar con fórmulas matemáticas de forma simbólica.
+# Se carga de forma diferida (la primera vez que se calcula) para que la ventana abra rápido
+from utils.importaciones import importar_diferido
+sp = importar_diferido("sympy")
 # Se importan dos herramientas adicionales para mostrar mensajes y trabajar con tablas
 from PyQt5.QtWidgets import QTableWidgetItem, QMessageBox
 
 # Se importa una clase que representa el menú principal de la aplicación
 from Modulos.menu_general.menu_general import MenuGeneral
+# Caché compartida de expresiones (texto -> expresión de sympy y su función numérica)
+from utils import expresiones
 # Se importa una barra de herramientas para interactuar con los gráficos (como hacer zoom o mover)
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
 
+# Métodos numéricos disponibles para aproximar la solución de y' = f(x, y)
+METODOS_EDO = ["Euler", "Heun", "Runge-Kutta 4", "Taylor"]
+
+
+# Resuelve y' = f(x, y) con y(x0) = y0 desde x0 hasta xf con paso h, usando cada uno de los métodos
+# indicados. Devuelve los valores de x y un diccionario método -> lista de valores de y
+def resolver_edo(f_str, x0, y0, xf, h, metodos=METODOS_EDO):
+    x_sym, y_sym = sp.symbols('x y')
+    entrada = expresiones.obtener(f_str)
+    f_expr = entrada.expresion
+    f = entrada.funcion((x_sym, y_sym), modulos=None)
+
+    x_vals = np.arange(x0, xf + h, h)
+    x_vals = np.round(x_vals, 10)
+
+    resultados = {}
+    for metodo in metodos:
+        if metodo == "Taylor":
+            # Las derivadas parciales se calculan una sola vez, no en cada paso
+            df_dx = sp.lambdify((x_sym, y_sym), sp.diff(f_expr, x_sym))
+            df_dy = sp.lambdify((x_sym, y_sym), sp.diff(f_expr, y_sym))
+        y = y0
+        ys = [y0]
+        for x in x_vals[:-1]:
+            if metodo == "Euler":
+                y = y + h * f(x, y)
+            elif metodo == "Heun":
+                k1 = f(x, y)
+                k2 = f(x + h, y + h * k1)
+                y = y + h * (k1 + k2) / 2
+            elif metodo == "Runge-Kutta 4":
+                k1 = f(x, y)
+                k2 = f(x + h / 2, y + h * k1 / 2)
+                k3 = f(x + h / 2, y + h * k2 / 2)
+                k4 = f(x + h, y + h * k3)
+                y = y + (h / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+            elif metodo == "Taylor":
+                y = y + h * f(x, y) + (h**2 / 2) * (df_dx(x, y) + df_dy(x, y) * f(x, y))
+            ys.append(y)
+        resultados[metodo] = ys
+    return x_vals, resultados
+
+
 # Se crea una clase llamada EDO que representa la ventana para resolver ecuaciones diferenciales ordinarias
 class EDO(QWidget):
     def __init__(self):
@@ -161,9 +208,8 @@ class EDO(QWidget):
             return
 
         try:
-            # Se toma la ecuación escrita y se prepara para que la computadora pueda entenderla
-            f_str = self.ecuacion_input.toPlainText().replace("^", "**").replace("sen", "sin").lower()
-            f = lambdify(('x', 'y'), sympify(f_str))
+            # Se toma la ecuación escrita (la interpreta el analizador compartido: ^, sen, 2x...)
+            f_str = self.ecuacion_input.toPlainText()
 
             # Se obtienen los valores numéricos ingresados por el usuario
             x0 = self.validar_entrada(self.parametros["x0:"].text(), "x0")
@@ -174,37 +220,10 @@ class EDO(QWidget):
             metodo_seleccionado = self.metodo_combo.currentText()
 
             # Si el usuario quiere ver todos los métodos, se calculan todos
-            metodos = ["Euler", "Heun", "Runge-Kutta 4", "Taylor"] if metodo_seleccionado == "Ver todas" else [metodo_seleccionado]
-
-            resultados = {}
-            x_vals = np.arange(x0, xf + h, h)
-            x_vals = np.round(x_vals, 10)
+            metodos = METODOS_EDO if metodo_seleccionado == "Ver todas" else [metodo_seleccionado]
 
             # Se aplica el método seleccionado para calcular los valores de y
-            for metodo in metodos:
-                y = y0
-                ys = [y0]
-                for x in x_vals[:-1]:
-                    if metodo == "Euler":
-                        y = y + h * f(x, y)
-                    elif metodo == "Heun":
-                        k1 = f(x, y)
-                        k2 = f(x + h, y + h * k1)
-                        y = y + h * (k1 + k2) / 2
-                    elif metodo == "Runge-Kutta 4":
-                        k1 = f(x, y)
-                        k2 = f(x + h / 2, y + h * k1 / 2)
-                        k3 = f(x + h / 2, y + h * k2 / 2)
-                        k4 = f(x + h, y + h * k3)
-                        y = y + (h / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
-                    elif metodo == "Taylor":
-                        x_sym, y_sym = symbols('x y')
-                        f_expr = sympify(f_str)
-                        df_dx = lambdify((x_sym, y_sym), diff(f_expr, x_sym))
-                        df_dy = lambdify((x_sym, y_sym), diff(f_expr, y_sym))
-                        y = y + h * f(x, y) + (h**2 / 2) * (df_dx(x, y) + df_dy(x, y) * f(x, y))
-                    ys.append(y)
-                resultados[metodo] = ys
+            x_vals, resultados = resolver_edo(f_str, x0, y0, xf, h, metodos)
 
             # Se muestran los resultados en una tabla
             self.tabla.setRowCount(len(x_vals))
@@ -1,7 +1,7 @@
 # Importamos todos los componentes visuales necesarios de PyQt5 para construir la interfaz
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-    QTextEdit, QGridLayout, QScrollArea, QFrame, QSizePolicy, QLineEdit, QMessageBox
+    QTextEdit, QGridLayout, QScrollArea, QFrame, QSizePolicy, QLineEdit, QMessageBox, QSpinBox
 )
 
 # Importamos una clase de PyQt5 para manejar alineación y comportamiento
@@ -9,12 +9,26 @@ from PyQt5.QtCore import Qt
 
 # Importamos sympy, una biblioteca para cálculo simbólico (matemáticas)
 import sympy as sp
-
-# Importamos el módulo de expresiones regulares para modificar texto
 import re
+import time
 
 # Importamos otro componente de la aplicación
 from Modulos.menu_general.menu_general import MenuGeneral
+# Ejecutor de tareas en segundo plano y su barra de progreso
+from utils.tareas import obtener_ejecutor, BarraTarea
+# Analizador de expresiones compartido (sen, ln, 3x, e^x...) con caché: el mismo texto no se vuelve a interpretar
+from utils import expresiones
+# Integración por etapas con tiempo límite y respaldo numérico
+from Modulos.calculo_simbolico import integracion
+# Niveles de simplificación (ninguna, rápida, completa) con memoria por petición
+from Modulos.calculo_simbolico import simplificacion
+# Integración por partes: elección de u con la regla LIATE y partes repetidas
+from Modulos.calculo_simbolico import partes
+# Derivadas de orden superior, gradiente, jacobiano y hessiano
+from Modulos.calculo_simbolico import derivadas
+# Series de Taylor por tandas y límites con tiempo límite
+from Modulos.calculo_simbolico import series
+from Modulos.calculo_simbolico import limites
 
 # Creamos una clase llamada CalculoSimbolico que representa la pantalla principal del cálculo simbólico
 class CalculoSimbolico(QWidget):
@@ -35,7 +49,7 @@ class CalculoSimbolico(QWidget):
 
         # Caja para que el usuario escriba una función matemática
         self.input = QTextEdit()
-        self.input.setPlaceholderText("Escribe una función como (3x^3)*sin(x)")
+        self.input.setPlaceholderText("Escribe una función como (3x^3)*sin(x) (para el jacobiano, varias separadas por comas)")
         self.input.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 10px;")
         self.input.setFixedHeight(100)
         layout.addWidget(self.input)
@@ -45,7 +59,9 @@ class CalculoSimbolico(QWidget):
 
         # Desplegable para elegir la operación matemática (derivar, integrar, etc.)
         self.opciones = QComboBox()
-        self.opciones.addItems(["Derivar", "Integrar Indefinida", "Integrar Definida", "Integrar por Partes"])
+        self.opciones.addItems(["Derivar", "Gradiente", "Jacobiano", "Hessiano",
+                                "Integrar Indefinida", "Integrar Definida", "Integrar por Partes",
+                                "Serie de Taylor", "Límite"])
         self.opciones.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px; padding: 4px;")
         self.opciones.currentIndexChanged.connect(self.toggle_limites)  # Si cambia la opción, mostramos u ocultamos límites
         params_layout.addWidget(QLabel("Operación:"), 0, 0)
@@ -53,7 +69,7 @@ class CalculoSimbolico(QWidget):
 
         # Caja para que el usuario escriba la variable de la operación (como x, y, z)
         self.variable_box = QTextEdit()
-        self.variable_box.setPlaceholderText("Respecto a (ej. x)")
+        self.variable_box.setPlaceholderText("Respecto a (ej. x, x^2 o x, y)")
         self.variable_box.setFixedHeight(40)
         self.variable_box.setFixedWidth(120)
         self.variable_box.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px;")
@@ -77,6 +93,62 @@ class CalculoSimbolico(QWidget):
         params_layout.addWidget(QLabel("Límite superior:"), 3, 0)
         params_layout.addWidget(self.limite_sup, 3, 1)
 
+        # Tiempo máximo para integrar, desarrollar una serie o calcular un límite: al agotarse, una
+        # integral definida o un límite se aproximan numéricamente y una serie se corta donde llegó
+        self.tiempo_limite = QSpinBox()
+        self.tiempo_limite.setRange(2, 600)
+        self.tiempo_limite.setValue(integracion.TIEMPO_LIMITE)
+        self.tiempo_limite.setSuffix(" s")
+        self.tiempo_limite.setFixedWidth(120)
+        self.tiempo_limite.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px;")
+        params_layout.addWidget(QLabel("Tiempo límite:"), 4, 0)
+        params_layout.addWidget(self.tiempo_limite, 4, 1)
+
+        # Nivel de simplificación del resultado: la completa es la más legible y la más lenta
+        self.nivel_simplificacion = QComboBox()
+        self.nivel_simplificacion.addItems(simplificacion.NIVELES)
+        self.nivel_simplificacion.setCurrentText("Completa")
+        self.nivel_simplificacion.setFixedWidth(120)
+        self.nivel_simplificacion.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px; padding: 4px;")
+        params_layout.addWidget(QLabel("Simplificación:"), 5, 0)
+        params_layout.addWidget(self.nivel_simplificacion, 5, 1)
+
+        # Punto donde evaluar derivadas y matrices (opcional), con la función compilada del resultado
+        self.punto = QLineEdit()
+        self.punto.setPlaceholderText("ej. x=1, y=2")
+        self.punto.setFixedWidth(120)
+        self.punto.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px;")
+        params_layout.addWidget(QLabel("Evaluar en:"), 6, 0)
+        params_layout.addWidget(self.punto, 6, 1)
+
+        # Punto alrededor del que se desarrolla la serie o al que tiende la variable en el límite
+        self.centro = QLineEdit()
+        self.centro.setPlaceholderText("ej. 0, pi, oo")
+        self.centro.setFixedWidth(120)
+        self.centro.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px;")
+        self.etiqueta_centro = QLabel("Alrededor de:")
+        params_layout.addWidget(self.etiqueta_centro, 7, 0)
+        params_layout.addWidget(self.centro, 7, 1)
+
+        # Orden de la serie: se muestran los términos hasta O(x^orden)
+        self.orden = QSpinBox()
+        self.orden.setRange(1, 200)
+        self.orden.setValue(6)
+        self.orden.setFixedWidth(120)
+        self.orden.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px;")
+        self.etiqueta_orden = QLabel("Orden:")
+        params_layout.addWidget(self.etiqueta_orden, 8, 0)
+        params_layout.addWidget(self.orden, 8, 1)
+
+        # Lado por el que se acerca la variable en el límite
+        self.direccion = QComboBox()
+        self.direccion.addItems(list(limites.DIRECCIONES))
+        self.direccion.setFixedWidth(160)
+        self.direccion.setStyleSheet("background-color: #1e1e1e; border: 1px solid #00d2ff; border-radius: 6px; padding: 4px;")
+        self.etiqueta_direccion = QLabel("Dirección:")
+        params_layout.addWidget(self.etiqueta_direccion, 9, 0)
+        params_layout.addWidget(self.direccion, 9, 1)
+
         layout.addLayout(params_layout)  # Añadimos todos los parámetros al diseño principal
 
         # Sección de botones (Calcular, Limpiar, Volver)
@@ -102,6 +174,10 @@ class CalculoSimbolico(QWidget):
 
         layout.addLayout(button_layout)
 
+        # Barra de progreso con botón para cancelar el cálculo en curso
+        self.barra_tarea = BarraTarea()
+        layout.addWidget(self.barra_tarea)
+
         # Etiqueta para mostrar el resultado del cálculo
         self.resultado = QLabel("Resultado:")
         self.resultado.setWordWrap(True)
@@ -117,6 +193,14 @@ class CalculoSimbolico(QWidget):
         es_definida = self.opciones.currentText() == "Integrar Definida"
         self.limite_inf.setVisible(es_definida)
         self.limite_sup.setVisible(es_definida)
+        self.punto.setVisible(self.opciones.currentText() in derivadas.OPERACIONES)
+        operacion = self.opciones.currentText()
+        for widget, operaciones in [
+            (self.centro, ("Serie de Taylor", "Límite")), (self.etiqueta_centro, ("Serie de Taylor", "Límite")),
+            (self.orden, ("Serie de Taylor",)), (self.etiqueta_orden, ("Serie de Taylor",)),
+            (self.direccion, ("Límite",)), (self.etiqueta_direccion, ("Límite",)),
+        ]:
+            widget.setVisible(operacion in operaciones)
 
     # Borra todo el contenido ingresado y restaura la interfaz
     def limpiar_campos(self):
@@ -124,12 +208,15 @@ class CalculoSimbolico(QWidget):
         self.variable_box.clear()
         self.limite_inf.clear()
         self.limite_sup.clear()
+        self.punto.clear()
+        self.centro.clear()
         self.resultado.setText("Resultado:")
         self.opciones.setCurrentIndex(0)
         self.toggle_limites()
 
     # Vuelve al menú general
     def volver(self):
+        self.barra_tarea.cancelar()
         self.menu = MenuGeneral()
         self.menu.show()
         self.close()
@@ -188,120 +275,242 @@ class CalculoSimbolico(QWidget):
             cursor.insertText(valor)
         return insertar
 
-    # Prepara el texto ingresado para que sympy pueda entenderlo
-    def preprocesar(self, texto):
-        texto = texto.replace("^", "**")  # Cambia ^ por ** (notación de potencia)
-        texto = texto.replace("sen", "sin")  # Traduce sen a sin
-        texto = texto.replace("ln", "log")  # Traduce sen a sin
-        texto = texto.lower()
-
-        funciones = ['sin', 'cos', 'tan', 'exp', 'log', 'sqrt']
-
-        for f in funciones:
-            texto = re.sub(rf'\b{f}\(', f'__{f}__(' , texto)
-
-        # Añade * donde falte (por ejemplo entre número y letra: 3x => 3*x)
-        texto = re.sub(r'(\d)([a-z\(])', r'\1*\2', texto)
-        texto = re.sub(r'([a-z])(\d)', r'\1*\2', texto)
-        texto = re.sub(r'([a-z])\(', r'\1*(', texto)
-
-        for f in funciones:
-            texto = texto.replace(f'__{f}__', f)
-
-        return texto
-
-    # Aplica la técnica de integración por partes
-    def integracion_por_partes(self, expr, variable):
-        expr = sp.simplify(expr)
-        factors = expr.as_ordered_factors()
-        if len(factors) >= 2:
-            for u in factors:
-                dv = expr / u
-                if dv.has(variable):
-                    try:
-                        dv = sp.simplify(dv)
-                        v = sp.integrate(dv, variable)
-                        v = sp.simplify(v)
-                        du = sp.diff(u, variable)
-                        du = sp.simplify(du)
-                        result = u * v - sp.integrate(v * du, variable)
-                        result = sp.simplify(sp.expand(sp.nsimplify(result)))
-                        pasos = [
-                            f"Elegimos u = {presentar_polinomio(u)}, dv = {presentar_polinomio(dv)} dx",
-                            f"Entonces, du = {presentar_polinomio(du)} dx, v = {presentar_polinomio(v)}",
-                            f"Aplicamos: ∫u dv = uv - ∫v du = {presentar_polinomio(u * v)} - ∫{presentar_polinomio(v * du)} dx",
-                            f"Resultado: {presentar_polinomio(result)}"
-                        ]
-                        return result, pasos
-                    except Exception:
-                        continue
-        result = sp.integrate(expr, variable)
-        result = sp.simplify(sp.expand(sp.nsimplify(result)))
-        return result, ["La expresión no permitió una integración por partes clara, se integró directamente."]
-
     # Función principal que realiza el cálculo según la operación seleccionada
     def calcular(self):
         entrada = self.input.toPlainText().strip().lower()
         variable_str = self.variable_box.toPlainText().strip().lower()
         operacion = self.opciones.currentText()
 
-        if not entrada or not variable_str.isalpha():
-            QMessageBox.warning(self, "Entrada inválida", "Debes ingresar una expresión y una variable válida (ej. x, y, z).")
+        # Las derivadas admiten varias variables con orden (x^2, y); gradiente, jacobiano y hessiano
+        # pueden dejarla vacía (se usan todas las de la expresión)
+        if operacion in derivadas.OPERACIONES:
+            valida = bool(variable_str) or operacion != "Derivar"
+        else:
+            # Una letra, con subíndice opcional (x, y, x1): "xy" sería el producto x·y en la expresión
+            valida = re.fullmatch(r"[a-z]\d*", variable_str) is not None
+        if not entrada or not valida:
+            QMessageBox.warning(self, "Entrada inválida", "Debes ingresar una expresión y una variable válida (ej. x, y, x1).")
             return
 
-        try:
-            entrada_proc = self.preprocesar(entrada)
-            variable = sp.Symbol(variable_str)
-            expresion = sp.sympify(entrada_proc)
-
-            if operacion == "Derivar":
-                resultado = sp.diff(expresion, variable)
-                resultado_str = presentar_polinomio(resultado)
-                self.resultado.setText(f"Derivada:\n{resultado_str}")
-
-            elif operacion == "Integrar Indefinida":
-                resultado = sp.integrate(expresion, variable)
-                resultado = sp.simplify(sp.expand(sp.nsimplify(resultado)))
-                resultado_str = presentar_polinomio(resultado) + " + C"
-                self.resultado.setText(f"Integral indefinida:\n{resultado_str}")
-
-            elif operacion == "Integrar Definida":
-                lim_inf = self.limite_inf.text().strip()
-                lim_sup = self.limite_sup.text().strip()
-                if not lim_inf or not lim_sup:
-                    QMessageBox.warning(self, "Límites inválidos", "Debes ingresar límites inferior y superior.")
-                    return
-                try:
-                    lim_inf_val = sp.sympify(lim_inf)
-                    lim_sup_val = sp.sympify(lim_sup)
-                    resultado = sp.integrate(expresion, (variable, lim_inf_val, lim_sup_val))
-                    resultado = sp.simplify(sp.expand(sp.nsimplify(resultado)))
-                    resultado_str = presentar_polinomio(resultado)
-                    self.resultado.setText(f"Integral definida de {lim_inf} a {lim_sup}:\n{resultado_str}")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"No se pudo evaluar los límites: {str(e)}")
-                    return
-
-            elif operacion == "Integrar por Partes":
-                resultado, pasos = self.integracion_por_partes(expresion, variable)
-                resultado = sp.simplify(sp.expand(sp.nsimplify(resultado)))
-                resultado_str = presentar_polinomio(resultado) + " + C"
-                pasos_str = "\n".join(pasos)
-                self.resultado.setText(f"Integral por partes:\nPasos:\n{pasos_str}\n\nResultado:\n{resultado_str}")
+        lim_inf = self.limite_inf.text().strip()
+        lim_sup = self.limite_sup.text().strip()
+        if operacion == "Integrar Definida" and (not lim_inf or not lim_sup):
+            QMessageBox.warning(self, "Límites inválidos", "Debes ingresar límites inferior y superior.")
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"No se pudo calcular. Asegúrate de que la expresión esté bien escrita.\n\n{str(e)}")
+        # El cálculo simbólico corre en un proceso aparte: la ventana sigue respondiendo
+        # y el botón "Cancelar" puede detener una integral que no termina
+        self.boton_calcular.setEnabled(False)
+        self.resultado.setText("Calculando...")
+        tarea = obtener_ejecutor().ejecutar(
+            resolver_operacion, operacion, entrada, variable_str, lim_inf, lim_sup,
+            self.tiempo_limite.value(), self.nivel_simplificacion.currentText(), self.punto.text().strip(),
+            centro=self.centro.text().strip(), orden=self.orden.value(), direccion=self.direccion.currentText(),
+            en_proceso=True,
+            # Las series muestran sus términos a medida que se calculan
+            al_parcial=self.resultado.setText,
+            al_resultado=self.resultado.setText,
+            al_error=self.mostrar_error,
+            al_cancelar=lambda: self.resultado.setText("Resultado:\nCálculo cancelado."),
+            al_terminar=lambda: self.boton_calcular.setEnabled(True),
+        )
+        self.barra_tarea.seguir(tarea)
+
+    def mostrar_error(self, mensaje):
+        self.resultado.setText("Resultado:")
+        QMessageBox.critical(self, "Error", f"No se pudo calcular. Asegúrate de que la expresión esté bien escrita.\n\n{mensaje}")
+
+
+# Aplica la técnica de integración por partes: partes.integrar_por_partes elige u (regla LIATE,
+# candidatos en paralelo) y aquí se redactan los pasos. Si ningún candidato sirve, se integra directamente
+def integracion_por_partes(expr, variable, simplificar=None, tiempo_limite=integracion.TIEMPO_LIMITE, control=None):
+    simplificar = simplificar or simplificacion.Simplificador()
+    inicio = time.monotonic()
+    expr = simplificar(expr)
+    informe = partes.integrar_por_partes(expr, variable, tiempo_limite, control)
+    if informe is None:
+        restante = tiempo_limite - (time.monotonic() - inicio)
+        result = simplificar(integracion.integrar(expr, variable, tiempo_limite=restante)["resultado"])
+        return result, ["La expresión no permitió una integración por partes clara, se integró directamente."]
 
-# Esta función mejora la forma de mostrar la expresión matemática
-def presentar_polinomio(expr):
-    expr = sp.simplify(sp.expand(sp.nsimplify(expr)))
-    result = str(expr).replace("**", "^").replace("*", "")
+    # Los pasos intermedios se presentan con la simplificación rápida; solo el resultado usa la pedida
+    paso = lambda e: presentar_polinomio(e, simplificar, "Rápida")
+    u, dv, filas = informe["u"], informe["dv"], informe["filas"]
+    result = simplificar(informe["resultado"])
+    pasos = [f"Elegimos u = {paso(u)}, dv = {paso(dv)} dx (regla LIATE)"]
+    if informe["cierre"] == "directa":
+        v = filas[0][2]
+        du = sp.diff(u, variable)
+        pasos += [
+            f"Entonces, du = {paso(du)} dx, v = {paso(v)}",
+            f"Aplicamos: ∫u dv = uv - ∫v du = {paso(u * v)} - ∫{paso(v * du)} dx",
+        ]
+    else:
+        metodo = "método tabular" if informe["cierre"] == "tabular" else "hasta que reaparece la integral"
+        pasos.append(f"Aplicamos partes repetidas ({metodo}): signo · derivada de u · integral de dv")
+        pasos += [f"  {'+' if signo > 0 else '-'}  {paso(d)}  ·  {paso(v)}" for signo, d, v in filas]
+        if informe["cierre"] == "ciclo":
+            terminos = sum(signo * d * v for signo, d, v in filas)
+            pasos.append(f"La integral I reaparece: I = {paso(terminos)} + ({paso(informe['ciclo'])})·I, y se despeja I")
+    pasos.append(f"Resultado: {presentar_polinomio(result, simplificar)}")
+    return result, pasos
+
+
+# Derivadas (de cualquier orden, parciales mixtas), gradiente, jacobiano y hessiano.
+# Si se indica un punto ("x=1, y=2"), el resultado se evalúa con su función compilada de NumPy
+def resolver_derivada(operacion, entrada_proc, variable_str, punto, simplificar):
+    funciones = derivadas.interpretar_funciones(entrada_proc)
+    if not funciones:
+        raise ValueError("La expresión está vacía.")
+    if len(funciones) > 1 and operacion != "Jacobiano":
+        raise ValueError("Varias funciones separadas por comas solo se admiten en el jacobiano.")
+
+    if operacion == "Derivar":
+        especificacion = derivadas.interpretar_variables(variable_str)
+        if not especificacion:
+            raise ValueError("Indica la variable respecto a la que se deriva (ej. x, x^2 o x, y).")
+        resultado = derivadas.derivar(funciones[0], especificacion)
+        orden = sum(k for _, k in especificacion)
+        titulo = "Derivada" if orden == 1 else f"Derivada de orden {orden} respecto a {variable_str}"
+        texto = f"{titulo}:\n{presentar_polinomio(resultado, simplificar)}"
+        variables = sorted(resultado.free_symbols, key=lambda v: v.name)
+    else:
+        variables = derivadas.variables_de(variable_str, funciones)
+        if operacion == "Gradiente":
+            resultado = derivadas.gradiente(funciones[0], variables)
+        elif operacion == "Jacobiano":
+            resultado = derivadas.jacobiano(funciones, variables)
+        else:
+            resultado = derivadas.hessiano(funciones[0], variables)
+        nombres = ", ".join(v.name for v in variables)
+        texto = f"{operacion} respecto a ({nombres}):\n{presentar_matriz(resultado, simplificar)}"
+
+    if punto:
+        valores = derivadas.interpretar_punto(punto, variables)
+        valor = derivadas.evaluador(resultado, variables)(*valores)
+        texto += f"\n\nValor en ({punto}):\n{derivadas.formatear_valor(valor)}"
+    return derivadas.recortar(texto)
+
+
+# Serie de Taylor hasta O((x - a)^orden). Cada tanda de términos se envía como resultado parcial,
+# así los primeros se ven mientras se calculan los siguientes; los términos se escriben en orden
+# creciente de potencia (sympy ordenaría la suma a su manera)
+def resolver_serie(expresion, variable, centro, valor_centro, orden, tiempo_limite, simplificar, control=None):
+    titulo = f"Serie de Taylor alrededor de {variable} = {centro}:"
+    texto = ""
+    alcanzado = 0
+    for terminos, alcanzado in series.tandas(expresion, variable, valor_centro, orden, tiempo_limite, control):
+        for exponente, coeficiente in terminos:
+            termino = series.termino(simplificar(coeficiente, "Rápida"), exponente, variable, valor_centro)
+            termino_str = presentar_polinomio(termino, simplificar, "Ninguna")
+            if not texto:
+                texto = termino_str
+            elif termino_str.startswith("-"):
+                texto += " - " + termino_str[1:]
+            else:
+                texto += " + " + termino_str
+        if control is not None and alcanzado < orden:
+            control.parcial(derivadas.recortar(f"{titulo}\n{texto or '0'} + ...\n\nCalculando más términos..."))
+    resto = presentar_polinomio(series.termino(sp.Integer(1), alcanzado, variable, valor_centro), simplificar, "Ninguna")
+    resultado = f"{titulo}\n{texto or '0'} + O({resto})"
+    if alcanzado < orden:
+        resultado += f"\n\nTiempo agotado: la serie llega hasta el orden {alcanzado} de {orden}."
+    return derivadas.recortar(resultado)
+
+
+# Realiza la operación simbólica y devuelve el texto que se muestra como resultado.
+# No usa la interfaz, por lo que puede ejecutarse en un proceso aparte.
+# Las integrales pasan por integracion.integrar: etapas con tiempo límite y, en las definidas,
+# respaldo numérico si no hay resultado simbólico a tiempo
+def resolver_operacion(operacion, entrada_proc, variable_str, lim_inf="", lim_sup="",
+                       tiempo_limite=integracion.TIEMPO_LIMITE, nivel_simplificacion="Completa", punto="",
+                       centro="", orden=6, direccion="Ambos lados", control=None):
+    # Un solo simplificador por petición: cada expresión se simplifica como mucho una vez
+    simplificar = simplificacion.Simplificador(nivel_simplificacion)
+    if operacion in derivadas.OPERACIONES:
+        return resolver_derivada(operacion, entrada_proc, variable_str, punto, simplificar)
+
+    variable = sp.Symbol(variable_str)
+    expresion = expresiones.interpretar(entrada_proc)
+
+    if operacion in ("Serie de Taylor", "Límite"):
+        centro = centro or "0"
+        valor_centro = expresiones.interpretar(centro)
+        if valor_centro.free_symbols:
+            raise ValueError("El punto debe ser un número (ej. 0, pi, oo).")
+        if operacion == "Serie de Taylor":
+            return resolver_serie(expresion, variable, centro, valor_centro, orden, tiempo_limite, simplificar, control)
+        informe = limites.limite(expresion, variable, valor_centro, limites.DIRECCIONES[direccion], tiempo_limite, control)
+        if informe["numerico"]:
+            valor = informe["resultado"]
+            valor = valor.real if abs(valor.imag) <= 1e-12 * max(1.0, abs(valor)) else valor
+            resultado_str = f"≈ {valor:.12g}  (puede no ser fiable si el límite no existe)"
+        else:
+            resultado_str = presentar_polinomio(informe["resultado"], simplificar)
+        lado = {"Ambos lados": "", "Por la derecha": "⁺", "Por la izquierda": "⁻"}[direccion]
+        return f"Límite cuando {variable_str} → {centro}{lado}:\n{resultado_str}\n\nMétodo: {informe['metodo']}"
+
+    if operacion == "Integrar Indefinida":
+        informe = integracion.integrar(expresion, variable, tiempo_limite=tiempo_limite, control=control)
+        resultado_str = presentar_polinomio(informe["resultado"], simplificar) + " + C"
+        return f"Integral indefinida:\n{resultado_str}\n\nMétodo: {informe['metodo']}"
+
+    elif operacion == "Integrar Definida":
+        try:
+            lim_inf_val = expresiones.interpretar(lim_inf)
+            lim_sup_val = expresiones.interpretar(lim_sup)
+        except Exception as e:
+            raise ValueError(f"No se pudo evaluar los límites: {str(e)}")
+        informe = integracion.integrar(expresion, variable, (lim_inf_val, lim_sup_val), tiempo_limite, control)
+        if informe["numerico"]:
+            resultado_str = f"≈ {informe['resultado']:.12g}  (error estimado {informe['error']:.1e})"
+            if informe["advertencia"]:
+                resultado_str += f"\nAdvertencia: {informe['advertencia']}"
+        else:
+            resultado_str = presentar_polinomio(informe["resultado"], simplificar)
+        return f"Integral definida de {lim_inf} a {lim_sup}:\n{resultado_str}\n\nMétodo: {informe['metodo']}"
+
+    elif operacion == "Integrar por Partes":
+        resultado, pasos = integracion_por_partes(expresion, variable, simplificar, tiempo_limite, control)
+        resultado_str = presentar_polinomio(resultado, simplificar) + " + C"
+        pasos_str = "\n".join(pasos)
+        return f"Integral por partes:\nPasos:\n{pasos_str}\n\nResultado:\n{resultado_str}"
+
+    raise ValueError(f"Operación no soportada: {operacion}")
+
+
+# Matriz con las subexpresiones comunes escritas una sola vez (s0, s1...) y una fila por línea
+def presentar_matriz(matriz, simplificar):
+    reemplazos, reducida = derivadas.compactar(matriz, simplificar)
+    formato = lambda e: presentar_polinomio(e, simplificar, "Ninguna")
+    lineas = []
+    if reemplazos:
+        lineas.append("Subexpresiones comunes:")
+        lineas += [f"  {s} = {formato(e)}" for s, e in reemplazos]
+        lineas.append("Resultado:")
+    lineas += ["[" + ", ".join(formato(e) for e in fila) + "]" for fila in reducida.tolist()]
+    return "\n".join(lineas)
+
+
+# Texto de sympy con ^ y sin los signos de producto, salvo donde juntar los factores confundiría:
+# tras una variable con subíndice (x1·x2, no x1x2) y entre dos números (2·3^x, no 23^x)
+def _sin_productos(texto):
+    texto = re.sub(r"(\b[a-zA-Z]+\d+)\*(?=\w)", r"\1·", texto.replace("**", "^"))
+    texto = re.sub(r"(?<=\d)\*(?=\d)", "·", texto)
+    return texto.replace("*", "")
+
+
+# Esta función mejora la forma de mostrar la expresión matemática.
+# Usa el simplificador de la petición (las expresiones ya simplificadas no se vuelven a procesar)
+def presentar_polinomio(expr, simplificar=None, nivel=None):
+    simplificar = simplificar or simplificacion.Simplificador()
+    expr = simplificar(expr, nivel)
+    result = _sin_productos(str(expr))
     result = result.replace("log(e)", "1")
     if "Piecewise" in result:
         try:
-            expr = expr.subs(sp.Symbol('e'), sp.E)
-            expr = sp.simplify(expr)
-            result = str(expr).replace("**", "^").replace("*", "").replace("log(e)", "1")
+            expr = simplificar(expr.subs(sp.Symbol('e'), sp.E), nivel)
+            result = _sin_productos(str(expr)).replace("log(e)", "1")
         except:
-            result = str(expr).replace("**", "^").replace("*", "")
+            result = _sin_productos(str(expr))
     return result
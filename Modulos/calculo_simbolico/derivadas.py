@@ -0,0 +1,141 @@
+# Derivadas de orden superior, parciales mixtas y de varias variables.
+# - "Respecto a" admite una lista de variables con orden: "x^3" es la tercera derivada y "x^2, y"
+#   la parcial mixta ∂³/∂x²∂y (se deriva en ese orden).
+# - Gradiente, jacobiano (varias funciones separadas por comas) y hessiano; si no se indican
+#   variables se usan todas las de la expresión, en orden alfabético.
+# - El hessiano es simétrico: solo se calcula el triángulo superior y cada entrada se obtiene del
+#   gradiente ya calculado, no de la función original.
+# - Las matrices se presentan con eliminación de subexpresiones comunes (sp.cse): cada parte
+#   repetida se escribe una sola vez, así un hessiano grande no multiplica el tamaño del texto.
+# - El resultado se compila a una función de NumPy (también con cse) para evaluarlo en un punto.
+import re
+
+from utils import expresiones
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+np = importar_diferido("numpy")
+
+OPERACIONES = ["Derivar", "Gradiente", "Jacobiano", "Hessiano"]
+
+# Caracteres máximos del texto de un resultado; lo demás se recorta para que la ventana no se trabe
+MAXIMO_CARACTERES = 20000
+
+_VARIABLE = re.compile(r"([a-zA-Z]\d*)(?:\^(\d+))?")
+
+
+# Parte el texto en las comas que no están dentro de paréntesis: "log(x, 2), y" -> ["log(x, 2)", "y"]
+def separar(texto):
+    partes, profundidad, actual = [], 0, ""
+    for caracter in texto:
+        if caracter == "," and profundidad == 0:
+            partes.append(actual)
+            actual = ""
+            continue
+        profundidad += {"(": 1, ")": -1}.get(caracter, 0)
+        actual += caracter
+    partes.append(actual)
+    return [p.strip() for p in partes if p.strip()]
+
+
+# "x^2, y" -> [(x, 2), (y, 1)]. Las variables van separadas por comas o espacios
+def interpretar_variables(texto):
+    texto = re.sub(r"\s*\^\s*", "^", texto.strip())
+    especificacion = []
+    for parte in re.split(r"[,\s]+", texto):
+        if not parte:
+            continue
+        coincidencia = _VARIABLE.fullmatch(parte)
+        if coincidencia is None:
+            raise ValueError(f"Variable no válida: '{parte}'. Usa una letra, con subíndice y orden opcionales (ej. x^2, y, x1).")
+        orden = int(coincidencia.group(2) or 1)
+        if orden < 1:
+            raise ValueError("El orden de una derivada debe ser al menos 1.")
+        especificacion.append((sp.Symbol(coincidencia.group(1)), orden))
+    return especificacion
+
+
+# Variables de la especificación (sin orden); si no hay, las de las funciones en orden alfabético
+def variables_de(texto, funciones):
+    especificacion = interpretar_variables(texto)
+    if any(orden != 1 for _, orden in especificacion):
+        raise ValueError("El gradiente, el jacobiano y el hessiano no llevan orden en las variables.")
+    variables = list(dict.fromkeys(v for v, _ in especificacion))
+    if not variables:
+        libres = set().union(*(f.free_symbols for f in funciones))
+        variables = sorted(libres, key=lambda s: s.name)
+    if not variables:
+        raise ValueError("La expresión no depende de ninguna variable.")
+    return variables
+
+
+def interpretar_funciones(texto):
+    return [expresiones.interpretar(parte) for parte in separar(texto)]
+
+
+def derivar(expr, especificacion):
+    return sp.diff(expr, *especificacion)
+
+
+def gradiente(expr, variables):
+    return sp.Matrix([sp.diff(expr, v) for v in variables])
+
+
+def jacobiano(funciones, variables):
+    return sp.Matrix(funciones).jacobian(variables)
+
+
+# Hessiano simétrico: n(n+1)/2 derivadas (sp.hessian hace n²), cada una a partir del gradiente
+def hessiano(expr, variables):
+    n = len(variables)
+    primeras = [sp.diff(expr, v) for v in variables]
+    matriz = sp.zeros(n, n)
+    for i in range(n):
+        for j in range(i, n):
+            matriz[i, j] = matriz[j, i] = sp.diff(primeras[i], variables[j])
+    return matriz
+
+
+# Simplifica cada entrada (las repetidas, como las simétricas, una sola vez gracias a la memoria
+# del simplificador) y extrae las subexpresiones comunes de toda la matriz.
+# Devuelve (lista de (símbolo, subexpresión), matriz reducida)
+def compactar(matriz, simplificar):
+    simplificada = matriz.applyfunc(simplificar)
+    ocupados = {s.name for s in simplificada.free_symbols}
+    nombres = (s for s in sp.numbered_symbols("s") if s.name not in ocupados)
+    reemplazos, (reducida,) = sp.cse(simplificada, symbols=nombres)
+    return reemplazos, reducida
+
+
+# Función de NumPy que evalúa el resultado (expresión o matriz) con los argumentos en el orden de
+# "variables"; las subexpresiones comunes se calculan una sola vez por llamada
+def evaluador(resultado, variables):
+    return sp.lambdify(variables, resultado, "numpy", cse=True)
+
+
+# "x=1, y=pi/2" -> valores en el orden de "variables"
+def interpretar_punto(texto, variables):
+    valores = {}
+    for parte in separar(texto):
+        if "=" not in parte:
+            raise ValueError(f"Punto no válido: '{parte}'. Escribe cada valor como variable=valor (ej. x=1).")
+        nombre, valor = (t.strip() for t in parte.split("=", 1))
+        valores[nombre.lower()] = float(expresiones.interpretar(valor))
+    faltan = [v.name for v in variables if v.name not in valores]
+    if faltan:
+        raise ValueError(f"Falta el valor de {', '.join(faltan)} en el punto.")
+    return [valores[v.name] for v in variables]
+
+
+# Texto de un valor numérico (escalar o matriz) evaluado
+def formatear_valor(valor):
+    arreglo = np.atleast_2d(np.asarray(valor, dtype=float))
+    if arreglo.size == 1:
+        return f"{arreglo.item():.10g}"
+    return "\n".join("[" + ", ".join(f"{v:.10g}" for v in fila) + "]" for fila in arreglo)
+
+
+def recortar(texto):
+    if len(texto) <= MAXIMO_CARACTERES:
+        return texto
+    return texto[:MAXIMO_CARACTERES] + f"\n… (resultado recortado: {len(texto)} caracteres)"
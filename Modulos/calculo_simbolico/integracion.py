@@ -0,0 +1,202 @@
+# Integración por etapas con tiempo límite.
+# sp.integrate puede tardar minutos (o no terminar) con integrandos difíciles, así que se intenta
+# primero lo barato y cada etapa tiene su parte del tiempo total:
+#   1. Tabla: las reglas directas de sympy (polinomios, fracciones racionales, potencias, término a
+#      término) sin los algoritmos generales; resuelve o descarta en pocos milisegundos.
+#   2. Risch, solo si el integrando es elemental con exp y log (es completo para esos casos y además
+#      demuestra cuándo no hay primitiva elemental).
+#   3. Meijer G, solo en integrales definidas con algún límite infinito (donde más sirve).
+#   4. El algoritmo completo de sympy (heurísticas, reglas manuales...), con el tiempo que quede.
+# manualintegrate no es una etapa aparte: medido, es más lento que el algoritmo completo, que ya lo
+# usa como último recurso.
+# Si ninguna etapa simbólica termina a tiempo, una integral definida se aproxima con cuadratura
+# adaptativa de Gauss-Kronrod (scipy.integrate.quad, QUADPACK QAGS/QAGI).
+# La función se ejecuta en un proceso aparte (utils.tareas): una etapa que se pasa del tiempo se
+# interrumpe y, si no se puede interrumpir, queda abandonada hasta que el proceso termina.
+import signal
+import threading
+import time
+import warnings
+
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+
+# Tiempo total (en segundos) para toda la integración y su simplificación
+TIEMPO_LIMITE = 20
+
+# Parte del tiempo total de cada etapa; la última etapa simbólica usa todo lo que quede
+FRACCION_TABLA = 0.15
+FRACCION_RISCH = 0.15
+FRACCION_MEIJERG = 0.2
+
+# Tiempo total para las simplificaciones completas de una petición (ver simplificacion.py); si se
+# agota, se sigue con la simplificación rápida
+TIEMPO_SIMPLIFICAR = 5
+
+
+# Se hereda de BaseException para que ningún "except Exception" de sympy la oculte
+class TiempoAgotado(BaseException):
+    pass
+
+
+def _interrumpir(senal, marco):
+    raise TiempoAgotado()
+
+
+# Ejecuta funcion(*args) con un límite de tiempo. En el hilo principal (como en el proceso de
+# cálculo en Linux y macOS) se interrumpe con una alarma; en otro caso (Windows o un hilo) se
+# ejecuta en un hilo auxiliar y, si se pasa del tiempo, se abandona
+def con_limite(segundos, funcion, *args, **kwargs):
+    if segundos <= 0:
+        raise TiempoAgotado()
+    if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+        anterior = signal.signal(signal.SIGALRM, _interrumpir)
+        signal.setitimer(signal.ITIMER_REAL, segundos)
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, anterior)
+
+    resultado = {}
+
+    def trabajar():
+        try:
+            resultado["valor"] = funcion(*args, **kwargs)
+        except BaseException as e:
+            resultado["error"] = e
+
+    hilo = threading.Thread(target=trabajar, daemon=True)
+    hilo.start()
+    hilo.join(segundos)
+    if hilo.is_alive():
+        raise TiempoAgotado()
+    if "error" in resultado:
+        raise resultado["error"]
+    return resultado["valor"]
+
+
+# ¿Risch tiene sentido? Solo para integrandos construidos con +, ·, potencias, exp y log
+def _apto_risch(expr):
+    permitidas = (sp.Add, sp.Mul, sp.Pow, sp.exp, sp.log, sp.Symbol, sp.Number, sp.NumberSymbol)
+    return all(isinstance(nodo, permitidas) for nodo in sp.preorder_traversal(expr))
+
+
+def _resuelta(resultado):
+    return resultado is not None and not resultado.has(sp.Integral, sp.nan, sp.zoo)
+
+
+# Evalúa la primitiva de Risch entre los límites si el integrando es continuo en todo el intervalo
+# (con discontinuidades se deja el caso a las etapas siguientes); usa límites para ±∞
+def _regla_de_barrow(expr, primitiva, variable, a, b):
+    from sympy.calculus.util import continuous_domain
+
+    desde, hasta = (a, b) if (b - a).is_nonnegative else (b, a)
+    intervalo = sp.Interval(desde, hasta)
+    if not intervalo.is_subset(continuous_domain(expr, variable, intervalo)):
+        return None
+    valores = []
+    for limite in (b, a):
+        valor = primitiva.subs(variable, limite) if limite.is_finite else sp.nan
+        if valor.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+            valor = sp.limit(primitiva, variable, limite, "-" if limite is b else "+")
+        valores.append(valor)
+    return valores[0] - valores[1]
+
+
+# Etapas (nombre, fracción del tiempo, función). Cada función devuelve el resultado o None
+def _etapas(expr, variable, limites):
+    reglas = dict(risch=False, heurisch=False, manual=False, meijerg=False)
+    risch = lambda: sp.integrate(expr, variable, risch=True)
+    if limites is None:
+        return [
+            ("Tabla de integrales", FRACCION_TABLA, lambda: sp.integrate(expr, variable, **reglas)),
+            ("Risch", FRACCION_RISCH, risch if _apto_risch(expr) else None),
+            ("Algoritmo completo de sympy", None, lambda: sp.integrate(expr, variable)),
+        ]
+    a, b = limites
+
+    def definida(primitiva):
+        resultado = primitiva()
+        return _regla_de_barrow(expr, resultado, variable, a, b) if _resuelta(resultado) else None
+
+    return [
+        ("Tabla de integrales", FRACCION_TABLA, lambda: sp.integrate(expr, (variable, a, b), **reglas)),
+        ("Risch", FRACCION_RISCH, (lambda: definida(risch)) if _apto_risch(expr) else None),
+        ("Meijer G", FRACCION_MEIJERG,
+         (lambda: sp.integrate(expr, (variable, a, b), meijerg=True)) if not (a.is_finite and b.is_finite) else None),
+        ("Algoritmo completo de sympy", None, lambda: sp.integrate(expr, (variable, a, b))),
+    ]
+
+
+# Cuadratura adaptativa de Gauss-Kronrod (QUADPACK); admite límites infinitos. Devuelve el valor,
+# el error estimado y la advertencia de QUADPACK si la hubo (por ejemplo, si parece divergente)
+def cuadratura(expr, variable, a, b):
+    from scipy import integrate
+
+    otras = expr.free_symbols - {variable}
+    if otras:
+        nombres = ", ".join(sorted(str(s) for s in otras))
+        raise ValueError(f"No se puede aproximar numéricamente: la expresión depende de {nombres}.")
+    f = sp.lambdify(variable, expr, ["math", "mpmath", "sympy"])
+
+    def evaluar(t):
+        try:
+            return float(f(t))
+        except (ZeroDivisionError, OverflowError, TypeError, ValueError):
+            raise ValueError(f"El integrando no está definido en {variable} = {t:g}; la integral puede ser divergente.")
+
+    with warnings.catch_warnings(record=True) as avisos:
+        warnings.simplefilter("always", integrate.IntegrationWarning)
+        valor, error = integrate.quad(evaluar, float(a), float(b), limit=200)
+    advertencia = str(avisos[0].message).split("\n")[0] if avisos else None
+    return valor, error, advertencia
+
+
+# Integra expr respecto a variable (limites = (a, b) para una integral definida) sin pasarse de
+# tiempo_limite segundos. Devuelve un diccionario con el resultado, el método que lo obtuvo, si es
+# una aproximación numérica (con su error estimado) y el registro de las etapas intentadas
+def integrar(expr, variable, limites=None, tiempo_limite=TIEMPO_LIMITE, control=None):
+    inicio = time.monotonic()
+    registro = []
+    etapas = [e for e in _etapas(expr, variable, limites) if e[2] is not None]
+    # Se reserva tiempo para simplificar el resultado al presentarlo
+    total = max(tiempo_limite - min(TIEMPO_SIMPLIFICAR, tiempo_limite / 4), 0.1)
+    for indice, (nombre, fraccion, etapa) in enumerate(etapas):
+        restante = total - (time.monotonic() - inicio)
+        presupuesto = restante if fraccion is None else min(fraccion * total, restante)
+        comienzo = time.monotonic()
+        try:
+            resultado = con_limite(presupuesto, etapa)
+            estado = "resuelta" if _resuelta(resultado) else "sin resultado"
+        except TiempoAgotado:
+            resultado, estado = None, "tiempo agotado"
+        except Exception:
+            # Una etapa que no sabe tratar el integrando (NotImplementedError, PolynomialError...)
+            # simplemente cede el turno a la siguiente
+            resultado, estado = None, "no aplicable"
+        registro.append((nombre, estado, time.monotonic() - comienzo))
+        if control is not None:
+            control.progreso(100 * (indice + 1) // (len(etapas) + 1))
+        if estado == "resuelta":
+            return {"resultado": resultado, "metodo": nombre, "numerico": False, "etapas": registro}
+
+    if limites is None:
+        if any(estado == "tiempo agotado" for _, estado, _ in registro):
+            raise ValueError(
+                f"No se encontró una primitiva en {tiempo_limite:g} s. Prueba con un tiempo límite mayor "
+                "o calcula una integral definida (se aproxima numéricamente)."
+            )
+        raise ValueError("No se encontró una primitiva elemental para esta expresión.")
+    comienzo = time.monotonic()
+    valor, error, advertencia = cuadratura(expr, variable, *limites)
+    registro.append(("Cuadratura de Gauss-Kronrod", "aproximada", time.monotonic() - comienzo))
+    return {
+        "resultado": valor,
+        "error": error,
+        "advertencia": advertencia,
+        "metodo": "Cuadratura adaptativa de Gauss-Kronrod",
+        "numerico": True,
+        "etapas": registro,
+    }
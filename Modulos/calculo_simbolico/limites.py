@@ -0,0 +1,110 @@
+# Límites con tiempo límite, por etapas como la integración:
+#   1. Sustitución directa, si cada subexpresión da un valor finito en el punto (funciones
+#      elementales definidas allí son continuas): no hace falta ningún algoritmo de límites.
+#   2. sp.limit (algoritmo de Gruntz), con el tiempo que quede salvo la parte de la estimación.
+#   3. Si no termina a tiempo, una estimación numérica con extrapolación de Richardson
+#      (mpmath.limit), comparando ambos lados si se pidió el límite bilateral, con el resto del tiempo.
+import re
+import time
+
+from Modulos.calculo_simbolico import integracion
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+
+# Dirección del límite -> argumento "dir" de sp.limit
+DIRECCIONES = {"Ambos lados": "+-", "Por la derecha": "+", "Por la izquierda": "-"}
+
+# Diferencia relativa máxima entre los límites laterales numéricos para darlos por iguales
+TOLERANCIA_LATERALES = 1e-6
+
+# Parte del tiempo límite reservada para la estimación numérica si Gruntz no termina
+FRACCION_ESTIMACION = 0.25
+
+# Funciones con saltos en puntos donde están definidas: su valor no es el límite
+_DISCONTINUAS = ("floor", "ceiling", "frac", "sign", "Heaviside", "Piecewise")
+
+
+# Valor de la expresión en el punto si es continua allí, o None. No basta con el valor final: sympy
+# simplifica por el camino 1/zoo a 0 y 0**0 a 1, así que x^(1/(1 + ln x)) en 0 daría 1 (el límite es e).
+# Por eso cada subexpresión tiene que ser finita en el punto y ninguna potencia puede ser 0^0
+def _sustitucion(expr, variable, punto):
+    if not punto.is_finite:
+        return None
+    for nodo in sp.preorder_traversal(expr):
+        if nodo.func.__name__ in _DISCONTINUAS:
+            return None
+        if not nodo.has(variable):
+            continue
+        valor = nodo.subs(variable, punto)
+        if valor.has(sp.nan, sp.zoo, sp.oo, -sp.oo) or valor.has(variable):
+            return None
+        if isinstance(nodo, sp.Pow) and nodo.base.subs(variable, punto) == 0 and nodo.exp.subs(variable, punto) == 0:
+            return None
+    return expr.subs(variable, punto)
+
+
+def _estimacion(expr, variable, punto, direccion):
+    import mpmath
+
+    otras = expr.free_symbols - {variable}
+    if otras:
+        nombres = ", ".join(sorted(str(s) for s in otras))
+        raise ValueError(f"No se puede estimar numéricamente: la expresión depende de {nombres}.")
+    f = sp.lambdify(variable, expr, "mpmath")
+    a = mpmath.inf if punto == sp.oo else -mpmath.inf if punto == -sp.oo else mpmath.mpf(float(punto))
+    if not mpmath.isinf(a) and direccion == "+-":
+        derecha = mpmath.limit(f, a, direction=1)
+        izquierda = mpmath.limit(f, a, direction=-1)
+        if abs(derecha - izquierda) > TOLERANCIA_LATERALES * max(1, abs(derecha)):
+            raise ValueError(
+                f"Los límites laterales estimados no coinciden (≈ {float(izquierda):.10g} por la izquierda, "
+                f"≈ {float(derecha):.10g} por la derecha)."
+            )
+        return complex(derecha)
+    return complex(mpmath.limit(f, a, direction=-1 if direccion == "-" else 1))
+
+
+# Límite de expr cuando variable tiende a punto. Devuelve un diccionario con el resultado, el método
+# y si es una estimación numérica
+def limite(expr, variable, punto, direccion="+-", tiempo_limite=integracion.TIEMPO_LIMITE, control=None):
+    inicio = time.monotonic()
+    valor = _sustitucion(expr, variable, punto)
+    if valor is not None:
+        return {"resultado": valor, "metodo": "Sustitución directa", "numerico": False}
+    if control is not None:
+        control.progreso(10)
+
+    # El límite bilateral en el infinito es el límite en ese sentido
+    dir_sympy = "-" if punto == sp.oo else "+" if punto == -sp.oo else direccion
+    tiempo_gruntz = (1 - FRACCION_ESTIMACION) * tiempo_limite
+    gruntz = lambda lado: integracion.con_limite(tiempo_gruntz - (time.monotonic() - inicio),
+                                                 sp.limit, expr, variable, punto, lado)
+    try:
+        resultado = gruntz(dir_sympy)
+        # Infinito complejo en un límite bilateral: los laterales son infinitos de distinto signo
+        if resultado == sp.zoo and dir_sympy == "+-":
+            izquierda, derecha = gruntz("-"), gruntz("+")
+            raise ValueError(f"El límite no existe: por la izquierda es {izquierda} y por la derecha {derecha}.")
+    except integracion.TiempoAgotado:
+        resultado = None
+    except ValueError as e:
+        # sympy avisa así cuando los límites laterales no coinciden
+        laterales = re.search(r"left hand limit = (.*) and right hand limit = (.*)", str(e))
+        if laterales:
+            raise ValueError(f"El límite no existe: por la izquierda es {laterales.group(1)} "
+                             f"y por la derecha {laterales.group(2)}.")
+        raise
+    if isinstance(resultado, sp.AccumBounds):
+        raise ValueError(f"El límite no existe: la función oscila entre {resultado.min} y {resultado.max}.")
+    if resultado is not None and not resultado.has(sp.Limit, sp.nan):
+        return {"resultado": resultado, "metodo": "Algoritmo de Gruntz (sympy)", "numerico": False}
+
+    if control is not None:
+        control.progreso(60)
+    try:
+        valor = integracion.con_limite(tiempo_limite - (time.monotonic() - inicio),
+                                       _estimacion, expr, variable, punto, direccion)
+    except integracion.TiempoAgotado:
+        raise ValueError(f"No se obtuvo el límite en {tiempo_limite:g} s.")
+    return {"resultado": valor, "metodo": "Estimación numérica (extrapolación de Richardson)", "numerico": True}
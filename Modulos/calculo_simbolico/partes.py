@@ -0,0 +1,240 @@
+# Integración por partes con búsqueda de la elección de u.
+# - Los candidatos a u son los factores que dependen de la variable, ordenados con la regla LIATE
+#   (logarítmicas, inversas trigonométricas, algebraicas, trigonométricas, exponenciales): el
+#   primero suele ser el bueno, y antes se probaban en el orden en que sympy lista los factores.
+# - Cada candidato aplica partes repetidas:
+#     · u polinómica: método tabular, se deriva u hasta llegar a 0 y se integra dv otras tantas veces
+#       (x^3·e^x·sen(x) sale en cuatro filas, sin integrar nunca un producto con x);
+#     · u trigonométrica o exponencial: si tras uno o dos pasos reaparece la integral original
+#       (e^x·cos(x)), se despeja;
+#     · en otro caso, un paso y la integral que queda con integracion.integrar.
+# - Con varios núcleos, los candidatos se prueban a la vez en procesos aparte; cuando uno termina
+#   se espera un momento a los de mejor rango y los demás se detienen. Si se cancela la tarea (el
+#   proceso que los lanzó recibe SIGTERM o muere), los candidatos se detienen también.
+# Todas las integrales pasan por integracion.integrar, con el tiempo que le quede al candidato.
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+
+from Modulos.calculo_simbolico import integracion
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+
+# Procesos simultáneos para probar candidatos; con uno solo se prueban en orden en este proceso
+MAXIMO_PROCESOS = os.cpu_count() or 1
+
+# Parte del tiempo límite para los candidatos; el resto queda para integrar directamente si ninguno sirve
+FRACCION_CANDIDATOS = 0.6
+
+# Segundos que se espera a los candidatos de mejor rango después del primer éxito
+ESPERA_PREFERIDOS = 0.3
+
+# Segundos entre comprobaciones de que el proceso que lanzó un candidato sigue vivo
+INTERVALO_VIGILANCIA = 0.5
+
+# Pasos máximos del método tabular (grado máximo de u)
+MAXIMO_PASOS = 12
+
+_INVERSAS = ("asin", "acos", "atan", "acot", "asec", "acsc")
+_TRIGONOMETRICAS = ("sin", "cos", "tan", "cot", "sec", "csc")
+
+
+# Rango LIATE de un factor (menor = mejor candidato a u)
+def rango_liate(factor, variable):
+    if isinstance(factor, sp.Pow):
+        if factor.exp.has(variable):
+            return 4
+        return rango_liate(factor.base, variable)
+    nombre = factor.func.__name__
+    if nombre == "log":
+        return 0
+    if nombre in _INVERSAS:
+        return 1
+    if factor.is_polynomial(variable):
+        return 2
+    if nombre in _TRIGONOMETRICAS:
+        return 3
+    if nombre == "exp":
+        return 4
+    return 5
+
+
+# Factores candidatos a u, en orden LIATE (a igual rango, el orden de sympy)
+def candidatos(expr, variable):
+    factores = [f for f in expr.as_ordered_factors() if f.has(variable)]
+    if len(factores) < 2:
+        return []
+    return sorted(dict.fromkeys(factores), key=lambda f: rango_liate(f, variable))
+
+
+def _integral(expr, variable, limite):
+    return integracion.integrar(expr, variable, tiempo_limite=limite - time.monotonic())["resultado"]
+
+
+# ¿El integrando que queda es c·(integrando original)? Devuelve c o None
+def _ciclo(resto, expr, variable):
+    cociente = sp.cancel(sp.powsimp(resto / expr))
+    if cociente.has(variable) or cociente == 1:
+        return None
+    return cociente
+
+
+# Integración por partes con u = factor. Devuelve un diccionario con u, dv, las filas
+# (signo, derivada de u, integral de dv) y cómo se cerró: "tabular", "ciclo" (con el coeficiente)
+# o "directa" (con el integrando que quedó)
+def por_partes(expr, variable, u, tiempo):
+    limite = time.monotonic() + tiempo
+    dv = expr / u
+    polinomica = u.is_polynomial(variable)
+    pasos = min(sp.degree(u, variable) + 1, MAXIMO_PASOS) if polinomica else 2
+    informe = {"u": u, "dv": dv, "filas": [], "ciclo": None, "resto": None}
+
+    terminos = sp.Integer(0)
+    derivada, integral, signo = u, dv, 1
+    primer_resto = None
+    for paso in range(pasos):
+        integral = _integral(integral, variable, limite)
+        informe["filas"].append((signo, derivada, integral))
+        terminos += signo * derivada * integral
+        derivada = sp.diff(derivada, variable)
+        signo = -signo
+        resto = signo * derivada * integral
+        if resto == 0:
+            informe.update(cierre="tabular", resultado=terminos)
+            return informe
+        if not polinomica:
+            ciclo = _ciclo(resto, expr, variable)
+            if ciclo is not None:
+                informe.update(cierre="ciclo", ciclo=ciclo, resultado=terminos / (1 - ciclo))
+                return informe
+            # Solo las trigonométricas y exponenciales pueden repetirse en un ciclo
+            if paso == 0:
+                primer_resto = (terminos, resto)
+                if rango_liate(u, variable) < 3:
+                    break
+
+    if polinomica:
+        raise ValueError("El grado de u supera los pasos del método tabular.")
+    # Sin ciclo: un paso y la integral que queda, directamente
+    terminos, resto = primer_resto
+    informe["filas"] = informe["filas"][:1]
+    informe.update(cierre="directa", resto=resto, resultado=terminos + _integral(resto, variable, limite))
+    return informe
+
+
+# Termina el candidato si muere el proceso que lo lanzó (por ejemplo, al matar la tarea con SIGKILL,
+# o en Windows, donde terminate no deja limpiar)
+def _vigilar_padre():
+    padre = multiprocessing.parent_process()
+    while padre is not None and padre.is_alive():
+        time.sleep(INTERVALO_VIGILANCIA)
+    os._exit(1)
+
+
+# Prueba un candidato en un proceso aparte y envía (índice, informe o None) por la cola
+def _trabajar(indice, expr, variable, u, tiempo, cola):
+    threading.Thread(target=_vigilar_padre, daemon=True).start()
+    try:
+        informe = por_partes(expr, variable, u, tiempo)
+    except (Exception, integracion.TiempoAgotado):
+        informe = None
+    cola.put((indice, informe))
+
+
+# Elige el informe del mejor candidato terminado: el de menor rango si ya no falta ninguno mejor
+# o si pasó la espera desde el primer éxito
+def _elegir(informes, terminados, primer_exito):
+    exitos = sorted(i for i in terminados if informes.get(i) is not None)
+    if not exitos:
+        return None
+    mejor = exitos[0]
+    if all(i in terminados for i in range(mejor)) or time.monotonic() - primer_exito >= ESPERA_PREFERIDOS:
+        return informes[mejor]
+    return None
+
+
+def _en_paralelo(expr, variable, lista, tiempo, control):
+    cola = multiprocessing.Queue()
+    pendientes = list(enumerate(lista))
+    activos = {}
+    informes = {}
+    terminados = set()
+    primer_exito = None
+    limite = time.monotonic() + tiempo
+
+    # Cancelar la tarea envía SIGTERM a este proceso, que muere sin ejecutar el finally: antes de
+    # morir se terminan los candidatos activos
+    def al_terminar(numero, marco):
+        for proceso in activos.values():
+            proceso.terminate()
+        signal.signal(signal.SIGTERM, anterior)
+        os.kill(os.getpid(), numero)
+
+    principal = threading.current_thread() is threading.main_thread()
+    if principal:
+        anterior = signal.signal(signal.SIGTERM, al_terminar)
+    try:
+        while len(terminados) < len(lista) and time.monotonic() < limite:
+            while pendientes and len(activos) < MAXIMO_PROCESOS:
+                indice, u = pendientes.pop(0)
+                proceso = multiprocessing.Process(
+                    target=_trabajar, args=(indice, expr, variable, u, limite - time.monotonic(), cola), daemon=True
+                )
+                proceso.start()
+                activos[indice] = proceso
+            if control is not None:
+                control.verificar()
+            try:
+                indice, informe = cola.get(timeout=0.05)
+            except queue.Empty:
+                pass
+            else:
+                terminados.add(indice)
+                informes[indice] = informe
+                activos.pop(indice).join()
+                if informe is not None and primer_exito is None:
+                    primer_exito = time.monotonic()
+                if control is not None:
+                    control.progreso(80 * len(terminados) // len(lista))
+            elegido = _elegir(informes, terminados, primer_exito)
+            if elegido is not None:
+                return elegido
+        # Se agotó el tiempo esperando a los preferidos: vale el mejor éxito que haya
+        return informes[min(informes, key=lambda i: (informes[i] is None, i))] if informes else None
+    finally:
+        if principal:
+            signal.signal(signal.SIGTERM, anterior)
+        # Los candidatos que siguen calculando ya no hacen falta
+        for proceso in activos.values():
+            proceso.terminate()
+        for proceso in activos.values():
+            proceso.join(1)
+        cola.close()
+
+
+# Prueba los candidatos en orden LIATE y devuelve el informe del elegido (None si no hay candidatos
+# o ninguno sirvió). Sin procesos en paralelo, cada candidato tiene una parte igual del tiempo que queda
+def integrar_por_partes(expr, variable, tiempo_limite=integracion.TIEMPO_LIMITE, control=None):
+    lista = candidatos(expr, variable)
+    tiempo = tiempo_limite * FRACCION_CANDIDATOS
+    if not lista:
+        return None
+    if MAXIMO_PROCESOS > 1 and len(lista) > 1:
+        return _en_paralelo(expr, variable, lista, tiempo, control)
+
+    limite = time.monotonic() + tiempo
+    for indice, u in enumerate(lista):
+        if control is not None:
+            control.verificar()
+        try:
+            return por_partes(expr, variable, u, (limite - time.monotonic()) / (len(lista) - indice))
+        except (Exception, integracion.TiempoAgotado):
+            continue
+        finally:
+            if control is not None:
+                control.progreso(80 * (indice + 1) // len(lista))
+    return None
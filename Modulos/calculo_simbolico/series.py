@@ -0,0 +1,109 @@
+# Series de Taylor (Maclaurin en 0, Laurent o Puiseux cuando hace falta) generadas por partes.
+# - Primero se prueba la aritmética de series truncadas de sympy (ring_series): compone exp, sin,
+#   log, tan... sobre polinomios con coeficientes racionales y da 50 términos de e^sen(x) en
+#   milisegundos, cuando sp.series tarda decenas de segundos con 16.
+# - Si no sirve (cocientes, raíces, coeficientes simbólicos), se usa sp.series por tandas de orden
+#   creciente (2, 4, 8, ...): cada tanda entrega los términos nuevos en cuanto se calculan, así los
+#   primeros aparecen enseguida aunque se pidan muchos. Duplicar el orden cuesta poco más que una
+#   sola expansión completa; sympy ofrece lseries (término a término), pero recalcula la serie en
+#   cada término y resultó varias veces más lento.
+# Todo con tiempo límite: al agotarse se devuelven los términos obtenidos hasta entonces.
+import time
+
+from Modulos.calculo_simbolico import integracion
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+
+# Parte del tiempo límite para la aritmética de series truncadas antes de pasar a sp.series
+FRACCION_ANILLO = 0.2
+
+# Orden de la primera tanda de sp.series
+PRIMERA_TANDA = 2
+
+
+# Expresión en la variable local t de la expansión: x = a + t, o x = ±1/t en el infinito
+def _local(expr, variable, punto):
+    t = sp.Dummy("t", positive=punto in (sp.oo, -sp.oo))
+    if punto == sp.oo:
+        return expr.subs(variable, 1 / t), t
+    if punto == -sp.oo:
+        return expr.subs(variable, -1 / t), t
+    return expr.subs(variable, punto + t), t
+
+
+# Términos (exponente, coeficiente) de una suma en potencias de t, ordenados por exponente
+def _terminos(suma, t):
+    coeficientes = {}
+    for termino in sp.Add.make_args(sp.expand(suma)):
+        coeficiente, exponente = termino.as_coeff_exponent(t)
+        if coeficiente.has(t):
+            return None
+        coeficientes[exponente] = coeficientes.get(exponente, 0) + coeficiente
+    return sorted((e, c) for e, c in coeficientes.items() if c != 0)
+
+
+def _anillo(expr, t, orden):
+    from sympy.polys.ring_series import rs_series
+
+    # Devuelve un polinomio del anillo de series, o la expresión sin cambios si no sabe desarrollarla
+    resultado = rs_series(expr, t, orden)
+    if not isinstance(resultado, sp.Basic):
+        resultado = resultado.as_expr()
+    if not resultado.is_polynomial(t):
+        return None
+    return _terminos(resultado, t)
+
+
+# Genera tandas de términos: cada elemento es (lista de (exponente, coeficiente) en la variable
+# local (ver "termino"), orden alcanzado); la serie queda completa hasta O(t^orden alcanzado).
+# Se detiene sin error si se agota el tiempo después de alguna tanda; si no obtiene ninguna, lanza ValueError
+def tandas(expr, variable, punto, orden, tiempo_limite=integracion.TIEMPO_LIMITE, control=None):
+    inicio = time.monotonic()
+    local, t = _local(expr, variable, punto)
+
+    try:
+        terminos = integracion.con_limite(FRACCION_ANILLO * tiempo_limite, _anillo, local, t, orden)
+    except (Exception, integracion.TiempoAgotado):
+        terminos = None
+    if terminos is not None:
+        yield terminos, orden
+        return
+
+    anterior = -sp.oo
+    n = min(PRIMERA_TANDA, orden)
+    entregadas = 0
+    while True:
+        if control is not None:
+            control.verificar()
+        restante = tiempo_limite - (time.monotonic() - inicio)
+        try:
+            serie = integracion.con_limite(restante, sp.series, local, t, 0, n, "+").removeO()
+        except integracion.TiempoAgotado:
+            if entregadas:
+                return
+            raise ValueError(f"No se obtuvo ningún término de la serie en {tiempo_limite:g} s.")
+        terminos = _terminos(serie, t)
+        if terminos is None:
+            raise ValueError("La expresión no tiene un desarrollo en serie de potencias en ese punto.")
+        nuevos = [(e, c) for e, c in terminos if e >= anterior]
+        entregadas += 1
+        yield nuevos, n
+        if control is not None:
+            control.progreso(100 * n // orden)
+        if n >= orden:
+            return
+        anterior = n
+        n = min(2 * n, orden)
+
+
+# Término c·t^k en la variable original, listo para mostrar. Si el punto no es 0, (x - a) es un
+# símbolo con ese nombre, así sympy no reparte el coeficiente (2·(x - 1) quedaría 2x - 2)
+def termino(coeficiente, exponente, variable, punto):
+    if punto == 0:
+        return coeficiente * variable ** exponente
+    if punto == sp.oo:
+        return coeficiente * variable ** -exponente
+    if punto == -sp.oo:
+        return coeficiente * (-variable) ** -exponente
+    return coeficiente * sp.Symbol(f"({variable - punto})") ** exponente
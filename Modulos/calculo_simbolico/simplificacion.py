@@ -0,0 +1,63 @@
+# Política de simplificación del cálculo simbólico.
+# sp.simplify es lo más caro al presentar un resultado, y antes se repetía sobre expresiones ya
+# simplificadas (el cálculo simplificaba, la presentación volvía a simplificar y la integración por
+# partes simplificaba cada paso cinco veces). Aquí cada petición usa un Simplificador con:
+# - un nivel: "Ninguna" (tal cual), "Rápida" (expandir y sacar factores comunes, lineal en el tamaño
+#   de la expresión) o "Completa" (sp.simplify, como antes);
+# - memoria de las formas ya simplificadas: cada expresión se simplifica como mucho una vez por
+#   petición, y un resultado simplificado se reconoce como tal y no se vuelve a procesar;
+# - un tiempo total para las simplificaciones completas: si se agota, se sigue con la rápida.
+import time
+
+from Modulos.calculo_simbolico import integracion
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+
+NIVELES = ["Ninguna", "Rápida", "Completa"]
+
+
+# Simplificación rápida: los decimales pasan a fracciones (como hacía nsimplify), se expande y se
+# sacan los factores comunes sin buscar identidades trigonométricas ni otras reescrituras
+def _rapida(expr):
+    if expr.has(sp.Float):
+        expr = sp.nsimplify(expr)
+    return sp.factor_terms(sp.expand(expr))
+
+
+def _completa(expr):
+    return sp.simplify(sp.expand(sp.nsimplify(expr)))
+
+
+class Simplificador:
+    def __init__(self, nivel="Completa", tiempo_total=integracion.TIEMPO_SIMPLIFICAR):
+        if nivel not in NIVELES:
+            raise ValueError(f"Nivel de simplificación desconocido: {nivel}")
+        self.nivel = nivel
+        self._limite = time.monotonic() + tiempo_total
+        self._memoria = {}
+
+    # Simplifica con el nivel de la petición (o uno menor, por ejemplo "Rápida" para pasos intermedios)
+    def __call__(self, expr, nivel=None):
+        nivel = self.nivel if nivel is None else min(nivel, self.nivel, key=NIVELES.index)
+        if nivel == "Ninguna" or not isinstance(expr, sp.Basic):
+            return expr
+        clave = (expr, nivel)
+        if clave in self._memoria:
+            return self._memoria[clave]
+
+        resultado = None
+        if nivel == "Completa":
+            try:
+                resultado = integracion.con_limite(self._limite - time.monotonic(), _completa, expr)
+            except integracion.TiempoAgotado:
+                # Sin tiempo para más simplificaciones completas en esta petición
+                self.nivel = "Rápida"
+                nivel = "Rápida"
+        if resultado is None:
+            resultado = _rapida(expr)
+
+        # La forma simplificada también queda registrada, así no se vuelve a simplificar
+        self._memoria[clave] = resultado
+        self._memoria[(resultado, nivel)] = resultado
+        return resultado
@@ -6,10 +6,97 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtCore import Qt
 from utils.helpers import resource_path
 from Modulos.menu_general.menu_general import MenuGeneral
+from utils.tareas import obtener_ejecutor, BarraTarea
+from utils import expresiones
+from Modulos.calculo_simbolico import integracion
 import math
 import sympy as sp
 
 
+# Puntos de cada grupo (dentro y fuera) que se dibujan; la simulación puede tener un millón
+MAXIMO_PUNTOS_GRAFICA = 3000
+
+
+# Texto de la integral exacta: con 6 decimales si es un número finito; si no (oo, complejo...), tal cual
+def formatear_integral(integral):
+    try:
+        valor = float(integral)
+    except (TypeError, ValueError):
+        return str(integral)
+    return f"{valor:.6f}" if math.isfinite(valor) else str(integral)
+
+
+# Realiza la simulación de Monte Carlo y la integral exacta sin tocar la interfaz,
+# para poder ejecutarla en un proceso aparte
+def simular_montecarlo(fx1_str, fx2_str, a, b, n, control=None):
+    x = sp.Symbol("x")
+
+    # Las funciones se interpretan con el analizador compartido (sen, e^x, 2x...) y se evalúan
+    # con NumPy; np.broadcast_to hace que una constante dé un valor por cada punto
+    def evaluar(texto, puntos):
+        return np.broadcast_to(expresiones.funcion_numpy(texto, x)(puntos), puntos.shape).astype(float)
+
+    x_vals = np.random.uniform(a, b, n)
+    xs = np.linspace(a, b, 300)
+
+    # Condicional según funciones ingresadas
+    if fx1_str and fx2_str:
+        # Ambas funciones
+        fx1 = evaluar(fx1_str, x_vals)
+        fx2 = evaluar(fx2_str, x_vals)
+        y_vals = np.random.uniform(min(fx1.min(), fx2.min()), max(fx1.max(), fx2.max()), n)
+
+        y_min = np.minimum(fx1, fx2)
+        y_max = np.maximum(fx1, fx2)
+
+        puntos_dentro_mask = (y_vals >= y_min) & (y_vals <= y_max)
+        area_estim = (b - a) * (y_max.max() - y_min.min()) * (np.sum(puntos_dentro_mask) / n)
+        aproximacion = np.mean(fx1 - fx2) * (b - a)
+
+        ys1 = evaluar(fx1_str, xs)
+        ys2 = evaluar(fx2_str, xs)
+        expresion = lambda: expresiones.interpretar(fx1_str) - expresiones.interpretar(fx2_str)
+    else:
+        # Solo una de las dos funciones
+        f_str = fx1_str or fx2_str
+        fx = evaluar(f_str, x_vals)
+        y_vals = np.random.uniform(fx.min(), fx.max(), n)
+        puntos_dentro_mask = (y_vals <= fx)
+        area_estim = (b - a) * (fx.max() - fx.min()) * (np.sum(puntos_dentro_mask) / n)
+        aproximacion = np.mean(fx) * (b - a)
+
+        ys = evaluar(f_str, xs)
+        ys1, ys2 = (ys, None) if fx1_str else (None, ys)
+        expresion = lambda: expresiones.interpretar(f_str)
+
+    if control is not None:
+        control.progreso(50)
+        control.verificar()
+
+    # Integral exacta (es la parte más lenta): por etapas con tiempo límite y, si no hay resultado
+    # simbólico a tiempo, cuadratura numérica
+    try:
+        informe = integracion.integrar(expresion(), x, (sp.Float(a), sp.Float(b)), control=control)
+        integral = informe["resultado"] if informe["numerico"] else informe["resultado"].evalf()
+    except Exception:
+        integral = "No disponible"
+
+    # Solo vuelven a la interfaz los conteos y la muestra que se dibuja, no los n puntos
+    # (con n = 1 000 000 serían unos 17 MB por la cola del proceso)
+    dentro = np.flatnonzero(puntos_dentro_mask)
+    fuera = np.flatnonzero(~puntos_dentro_mask)
+    muestra_dentro = dentro[:MAXIMO_PUNTOS_GRAFICA]
+    muestra_fuera = fuera[:MAXIMO_PUNTOS_GRAFICA]
+    return {
+        "a": a, "b": b, "fx1_str": fx1_str, "fx2_str": fx2_str,
+        "cantidad_dentro": len(dentro), "cantidad_fuera": len(fuera),
+        "puntos_dentro": (x_vals[muestra_dentro], y_vals[muestra_dentro]),
+        "puntos_fuera": (x_vals[muestra_fuera], y_vals[muestra_fuera]),
+        "area_estim": area_estim, "aproximacion": aproximacion,
+        "integral": integral, "ys1": ys1, "ys2": ys2,
+    }
+
+
 class MonteCarlo(QWidget):
     def __init__(self):
         super().__init__()
@@ -81,6 +168,10 @@ class MonteCarlo(QWidget):
 
         main_layout.addLayout(botones_layout)
 
+        # Progreso del cálculo en segundo plano
+        self.barra_tarea = BarraTarea()
+        main_layout.addWidget(self.barra_tarea)
+
         # Sección gráfica y resultados
         content_layout = QHBoxLayout()
         content_layout.setSpacing(20)
@@ -136,164 +227,92 @@ class MonteCarlo(QWidget):
         try:
             a = float(self.a_input.text())
             b = float(self.b_input.text())
-            n = int(self.n_input.value())
-
-            fx1_str = self.func1_input.text().replace("^", "**").strip()
-            fx2_str = self.func2_input.text().replace("^", "**").strip()
-
-            # Definir el scope para eval
-            scope = {"x": None, "sin": np.sin, "cos": np.cos, "exp": np.exp,
-                    "log": np.log, "sqrt": np.sqrt, "abs": np.abs, "tan": np.tan}
-
-            x_vals = np.random.uniform(a, b, n)
+        except ValueError as e:
+            QMessageBox.critical(self, "Error de función", f"❌ Error evaluando las funciones.\n\nDetalles: {e}")
+            return
+        n = int(self.n_input.value())
+
+        fx1_str = self.func1_input.text().strip()
+        fx2_str = self.func2_input.text().strip()
+
+        if not fx1_str and not fx2_str:
+            QMessageBox.warning(self, "Entrada vacía", "Por favor, ingrese al menos una función válida.")
+            return
+
+        # La simulación y la integral exacta se calculan en un proceso aparte: "Cancelar" puede
+        # detener una integral que no termina
+        self.calc_btn.setEnabled(False)
+        tarea = obtener_ejecutor().ejecutar(
+            simular_montecarlo, fx1_str, fx2_str, a, b, n,
+            en_proceso=True,
+            al_resultado=self.mostrar_resultados,
+            al_error=lambda e: QMessageBox.critical(self, "Error de función", f"❌ Error evaluando las funciones.\n\nDetalles: {e}"),
+            al_terminar=lambda: self.calc_btn.setEnabled(True),
+        )
+        self.barra_tarea.seguir(tarea)
+
+    def mostrar_resultados(self, datos):
+        a, b = datos["a"], datos["b"]
+        fx1_str, fx2_str = datos["fx1_str"], datos["fx2_str"]
+        integral = datos["integral"]
+        ys1, ys2 = datos["ys1"], datos["ys2"]
+
+        self.tabla.setItem(0, 0, QTableWidgetItem(str(integral)))
+        self.tabla.setItem(1, 0, QTableWidgetItem(f"{datos['aproximacion']:.6f}"))
+        self.tabla.setItem(2, 0, QTableWidgetItem(f"{datos['area_estim']:.6f}"))
+        self.tabla.setItem(3, 0, QTableWidgetItem(str(datos["cantidad_dentro"])))
+        self.tabla.setItem(4, 0, QTableWidgetItem(str(datos["cantidad_fuera"])))
 
-            # Condicional según funciones ingresadas
+        # Gráfica
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        self.figure.patch.set_alpha(0)
+        ax.set_facecolor((0, 0, 0, 0))
+        ax.tick_params(colors='white')
+        ax.xaxis.label.set_color('white')
+        ax.yaxis.label.set_color('white')
+
+        xs = np.linspace(a, b, 300)
+
+        if ys1 is not None:
+            ax.plot(xs, ys1, label="f1(x)", color="#502180")
+        if ys2 is not None:
+            ax.plot(xs, ys2, label="f2(x)", color="#1C781C")
+
+        # Puntos dentro y fuera (la muestra que devolvió la simulación)
+        x_dentro, y_dentro = datos["puntos_dentro"]
+        x_fuera, y_fuera = datos["puntos_fuera"]
+
+        ax.scatter(x_dentro, y_dentro, s=3, alpha=0.6, color="#0077ff", label="Puntos dentro")
+        ax.scatter(x_fuera, y_fuera, s=3, alpha=0.3, color="#ff6600", label="Puntos fuera")
+
+        # Solo si hay ambas funciones para rellenar el área entre ellas
+        if ys1 is not None and ys2 is not None:
+            ax.fill_between(xs, ys1, ys2, where=(ys1 > ys2), color="#1C781C", alpha=0.2)
+            ax.fill_between(xs, ys1, ys2, where=(ys1 <= ys2), color="#502180", alpha=0.2)
+
+        # Display the resolved integral above the plot with proper formatting
+        # Convert function strings to display-friendly format (replace ** with ^, sqrt with \sqrt)
+        fx1_display = fx1_str.replace("**", "^").replace("sqrt(x)", r"\sqrt{x}") if fx1_str else ""
+        fx2_display = fx2_str.replace("**", "^").replace("sqrt(x)", r"\sqrt{x}") if fx2_str else ""
+
+        if integral == "No disponible":
+            integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} \text{No disponible} \, dx$"
+        else:
             if fx1_str and not fx2_str:
-                # Solo f1
-                scope["x"] = x_vals
-                fx1 = eval(fx1_str, scope)
-                y_vals = np.random.uniform(fx1.min(), fx1.max(), n)
-                puntos_dentro_mask = (y_vals <= fx1)
-                puntos_fuera_mask = ~puntos_dentro_mask
-                area_estim = (b - a) * (fx1.max() - fx1.min()) * (np.sum(puntos_dentro_mask) / n)
-
-                # Integral y estimaciones
-                x = sp.Symbol("x")
-                try:
-                    expr1 = sp.sympify(fx1_str)
-                    integral = sp.integrate(expr1, (x, a, b)).evalf()
-                except:
-                    integral = "No disponible"
-
-                self.tabla.setItem(0, 0, QTableWidgetItem(str(integral)))
-                self.tabla.setItem(1, 0, QTableWidgetItem(f"{np.mean(fx1) * (b - a):.6f}"))
-                self.tabla.setItem(2, 0, QTableWidgetItem(f"{area_estim:.6f}"))
-                self.tabla.setItem(3, 0, QTableWidgetItem(str(np.sum(puntos_dentro_mask))))
-                self.tabla.setItem(4, 0, QTableWidgetItem(str(np.sum(puntos_fuera_mask))))
-
-                ys1 = eval(fx1_str, {**scope, "x": np.linspace(a, b, 300)})
-                ys2 = None
-
+                integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} " + f"{fx1_display}" + r" \, dx = " + formatear_integral(integral) + r"$"
             elif fx2_str and not fx1_str:
-                # Solo f2
-                scope["x"] = x_vals
-                fx2 = eval(fx2_str, scope)
-                y_vals = np.random.uniform(fx2.min(), fx2.max(), n)
-                puntos_dentro_mask = (y_vals <= fx2)
-                puntos_fuera_mask = ~puntos_dentro_mask
-                area_estim = (b - a) * (fx2.max() - fx2.min()) * (np.sum(puntos_dentro_mask) / n)
-
-                # Integral y estimaciones
-                x = sp.Symbol("x")
-                try:
-                    expr2 = sp.sympify(fx2_str)
-                    integral = sp.integrate(expr2, (x, a, b)).evalf()
-                except:
-                    integral = "No disponible"
-
-                self.tabla.setItem(0, 0, QTableWidgetItem(str(integral)))
-                self.tabla.setItem(1, 0, QTableWidgetItem(f"{np.mean(fx2) * (b - a):.6f}"))
-                self.tabla.setItem(2, 0, QTableWidgetItem(f"{area_estim:.6f}"))
-                self.tabla.setItem(3, 0, QTableWidgetItem(str(np.sum(puntos_dentro_mask))))
-                self.tabla.setItem(4, 0, QTableWidgetItem(str(np.sum(puntos_fuera_mask))))
-
-                ys1 = None
-                ys2 = eval(fx2_str, {**scope, "x": np.linspace(a, b, 300)})
-
+                integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} " + f"{fx2_display}" + r" \, dx = " + formatear_integral(integral) + r"$"
             elif fx1_str and fx2_str:
-                # Ambas funciones
-                scope["x"] = x_vals
-                fx1 = eval(fx1_str, scope)
-                fx2 = eval(fx2_str, scope)
-                y_vals = np.random.uniform(min(fx1.min(), fx2.min()), max(fx1.max(), fx2.max()), n)
-
-                y_min = np.minimum(fx1, fx2)
-                y_max = np.maximum(fx1, fx2)
-
-                puntos_dentro_mask = (y_vals >= y_min) & (y_vals <= y_max)
-                puntos_fuera_mask = ~puntos_dentro_mask
-
-                puntos_dentro = np.sum(puntos_dentro_mask)
-                puntos_fuera = n - puntos_dentro
-                area_estim = (b - a) * (y_max.max() - y_min.min()) * (puntos_dentro / n)
-
-                x = sp.Symbol("x")
-                try:
-                    expr1 = sp.sympify(fx1_str)
-                    expr2 = sp.sympify(fx2_str)
-                    integral = sp.integrate(expr1 - expr2, (x, a, b)).evalf()
-                except:
-                    integral = "No disponible"
-
-                self.tabla.setItem(0, 0, QTableWidgetItem(str(integral)))
-                self.tabla.setItem(1, 0, QTableWidgetItem(f"{np.mean(fx1 - fx2) * (b - a):.6f}"))
-                self.tabla.setItem(2, 0, QTableWidgetItem(f"{area_estim:.6f}"))
-                self.tabla.setItem(3, 0, QTableWidgetItem(str(puntos_dentro)))
-                self.tabla.setItem(4, 0, QTableWidgetItem(str(puntos_fuera)))
-
-                xs = np.linspace(a, b, 300)
-                ys1 = eval(fx1_str, {**scope, "x": xs})
-                ys2 = eval(fx2_str, {**scope, "x": xs})
-
-            else:
-                QMessageBox.warning(self, "Entrada vacía", "Por favor, ingrese al menos una función válida.")
-                return
-
-            # Gráfica
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
-            self.figure.patch.set_alpha(0)
-            ax.set_facecolor((0, 0, 0, 0))
-            ax.tick_params(colors='white')
-            ax.xaxis.label.set_color('white')
-            ax.yaxis.label.set_color('white')
-
-            xs = np.linspace(a, b, 300)
-
-            if ys1 is not None:
-                ax.plot(xs, ys1, label="f1(x)", color="#502180")
-            if ys2 is not None:
-                ax.plot(xs, ys2, label="f2(x)", color="#1C781C")
-
-            # Si hay puntos dentro y fuera definidos
-            if 'puntos_dentro_mask' in locals() and 'puntos_fuera_mask' in locals():
-                x_dentro = x_vals[puntos_dentro_mask]
-                y_dentro = y_vals[puntos_dentro_mask]
-                x_fuera = x_vals[puntos_fuera_mask]
-                y_fuera = y_vals[puntos_fuera_mask]
-
-                ax.scatter(x_dentro[:3000], y_dentro[:3000], s=3, alpha=0.6, color="#0077ff", label="Puntos dentro")
-                ax.scatter(x_fuera[:3000], y_fuera[:3000], s=3, alpha=0.3, color="#ff6600", label="Puntos fuera")
-
-            # Solo si hay ambas funciones para rellenar el área entre ellas
-            if ys1 is not None and ys2 is not None:
-                ax.fill_between(xs, ys1, ys2, where=(ys1 > ys2), color="#1C781C", alpha=0.2)
-                ax.fill_between(xs, ys1, ys2, where=(ys1 <= ys2), color="#502180", alpha=0.2)
-
-            # Display the resolved integral above the plot with proper formatting
-            # Convert function strings to display-friendly format (replace ** with ^, sqrt with \sqrt)
-            fx1_display = fx1_str.replace("**", "^").replace("sqrt(x)", r"\sqrt{x}") if fx1_str else ""
-            fx2_display = fx2_str.replace("**", "^").replace("sqrt(x)", r"\sqrt{x}") if fx2_str else ""
-            
-            if integral == "No disponible":
-                integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} \text{No disponible} \, dx$"
-            else:
-                if fx1_str and not fx2_str:
-                    integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} " + f"{fx1_display}" + r" \, dx = " + f"{integral:.6f}" + r"$"
-                elif fx2_str and not fx1_str:
-                    integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} " + f"{fx2_display}" + r" \, dx = " + f"{integral:.6f}" + r"$"
-                elif fx1_str and fx2_str:
-                    integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} (" + f"{fx1_display} - {fx2_display}" + r") \, dx = " + f"{integral:.6f}" + r"$"
-
-            ax.set_title(integral_text, fontsize=14, color="#FFFFFF", y=0.95)
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            self.canvas.draw()
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error de función", f"❌ Error evaluando las funciones.\n\nDetalles: {e}")
+                integral_text = r"$\int_{" + f"{a}" + r"}^{" + f"{b}" + r"} (" + f"{fx1_display} - {fx2_display}" + r") \, dx = " + formatear_integral(integral) + r"$"
+
+        ax.set_title(integral_text, fontsize=14, color="#FFFFFF", y=0.95)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        self.canvas.draw()
 
     def volver(self):
+        self.barra_tarea.cancelar()
         self.menu = MenuGeneral()
         self.menu.show()
         self.close()
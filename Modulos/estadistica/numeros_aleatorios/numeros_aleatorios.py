@@ -9,7 +9,10 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QDoubleValidator
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
-from scipy.stats import norm, expon, binom, uniform, poisson, geom, gaussian_kde
+from utils.importaciones import importar_diferido
+
+# scipy.stats tarda en importarse; se carga la primera vez que se genera una distribución
+stats = importar_diferido("scipy.stats")
 
 # Métodos de generación de números aleatorios
 def mersenne_twister(cantidad):
@@ -369,14 +372,14 @@ class NumerosAleatorios(QWidget):
                 sigma = float(self.param_inputs['sigma'].text())
                 if sigma <= 0:
                     raise ValueError("La desviación estándar debe ser positiva.")
-                resultados = norm.ppf(resultados_base, loc=mu, scale=sigma)
+                resultados = stats.norm.ppf(resultados_base, loc=mu, scale=sigma)
 
             elif distribucion == "Exponencial":
                 lambda_rate = float(self.param_inputs['lambda'].text())
                 if lambda_rate <= 0:
                     raise ValueError("La tasa λ debe ser positiva.")
                 scale = 1 / lambda_rate
-                resultados = expon.ppf(resultados_base, scale=scale)
+                resultados = stats.expon.ppf(resultados_base, scale=scale)
 
             elif distribucion == "Binomial":
                 n_trials = int(float(self.param_inputs['n'].text()))
@@ -385,26 +388,26 @@ class NumerosAleatorios(QWidget):
                     raise ValueError("El número de ensayos debe ser al menos 1.")
                 if not 0 <= p <= 1:
                     raise ValueError("La probabilidad p debe estar entre 0 y 1.")
-                resultados = binom.ppf(resultados_base, n=n_trials, p=p)
+                resultados = stats.binom.ppf(resultados_base, n=n_trials, p=p)
 
             elif distribucion == "Uniforme":
                 a = float(self.param_inputs['a'].text())
                 b = float(self.param_inputs['b'].text())
                 if a >= b:
                     raise ValueError("El límite inferior a debe ser menor que el límite superior b.")
-                resultados = uniform.ppf(resultados_base, loc=a, scale=b-a)
+                resultados = stats.uniform.ppf(resultados_base, loc=a, scale=b-a)
 
             elif distribucion == "Poisson":
                 lambda_rate = float(self.param_inputs['lambda'].text())
                 if lambda_rate <= 0:
                     raise ValueError("La tasa λ debe ser positiva.")
-                resultados = poisson.ppf(resultados_base, mu=lambda_rate)
+                resultados = stats.poisson.ppf(resultados_base, mu=lambda_rate)
 
             elif distribucion == "Geométrica":
                 p = float(self.param_inputs['p'].text())
                 if not 0 < p <= 1:
                     raise ValueError("La probabilidad p debe estar entre 0 y 1.")
-                resultados = geom.ppf(resultados_base, p=p)
+                resultados = stats.geom.ppf(resultados_base, p=p)
 
             self.mostrar_resultados(resultados, distribucion)
             self.dibujar_grafica(resultados, distribucion)
@@ -436,7 +439,7 @@ class NumerosAleatorios(QWidget):
             # Histograma
             ax.hist(resultados, bins=30, density=True, alpha=0.5, color='cyan', label=f"Histograma {distribucion}")
             # Curva de densidad kernel
-            kde = gaussian_kde(resultados)
+            kde = stats.gaussian_kde(resultados)
             x_range = np.linspace(min(resultados), max(resultados), 200)
             ax.plot(x_range, kde(x_range), 'y-', label=f"Curva {distribucion}", linewidth=2)
         else:
@@ -9,9 +9,6 @@ from PyQt5.QtCore import Qt
 # Se importa sympy, una librería para matemáticas simbólicas (por ejemplo, derivadas, integrales, ecuaciones)
 import sympy as sp
 
-# Se importa re, que es la librería de expresiones regulares para buscar o validar patrones en textos
-import re
-
 # Se importa FigureCanvas para integrar gráficos de matplotlib en una aplicación PyQt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
@@ -19,6 +16,9 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from Modulos.menu_general.menu_general import MenuGeneral
+# Analizador de expresiones compartido (sen, e^x, π, 2x...) con caché: al redibujar, las funciones
+# guardadas no se vuelven a interpretar
+from utils import expresiones
 
 
 
@@ -125,21 +125,10 @@ class Graficas_2d_3d(QWidget):
         self.input_funcion.setCursorPosition(cursor_pos)
         self.input_funcion.blockSignals(False)
 
-    # Preprocesa la función, reemplazando ciertos símbolos y expresiones
-    def preprocesar_funcion(self, expr):
-        expr = expr.replace('^', '**')  # Reemplaza el símbolo de potencia
-        expr = expr.replace('π', 'pi')  # Reemplaza pi por 'pi' en la expresión
-        expr = expr.replace('sen', 'sin')  # Reemplaza 'sen' por 'sin'
-        expr = re.sub(r'e\^\(([^()]*)\)', r'exp(\1)', expr)  # Reemplaza e^(...) por exp(...)
-        expr = re.sub(r'e\^(-?[a-zA-Z0-9_\*\+\-/\.]+)', r'exp(\1)', expr)  # Reemplaza e^x por exp(x)
-        return expr
-
     # Muestra la gráfica 2D de la función ingresada
     def mostrar_grafica_2d(self):
         expresion_original = self.input_funcion.text()
-        expr = self.preprocesar_funcion(expresion_original)
-
-        if 'y' in expr:  # Verifica que no haya una 'y' en la expresión
+        if 'y' in expresion_original.lower():  # Verifica que no haya una 'y' en la expresión
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
             msg.setText("Error al graficar 2D")
@@ -150,8 +139,8 @@ class Graficas_2d_3d(QWidget):
 
         x = sp.symbols('x')
         try:
-            funcion = sp.sympify(expr)  # Convierte la expresión en una función simbólica
-            f = sp.lambdify(x, funcion, 'numpy')  # Convierte la función simbólica a una función de numpy
+            # Convierte la expresión en una función de numpy (la primera vez; después sale de la caché)
+            f = expresiones.funcion_numpy(expresion_original, x)
 
             # Guardar la función si es válida y no está duplicada
             if expresion_original not in self.funciones_guardadas:
@@ -164,10 +153,8 @@ class Graficas_2d_3d(QWidget):
 
             # Graficar todas las funciones almacenadas
             for func_text in self.funciones_guardadas:
-                func_expr = self.preprocesar_funcion(func_text)
-                func = sp.sympify(func_expr)
-                f = sp.lambdify(x, func, 'numpy')
-                y_val = f(x_val)
+                f = expresiones.funcion_numpy(func_text, x)
+                y_val = np.broadcast_to(f(x_val), x_val.shape)  # Las constantes dan un solo valor
                 ax.plot(x_val, y_val, label=f"$y = {func_text}$")
 
             ax.set_xlabel("x")  # Etiqueta del eje X
@@ -191,17 +178,16 @@ class Graficas_2d_3d(QWidget):
     # Muestra la gráfica 3D de la función ingresada
     def mostrar_grafica_3d(self):
         expresion_original = self.input_funcion.text()
-        expr = self.preprocesar_funcion(expresion_original)
 
         x, y = sp.symbols('x y')
         try:
-            funcion = sp.sympify(expr)  # Convierte la expresión en una función simbólica
-            f = sp.lambdify((x, y), funcion, 'numpy')  # Convierte la función simbólica a una función de numpy
+            # Convierte la expresión en una función de numpy (guardada en la caché compartida)
+            f = expresiones.funcion_numpy(expresion_original, (x, y))
 
             x_vals = np.linspace(-5, 5, 100)
             y_vals = np.linspace(-5, 5, 100)
             X, Y = np.meshgrid(x_vals, y_vals)  # Crear la malla de puntos
-            Z = f(X, Y)  # Calcular los valores de Z
+            Z = np.broadcast_to(f(X, Y), X.shape)  # Calcular los valores de Z
 
             self.figura.clear()  # Limpiar la figura
             ax = self.figura.add_subplot(111, projection="3d")  # Crear gráfico 3D
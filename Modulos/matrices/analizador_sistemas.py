@@ -0,0 +1,204 @@
+# Analizador de sistemas de ecuaciones lineales escritos como texto.
+# Recorre todo el texto una sola vez con una expresión regular compilada y guarda cada coeficiente
+# como un triplete (fila, columna, valor); al final arma A (densa o dispersa) y B de una vez.
+# Acepta variables de varias letras (x1, y2, vel), fracciones (3/4x, = 1/2), coeficientes antes o
+# después de la variable (2*x, x*2, x/2), términos con variables en ambos lados del "=" y varios
+# lados derechos separados con ";". Ningún lado puede quedar vacío ("x + y =" es un error).
+import re
+from fractions import Fraction
+
+import numpy as np
+from scipy import sparse
+
+from Modulos.matrices.motor_matrices import ELEMENTOS_DISPERSA, DENSIDAD_DISPERSA
+
+# Un solo patrón para todas las piezas: números, variables, operadores y saltos de línea
+_TOKEN = re.compile(r"""
+    [ \t\r]*(?:
+        (?P<numero>\d+\.?\d*|\.\d+)
+      | (?P<variable>[^\W\d]\w*)
+      | (?P<operador>[-+*/=;])
+      | (?P<fin>\n)
+      | (?P<error>\S)
+    )
+""", re.VERBOSE)
+
+
+def _tokenizar(texto):
+    for m in _TOKEN.finditer(texto):
+        tipo = m.lastgroup
+        if tipo == "error":
+            raise ValueError(f"Carácter no válido en el sistema: '{m.group(tipo)}'")
+        yield tipo, m.group(tipo)
+    # Marca el final del texto (un "fin" sin salto de línea)
+    yield "fin", None
+
+
+# Orden natural de las variables: x2 va antes que x10
+def _orden_natural(nombre):
+    return [int(parte) if parte.isdigit() else parte for parte in re.split(r"(\d+)", nombre)]
+
+
+# Lee el texto y devuelve los coeficientes como tripletes, las constantes de cada ecuación
+# y los nombres de las variables en el orden en que aparecieron
+def _leer(texto, convertir):
+    filas, columnas, valores = [], [], []
+    constantes = []
+    indices = {}  # nombre de variable -> columna (orden de aparición)
+
+    fila = 0
+    lado = 1  # 1 a la izquierda del "=", -1 a la derecha (los términos cambian de lado)
+    segmento = 0  # Lado derecho actual cuando hay varios separados con ";"
+    constantes_fila = [0]
+    hay_igual = False
+    hay_terminos = False
+    terminos_lado = 0  # Términos del lado (o del lado derecho separado con ";") que se está leyendo
+    linea = 1
+
+    tokens = _tokenizar(texto)
+    tipo, valor = next(tokens)
+    while True:
+        if tipo == "fin":
+            if hay_terminos or hay_igual:
+                if not hay_igual:
+                    raise ValueError(f"La ecuación {fila + 1} (línea {linea}) no tiene '='.")
+                if terminos_lado == 0:
+                    despues = "del ';'" if segmento else "del '='"
+                    raise ValueError(f"La ecuación {fila + 1} (línea {linea}) no tiene nada a la derecha {despues}.")
+                constantes.append(constantes_fila)
+                fila += 1
+            if valor is None:
+                break
+            lado, segmento, constantes_fila = 1, 0, [0]
+            hay_igual = hay_terminos = False
+            terminos_lado = 0
+            linea += 1
+            tipo, valor = next(tokens)
+            continue
+
+        if tipo == "operador" and valor == "=":
+            if hay_igual:
+                raise ValueError(f"La ecuación {fila + 1} (línea {linea}) tiene más de un '='.")
+            if terminos_lado == 0:
+                raise ValueError(f"La ecuación {fila + 1} (línea {linea}) no tiene nada a la izquierda del '='.")
+            hay_igual = True
+            lado = -1
+            terminos_lado = 0
+            tipo, valor = next(tokens)
+            continue
+
+        if tipo == "operador" and valor == ";":
+            if not hay_igual:
+                raise ValueError(f"En la ecuación {fila + 1} el ';' solo puede ir después del '='.")
+            if terminos_lado == 0:
+                raise ValueError(f"La ecuación {fila + 1} (línea {linea}) tiene un lado derecho vacío antes del ';'.")
+            terminos_lado = 0
+            segmento += 1
+            constantes_fila.append(0)
+            tipo, valor = next(tokens)
+            continue
+
+        # Un término: signos, coeficiente opcional (entero, decimal o fracción) y variable opcional
+        signo = lado
+        while tipo == "operador" and valor in "+-":
+            if valor == "-":
+                signo = -signo
+            tipo, valor = next(tokens)
+
+        coeficiente = None
+        if tipo == "numero":
+            coeficiente = convertir(valor)
+            tipo, valor = next(tokens)
+            if tipo == "operador" and valor == "/":
+                tipo, valor = next(tokens)
+                if tipo != "numero":
+                    raise ValueError(f"Fracción incompleta en la ecuación {fila + 1}.")
+                denominador = convertir(valor)
+                if denominador == 0:
+                    raise ValueError(f"División entre cero en la ecuación {fila + 1}.")
+                coeficiente = coeficiente / denominador
+                tipo, valor = next(tokens)
+            if tipo == "operador" and valor == "*":
+                tipo, valor = next(tokens)
+                if tipo != "variable":
+                    raise ValueError(f"Falta la variable después de '*' en la ecuación {fila + 1}.")
+
+        if tipo == "variable":
+            if segmento > 0:
+                raise ValueError(
+                    f"En la ecuación {fila + 1}, los lados derechos separados con ';' solo pueden tener números."
+                )
+            columna = indices.setdefault(valor, len(indices))
+            coeficiente = convertir("1") if coeficiente is None else coeficiente
+            tipo, valor = next(tokens)
+            # Coeficiente después de la variable: x*2, x/2, 2*x*3
+            while tipo == "operador" and valor in "*/":
+                operador = valor
+                tipo, valor = next(tokens)
+                if tipo != "numero":
+                    raise ValueError(
+                        f"Después de '{operador}' en la ecuación {fila + 1} (línea {linea}) solo puede ir un número: "
+                        f"el sistema es lineal, las variables no se multiplican ni dividen entre sí."
+                    )
+                numero = convertir(valor)
+                if operador == "/" and numero == 0:
+                    raise ValueError(f"División entre cero en la ecuación {fila + 1}.")
+                coeficiente = coeficiente * numero if operador == "*" else coeficiente / numero
+                tipo, valor = next(tokens)
+            filas.append(fila)
+            columnas.append(columna)
+            valores.append(signo * coeficiente)
+        elif coeficiente is not None:
+            # Constante: pasa al lado derecho con el signo contrario al de su lado
+            constantes_fila[segmento] -= signo * coeficiente
+        else:
+            raise ValueError(f"Término incompleto en la ecuación {fila + 1}.")
+        hay_terminos = True
+        terminos_lado += 1
+
+        # Después de un término solo puede venir otro signo, "=", ";" o el fin de la línea
+        if tipo not in ("fin", "operador") or (tipo == "operador" and valor in "*/"):
+            raise ValueError(f"Falta un operador entre los términos de la ecuación {fila + 1}.")
+
+    return filas, columnas, valores, constantes, list(indices)
+
+
+# Convierte el texto del sistema en la matriz A, el vector B (o una matriz con un lado derecho
+# por columna) y la lista de variables ordenadas.
+# Con exacto=True los coeficientes son fracciones y A, B son listas; si no, arreglos de NumPy
+# y A pasa a formato disperso cuando el sistema es grande y casi todos sus coeficientes son 0
+def analizar(texto, exacto=False, dispersa=None):
+    convertir = Fraction if exacto else float
+    filas, columnas, valores, constantes, nombres = _leer(texto, convertir)
+    if not constantes:
+        raise ValueError("El sistema no tiene ecuaciones.")
+    if len({len(c) for c in constantes}) > 1:
+        raise ValueError("Todas las ecuaciones deben tener la misma cantidad de lados derechos.")
+
+    # Ordena las variables y traduce las columnas del orden de aparición al orden final
+    variables = sorted(nombres, key=_orden_natural)
+    posicion = {nombre: i for i, nombre in enumerate(variables)}
+    permutacion = [posicion[nombre] for nombre in nombres]
+    m, n = len(constantes), len(variables)
+    un_lado = len(constantes[0]) == 1
+
+    if exacto:
+        A = [[Fraction(0)] * n for _ in range(m)]
+        for f, c, v in zip(filas, columnas, valores):
+            A[f][permutacion[c]] += v  # Una variable repetida en la ecuación suma sus coeficientes
+        B = [c[0] for c in constantes] if un_lado else constantes
+        return A, B, variables
+
+    columnas = np.asarray(permutacion, dtype=np.intp)[np.asarray(columnas, dtype=np.intp)]
+    filas = np.asarray(filas, dtype=np.intp)
+    valores = np.asarray(valores, dtype=float)
+    if dispersa is None:
+        dispersa = m * n >= ELEMENTOS_DISPERSA and len(valores) < DENSIDAD_DISPERSA * m * n
+    if dispersa:
+        # El formato COO suma los coeficientes repetidos al convertir a CSR
+        A = sparse.coo_matrix((valores, (filas, columnas)), shape=(m, n)).tocsr()
+    else:
+        A = np.zeros((m, n))
+        np.add.at(A, (filas, columnas), valores)
+    B = np.asarray(constantes, dtype=float)
+    return A, (B[:, 0] if un_lado else B), variables
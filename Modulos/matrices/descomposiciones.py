@@ -0,0 +1,128 @@
+# Descomposiciones de matrices: LU, QR, Cholesky y SVD.
+# Los factores se guardan en la caché de factorizaciones de la sesión (motor_matrices.obtener_cache),
+# de modo que después la inversa, la solución de A x = b, el rango o la pseudoinversa de la misma
+# matriz se calculan a partir de los factores ya guardados en lugar de factorizar otra vez.
+import numpy as np
+
+from Modulos.matrices import motor_matrices
+
+DESCOMPOSICIONES = ["LU", "QR", "Cholesky", "SVD"]
+
+# Descomposiciones que solo existen para matrices cuadradas
+CUADRADAS = ["LU", "Cholesky"]
+
+
+def _qr(A):
+    return np.linalg.qr(A)
+
+
+# SVD reducida: U (m×k), valores singulares (k) y Vᵀ (k×n), con k = min(m, n)
+def _svd(A):
+    return np.linalg.svd(A, full_matrices=False)
+
+
+def _como_densa(A):
+    A = motor_matrices.como_matriz(A)
+    if motor_matrices.es_dispersa(A) or A.ndim != 2:
+        raise ValueError("Las descomposiciones necesitan una sola matriz densa.")
+    if not np.all(np.isfinite(A)):
+        raise ValueError("La matriz contiene valores infinitos o NaN.")
+    return A
+
+
+# Convierte los intercambios de filas de LAPACK (piv) en la permutación de filas: A[perm] = L U
+def _permutacion(piv):
+    perm = np.arange(len(piv))
+    for i, j in enumerate(piv):
+        perm[i], perm[j] = perm[j], perm[i]
+    return perm
+
+
+# Calcula (o toma de la caché) la descomposición y devuelve sus factores como lista de (nombre, matriz)
+def descomponer(A, tipo):
+    A = _como_densa(A)
+    if tipo in CUADRADAS:
+        motor_matrices.validar_dimensiones("Inversa", A.shape)
+    cache = motor_matrices.obtener_cache()
+
+    if tipo == "LU":
+        lu, piv = cache.obtener(A, "LU", motor_matrices.factorizar_lu)
+        n = A.shape[0]
+        # A = P L U, con L triangular inferior de diagonal unitaria y P de permutación
+        L = np.tril(lu, k=-1) + np.eye(n)
+        U = np.triu(lu)
+        P = np.eye(n)[_permutacion(piv)].T
+        return [("P", P), ("L", L), ("U", U)]
+    if tipo == "QR":
+        Q, R = cache.obtener(A, "QR", _qr)
+        return [("Q", Q), ("R", R)]
+    if tipo == "Cholesky":
+        # Simetría exacta: cho_factor solo lee el triángulo inferior e ignoraría la diferencia
+        if not np.array_equal(A, A.T):
+            raise ValueError("Cholesky necesita una matriz simétrica (A igual a su traspuesta).")
+        cholesky = cache.obtener(A, "Cholesky", motor_matrices.factorizar_cholesky)
+        if cholesky is None:
+            raise ValueError("La matriz no es definida positiva: no tiene descomposición de Cholesky.")
+        # cho_factor deja basura en el triángulo superior; L es solo el inferior
+        return [("L", np.tril(cholesky[0]))]
+    if tipo == "SVD":
+        U, s, Vt = cache.obtener(A, "SVD", _svd)
+        return [("U", U), ("Σ", np.diag(s)), ("Vᵀ", Vt)]
+    raise ValueError(f"Descomposición no soportada: {tipo}")
+
+
+# Error relativo de reconstrucción ||A - producto de los factores|| / ||A|| (comprobación rápida)
+def error_reconstruccion(A, factores):
+    A = _como_densa(A)
+    matrices = [M for _, M in factores]
+    if len(matrices) == 1:
+        # Cholesky: A = L Lᵀ
+        producto = matrices[0] @ matrices[0].T
+    else:
+        producto = np.linalg.multi_dot(matrices)
+    norma = np.linalg.norm(A) or 1.0
+    return float(np.linalg.norm(A - producto) / norma)
+
+
+# Tolerancia usual para decidir qué valores singulares cuentan como cero (la misma que matrix_rank)
+def _tolerancia(A, s):
+    return s.max() * max(A.shape) * np.finfo(float).eps if s.size else 0.0
+
+
+def rango(A):
+    A = _como_densa(A)
+    _, s, _ = motor_matrices.obtener_cache().obtener(A, "SVD", _svd)
+    return int(np.count_nonzero(s > _tolerancia(A, s)))
+
+
+# Pseudoinversa de Moore-Penrose a partir de la SVD: V Σ⁺ Uᵀ
+def pseudoinversa(A):
+    A = _como_densa(A)
+    U, s, Vt = motor_matrices.obtener_cache().obtener(A, "SVD", _svd)
+    inversos = np.zeros_like(s)
+    no_nulos = s > _tolerancia(A, s)
+    inversos[no_nulos] = 1.0 / s[no_nulos]
+    return (Vt.T * inversos) @ U.T
+
+
+# Inversa a partir de la LU guardada (o Cholesky, si la matriz ya se descompuso así)
+def inversa(A):
+    A = _como_densa(A)
+    motor_matrices.validar_dimensiones("Inversa", A.shape)
+    identidad = np.eye(A.shape[0])
+    try:
+        return motor_matrices.obtener_cache().resolver(A, identidad)
+    except np.linalg.LinAlgError:
+        raise ValueError("La matriz no tiene inversa porque su determinante es 0.")
+
+
+# Resuelve A x = b con los factores guardados (los mismos que usa Sistemas Lineales)
+def resolver(A, b):
+    return motor_matrices.resolver(_como_densa(A), b)
+
+
+# Número de condición en norma 2 a partir de los valores singulares
+def condicion(A):
+    A = _como_densa(A)
+    _, s, _ = motor_matrices.obtener_cache().obtener(A, "SVD", _svd)
+    return float(s.max() / s.min()) if s.size and s.min() > 0 else float("inf")
@@ -0,0 +1,212 @@
+# Métodos iterativos y de mínimos cuadrados para sistemas lineales A x = b.
+# En sistemas grandes y bien condicionados (sobre todo dispersos) un método iterativo solo necesita
+# productos matriz-vector: no factoriza A, así que usa mucha menos memoria que la LU densa.
+# Cada método devuelve un diccionario con la solución, las iteraciones, el residuo final y el
+# historial del residuo relativo para graficar la convergencia.
+import numpy as np
+from scipy import sparse
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import LinearOperator, cg, gmres, lsqr, spilu, spsolve_triangular
+
+from Modulos.matrices import motor_matrices
+
+METODOS = [
+    "Directo (LU)",
+    "Gradiente conjugado (CG)",
+    "GMRES",
+    "Jacobi",
+    "Gauss-Seidel",
+    "Mínimos cuadrados",
+]
+
+# Métodos de Krylov que aceptan precondicionador
+METODOS_PRECONDICIONADOS = ["Gradiente conjugado (CG)", "GMRES"]
+
+PRECONDICIONADORES = ["Ninguno", "Jacobi (diagonal)", "ILU incompleta"]
+
+# Iteraciones internas de GMRES entre reinicios
+REINICIO_GMRES = 20
+
+
+def es_iterativo(metodo):
+    return metodo not in ("Directo (LU)", "Mínimos cuadrados")
+
+
+# Norma de b para el residuo relativo; con b = 0 se usa el residuo absoluto (x = 0 es exacta)
+def _norma(b):
+    return np.linalg.norm(b) or 1.0
+
+
+def _residuo_relativo(A, x, b, norma_b):
+    return float(np.linalg.norm(b - A @ x) / norma_b)
+
+
+# Construye el precondicionador M ≈ A⁻¹ como operador lineal
+def _precondicionador(A, nombre):
+    n = A.shape[0]
+    if nombre == "Jacobi (diagonal)":
+        diagonal = A.diagonal()
+        if np.any(diagonal == 0):
+            raise ValueError("El precondicionador de Jacobi necesita una diagonal sin ceros.")
+        inversa = 1.0 / diagonal
+        return LinearOperator((n, n), matvec=lambda v: inversa * v.ravel())
+    if nombre == "ILU incompleta":
+        try:
+            ilu = spilu(sparse.csc_matrix(A))
+        except RuntimeError:
+            raise ValueError("No se pudo calcular la factorización ILU (la matriz puede ser singular).")
+        return LinearOperator((n, n), matvec=ilu.solve)
+    return None
+
+
+# Llama a cg/gmres con la tolerancia relativa (scipy >= 1.12 usa "rtol"; versiones anteriores, "tol")
+def _krylov(funcion, A, b, tolerancia, **kwargs):
+    try:
+        return funcion(A, b, rtol=tolerancia, atol=0.0, **kwargs)
+    except TypeError:
+        return funcion(A, b, tol=tolerancia, atol=0.0, **kwargs)
+
+
+def _cg(A, b, M, tolerancia, max_iter, historial, control):
+    norma_b = _norma(b)
+
+    def al_iterar(xk):
+        historial.append(_residuo_relativo(A, xk, b, norma_b))
+        if control is not None:
+            control.verificar()
+            control.progreso(100 * len(historial) / max_iter)
+
+    x, info = _krylov(cg, A, b, tolerancia, maxiter=max_iter, M=M, callback=al_iterar)
+    return x, info == 0
+
+
+# El máximo de iteraciones cuenta iteraciones internas, como el historial y el progreso; maxiter de
+# scipy cuenta ciclos de reinicio, así que se reparte entre ciclos de igual longitud (como mucho
+# REINICIO_GMRES iteraciones cada uno)
+def _gmres(A, b, M, tolerancia, max_iter, historial, control):
+    ciclos = -(-max_iter // REINICIO_GMRES)
+    reinicio = -(-max_iter // ciclos)
+
+    def al_iterar(residuo):
+        # GMRES informa la norma relativa del residuo (precondicionado) en cada iteración interna
+        historial.append(float(residuo))
+        if control is not None:
+            control.verificar()
+            control.progreso(min(100, 100 * len(historial) / max_iter))
+
+    x, info = _krylov(gmres, A, b, tolerancia, restart=reinicio, maxiter=ciclos, M=M,
+                      callback=al_iterar, callback_type="pr_norm")
+    return x, info == 0
+
+
+# Jacobi: x_{k+1} = D⁻¹ (b - (A - D) x_k). Converge si A es diagonalmente dominante
+def _jacobi(A, b, tolerancia, max_iter, historial, control):
+    diagonal = A.diagonal()
+    if np.any(diagonal == 0):
+        raise ValueError("El método de Jacobi necesita una diagonal sin ceros.")
+    norma_b = _norma(b)
+    x = np.zeros_like(b)
+    for k in range(max_iter):
+        residuo = b - A @ x
+        x = x + residuo / diagonal
+        historial.append(_residuo_relativo(A, x, b, norma_b))
+        if control is not None:
+            control.verificar()
+            control.progreso(100 * (k + 1) / max_iter)
+        if historial[-1] <= tolerancia:
+            return x, True
+        if not np.isfinite(historial[-1]):
+            break
+    return x, False
+
+
+# Gauss-Seidel: x_{k+1} = (D + L)⁻¹ (b - U x_k), resolviendo el sistema triangular inferior
+def _gauss_seidel(A, b, tolerancia, max_iter, historial, control):
+    if np.any(A.diagonal() == 0):
+        raise ValueError("El método de Gauss-Seidel necesita una diagonal sin ceros.")
+    dispersa = motor_matrices.es_dispersa(A)
+    if dispersa:
+        inferior = sparse.tril(A, format="csr")
+        superior = sparse.triu(A, k=1, format="csr")
+    else:
+        inferior = np.tril(A)
+        superior = np.triu(A, k=1)
+    norma_b = _norma(b)
+    x = np.zeros_like(b)
+    for k in range(max_iter):
+        derecha = b - superior @ x
+        if dispersa:
+            x = spsolve_triangular(inferior, derecha, lower=True)
+        else:
+            x = solve_triangular(inferior, derecha, lower=True, check_finite=False)
+        historial.append(_residuo_relativo(A, x, b, norma_b))
+        if control is not None:
+            control.verificar()
+            control.progreso(100 * (k + 1) / max_iter)
+        if historial[-1] <= tolerancia:
+            return x, True
+        if not np.isfinite(historial[-1]):
+            break
+    return x, False
+
+
+# Mínimos cuadrados: minimiza ||A x - b||; sirve para sistemas no cuadrados (sobre o subdeterminados)
+def _minimos_cuadrados(A, b, tolerancia, max_iter):
+    if motor_matrices.es_dispersa(A):
+        resultado = lsqr(A, b, atol=tolerancia, btol=tolerancia, iter_lim=max_iter)
+        x, parada, iteraciones = resultado[0], resultado[1], resultado[2]
+        # parada = 0: b = 0 y x = 0 es la solución exacta
+        return x, iteraciones, parada in (0, 1, 2, 4, 5)
+    # En matrices densas se usa la solución directa (SVD) de NumPy
+    x = np.linalg.lstsq(A, b, rcond=None)[0]
+    return x, 0, True
+
+
+# Punto de entrada: resuelve A x = b con el método elegido y devuelve el informe de la solución
+def resolver(A, b, metodo="Directo (LU)", precondicionador="Ninguno", tolerancia=1e-8,
+             max_iter=1000, control=None):
+    A = motor_matrices.como_matriz(A)
+    b = np.asarray(b, dtype=float)
+    if A.ndim != 2:
+        raise ValueError("Se esperaba una sola matriz A.")
+    if b.ndim != 1:
+        raise ValueError("Los métodos iterativos y de mínimos cuadrados resuelven un solo lado derecho a la vez.")
+    if A.shape[0] != b.shape[0]:
+        raise ValueError("Dimensiones incompatibles entre A y B.")
+    if tolerancia <= 0 or max_iter < 1:
+        raise ValueError("La tolerancia debe ser positiva y el máximo de iteraciones al menos 1.")
+
+    # Un sistema no cuadrado no tiene solución única: siempre se resuelve por mínimos cuadrados
+    if A.shape[0] != A.shape[1]:
+        metodo = "Mínimos cuadrados"
+
+    historial = []
+    iteraciones = 0
+    convergio = True
+    if metodo == "Directo (LU)":
+        x = motor_matrices.resolver(A, b)
+    elif metodo == "Mínimos cuadrados":
+        x, iteraciones, convergio = _minimos_cuadrados(A, b, tolerancia, max_iter)
+    elif metodo in METODOS_PRECONDICIONADOS:
+        M = _precondicionador(A, precondicionador)
+        resolvedor = _cg if metodo == "Gradiente conjugado (CG)" else _gmres
+        x, convergio = resolvedor(A, b, M, tolerancia, max_iter, historial, control)
+        iteraciones = len(historial)
+    elif metodo == "Jacobi":
+        x, convergio = _jacobi(A, b, tolerancia, max_iter, historial, control)
+        iteraciones = len(historial)
+    elif metodo == "Gauss-Seidel":
+        x, convergio = _gauss_seidel(A, b, tolerancia, max_iter, historial, control)
+        iteraciones = len(historial)
+    else:
+        raise ValueError(f"Método no soportado: {metodo}")
+
+    norma_b = _norma(b)
+    return {
+        "x": x,
+        "metodo": metodo,
+        "iteraciones": iteraciones,
+        "residuo": _residuo_relativo(A, x, b, norma_b),
+        "historial": historial,
+        "convergio": convergio and bool(np.all(np.isfinite(x))),
+    }
@@ -2,9 +2,11 @@
 # Importa numpy, una librería para trabajar con arrays y operaciones matemáticas
 import numpy as np
 
-# De numpy, se importa la función para invertir matrices (inv), calcular el determinante (det)
-# y para manejar errores al trabajar con álgebra lineal (LinAlgError)
-from numpy.linalg import inv, det, LinAlgError
+# Rutas de archivos (para no sobrescribir las entradas de la multiplicación por bloques)
+import os
+
+# De numpy, se importa la clase para manejar errores al trabajar con álgebra lineal (LinAlgError)
+from numpy.linalg import LinAlgError
 
 from PyQt5.QtWidgets import *  # También importa todos los widgets
 
@@ -24,8 +26,29 @@ from PyQt5.QtGui import QRegularExpressionValidator
 from PyQt5.QtCore import QRegularExpression
 
 from Modulos.menu_general.menu_general import MenuGeneral
+# Motor de cálculo sin interfaz gráfica que realiza las operaciones con matrices
+from Modulos.matrices import motor_matrices
+# Aritmética exacta con fracciones (eliminación de Bareiss)
+from Modulos.matrices import racional
+# Analizador de sistemas de ecuaciones escritos como texto
+from Modulos.matrices import analizador_sistemas
+# Métodos iterativos (CG, GMRES, Jacobi, Gauss-Seidel) y mínimos cuadrados
+from Modulos.matrices import iterativos
+# Descomposiciones LU, QR, Cholesky y SVD con factores reutilizables
+from Modulos.matrices import descomposiciones
+
+# Ejecutor compartido para que los sistemas grandes se resuelvan sin congelar la ventana
+from utils.tareas import obtener_ejecutor, BarraTarea
 
 from utils.helpers import resource_path
+# Modelo de tabla virtualizado para mostrar matrices grandes sin un widget por celda
+from utils.modelo_matriz import ModeloMatriz
+# Editor de matrices virtualizado (compartido con vectores propios y cadenas de Markov)
+from utils.editor_matriz import EditorMatriz
+
+# Tarjetas sin imagen propia: usan la del menú de matrices
+IMAGENES = {"Descomposiciones": "Matrices"}
+
 # Implementar operaciones básicas y avanzadas con matrices, incluyendo suma,
 # resta, multiplicación, determinantes, inversas y resolución de sistemas lineales.
 class MenuMatrices(QWidget):
@@ -59,6 +82,7 @@ class MenuMatrices(QWidget):
             ("Inversa", self.abrir_inversa),
             ("Determinante", self.abrir_determinante),
             ("Sistemas Lineales", self.abrir_Sistemas_Lineales),
+            ("Descomposiciones", self.abrir_descomposiciones),
         ]
 
         # Organizar las operaciones en un layout de 3 columnas
@@ -93,7 +117,7 @@ class MenuMatrices(QWidget):
 
         # Imagen correspondiente al módulo
         imagen_label = QLabel()
-        ruta_imagen = resource_path(f"images/{texto.lower()}.png")
+        ruta_imagen = resource_path(f"images/{IMAGENES.get(texto, texto).lower()}.png")
         pixmap = QPixmap(ruta_imagen).scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
         imagen_label.setPixmap(pixmap)
@@ -194,6 +218,11 @@ class MenuMatrices(QWidget):
         self.ecuaciones.show()
         self.close()
 
+    def abrir_descomposiciones(self):
+        self.ventana = CalculadoraDescomposiciones()
+        self.ventana.show()
+        self.close()
+
     def abrir_operacion(self, operacion):
         self.ventana = CalculadoraMatrices(operacion)
         self.ventana.show()
@@ -204,6 +233,10 @@ class MenuMatrices(QWidget):
         self.menu.show()
         self.close()
 
+# Operaciones de la calculadora que trabajan con una sola matriz (A)
+OPERACIONES_UNA_MATRIZ = motor_matrices.OPERACIONES_UNARIAS + ["Descomposiciones"]
+
+
 class CalculadoraMatrices(QWidget):
     # Constructor de la clase, se ejecuta cuando se crea la ventana
     def __init__(self, operacion):
@@ -223,7 +256,7 @@ class CalculadoraMatrices(QWidget):
         self.dim_layout = QGridLayout()
         self.inputs = {}  # Diccionario para guardar los campos de entrada
         etiquetas = ["Filas A", "Columnas A"]  # Etiquetas para la primera matriz
-        if self.operacion not in ["Inversa", "Determinante"]:
+        if self.operacion not in OPERACIONES_UNA_MATRIZ:
             etiquetas += ["Filas B", "Columnas B"]  # Si se necesita una segunda matriz
 
         # Crea los campos de entrada para las dimensiones
@@ -241,6 +274,37 @@ class CalculadoraMatrices(QWidget):
         self.boton_crear.clicked.connect(self.crear_matrices)
         self.layout.addWidget(self.boton_crear)
 
+        # Modo de matrices grandes: las matrices se cargan desde archivos (CSV, .npy o Matrix Market)
+        # en lugar de escribirse celda por celda
+        self.matrices_cargadas = {}  # Matrices cargadas desde archivo ("A" y/o "B")
+        self.editores = {}  # Editores de las matrices A y B (se crean con "Crear matrices")
+        archivos_layout = QHBoxLayout()
+        self.nombres_matrices = ["A"] if self.operacion in OPERACIONES_UNA_MATRIZ else ["A", "B"]
+        for nombre in self.nombres_matrices:
+            boton_cargar = QPushButton(f"Cargar {nombre} desde archivo")
+            boton_cargar.clicked.connect(lambda _, n=nombre: self.cargar_desde_archivo(n))
+            archivos_layout.addWidget(boton_cargar)
+        # Productos más grandes que la RAM: A y B se leen por bloques desde archivos .npy
+        if self.operacion == "Multiplicar":
+            boton_bloques = QPushButton("Multiplicar .npy por bloques")
+            boton_bloques.clicked.connect(self.multiplicar_fuera_de_memoria)
+            archivos_layout.addWidget(boton_bloques)
+        # Modo por lotes: miles de matrices pequeñas en un .npz, calculadas con NumPy apilado
+        if self.operacion in motor_matrices.OPERACIONES:
+            boton_lote = QPushButton("Procesar lote .npz")
+            boton_lote.clicked.connect(self.procesar_lote)
+            archivos_layout.addWidget(boton_lote)
+        self.etiqueta_archivos = QLabel("")
+        archivos_layout.addWidget(self.etiqueta_archivos, stretch=1)
+
+        # Tipo de aritmética: exacta con fracciones, decimal con NumPy, o automática según el tamaño
+        self.selector_aritmetica = QComboBox()
+        self.selector_aritmetica.addItems(["Automática", "Exacta (fracciones)", "Decimal"])
+        if self.operacion in racional.OPERACIONES:
+            archivos_layout.addWidget(QLabel("Aritmética:"))
+            archivos_layout.addWidget(self.selector_aritmetica)
+        self.layout.addLayout(archivos_layout)
+
         # Área donde se mostrarán las matrices con scroll por si son grandes
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
@@ -264,6 +328,18 @@ class CalculadoraMatrices(QWidget):
         self.layout.addWidget(QLabel("Resultado:"))
         self.layout.addWidget(self.resultado)
 
+        # Tabla virtualizada para resultados grandes o dispersos (solo dibuja las celdas visibles)
+        self.modelo_resultado = ModeloMatriz()
+        self.tabla_resultado = QTableView()
+        self.tabla_resultado.setModel(self.modelo_resultado)
+        self.tabla_resultado.setVisible(False)
+        self.layout.addWidget(self.tabla_resultado, stretch=1)
+        self.resultado_actual = None
+
+        # Barra de progreso con botón para cancelar la multiplicación por bloques
+        self.barra_tarea = BarraTarea()
+        self.layout.addWidget(self.barra_tarea)
+
         # Botones para calcular, limpiar y volver
         botones_layout = QHBoxLayout()
         self.boton_calcular = QPushButton("Calcular")
@@ -274,11 +350,81 @@ class CalculadoraMatrices(QWidget):
         self.boton_volver = QPushButton("Volver al menú")
         self.boton_volver.clicked.connect(self.volver_al_menu)
 
+        self.boton_guardar = QPushButton("Guardar resultado")
+        self.boton_guardar.clicked.connect(self.guardar_resultado)
+        self.boton_guardar.setEnabled(False)
+
         botones_layout.addWidget(self.boton_calcular)
+        botones_layout.addWidget(self.boton_guardar)
         botones_layout.addWidget(self.boton_limpiar)
         botones_layout.addWidget(self.boton_volver)
         self.layout.addLayout(botones_layout)
 
+    # Carga la matriz A o B desde un archivo y la usa en lugar de las celdas
+    def cargar_desde_archivo(self, nombre):
+        ruta, _ = QFileDialog.getOpenFileName(
+            self, f"Cargar matriz {nombre}", "",
+            "Matrices (*.csv *.txt *.npy *.mtx);;Todos los archivos (*)"
+        )
+        if not ruta:
+            return
+        try:
+            self.matrices_cargadas[nombre] = motor_matrices.cargar_matriz(ruta)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"No se pudo cargar la matriz {nombre}:\n{e}")
+            return
+        self.actualizar_etiqueta_archivos()
+        self.boton_calcular.setEnabled(True)
+
+    def actualizar_etiqueta_archivos(self):
+        self.etiqueta_archivos.setText("   ".join(
+            f"{nombre}: {motor_matrices.describir_matriz(M)}" for nombre, M in self.matrices_cargadas.items()
+        ))
+
+    # Devuelve la matriz A o B: la cargada desde archivo o la escrita en las celdas
+    def obtener_operando(self, nombre):
+        if nombre in self.matrices_cargadas:
+            return self.matrices_cargadas[nombre]
+        editor = self.editores.get(nombre)
+        try:
+            filas = int(self.inputs[f"Filas {nombre}"].text())
+            columnas = int(self.inputs[f"Columnas {nombre}"].text())
+        except ValueError:
+            raise ValueError("Dimensiones inválidas.")
+        if editor is None or editor.forma() != (filas, columnas):
+            raise ValueError(f"Crea las celdas de la matriz {nombre} o cárgala desde un archivo.")
+        return editor.matriz()
+
+    # Muestra el resultado: texto para resultados pequeños y tabla virtualizada para los grandes
+    # "notas" se agrega debajo del resultado (por ejemplo, el diagnóstico de condicionamiento)
+    def mostrar_resultado(self, resultado, notas=None):
+        self.resultado_actual = resultado
+        es_matriz = motor_matrices.es_dispersa(resultado) or np.ndim(resultado) == 2
+        grande = es_matriz and (motor_matrices.es_dispersa(resultado) or np.size(resultado) > 400)
+        self.boton_guardar.setEnabled(es_matriz)
+        if grande:
+            self.modelo_resultado.establecer_matriz(resultado)
+            texto = f"Matriz resultado: {motor_matrices.describir_matriz(resultado)}"
+        else:
+            self.modelo_resultado.establecer_matriz(np.zeros((0, 0)))
+            texto = str(resultado)
+        self.resultado.setText(texto + (f"\n\n{notas}" if notas else ""))
+        self.tabla_resultado.setVisible(grande)
+
+    def guardar_resultado(self):
+        if self.resultado_actual is None:
+            return
+        ruta, _ = QFileDialog.getSaveFileName(
+            self, "Guardar resultado", "resultado.npy",
+            "NumPy (*.npy);;CSV (*.csv);;Matrix Market (*.mtx)"
+        )
+        if not ruta:
+            return
+        try:
+            motor_matrices.guardar_matriz(ruta, self.resultado_actual)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"No se pudo guardar el resultado:\n{e}")
+
     def crear_matrices(self):
         try:
             # Se obtienen las dimensiones desde los campos de entrada
@@ -291,22 +437,12 @@ class CalculadoraMatrices(QWidget):
             QMessageBox.warning(self, "Error", "Por favor, ingresa dimensiones válidas.")
             return
         
-        # Validador para que solo se puedan escribir fracciones o enteros
-        fraccion_valida = QRegularExpressionValidator(QRegularExpression(r"^-?\d+(\/\d+)?$"))
-
-        # Validaciones según la operación
-        if self.operacion in ["Sumar", "Restar"]:
-            if fA != fB or cA != cB:
-                QMessageBox.warning(self, "Error", "Para sumar o restar, las matrices deben tener la misma dimensión.")
-                return
-        elif self.operacion == "Multiplicar":
-            if cA != fB:
-                QMessageBox.warning(self, "Error", "Para multiplicar, las columnas de A deben ser iguales a las filas de B.")
-                return
-        elif self.operacion in ["Inversa", "Determinante"]:
-            if fA != cA:
-                QMessageBox.warning(self, "Error", "La matriz debe ser cuadrada.")
-                return
+        # Validaciones según la operación (las reglas viven en el motor de matrices)
+        try:
+            motor_matrices.validar_dimensiones(self.operacion, (fA, cA), (fB, cB))
+        except ValueError as ve:
+            QMessageBox.warning(self, "Error", str(ve))
+            return
 
         # Limpia cualquier matriz creada anteriormente
         for i in reversed(range(self.grid_layout.count())):
@@ -314,101 +450,89 @@ class CalculadoraMatrices(QWidget):
             if widget:
                 widget.setParent(None)
 
-        self.entradas_m1 = []  # Lista para guardar entradas de la matriz A
-        self.entradas_m2 = []  # Lista para guardar entradas de la matriz B
-
-        # Crear la matriz A
-        group_a = QGroupBox("Matriz A")
-        grid_a = QGridLayout()
-        grid_a.setSpacing(0)
-        group_a.setLayout(grid_a)
-
-        for i in range(fA):
-            fila = []
-            for j in range(cA):
-                celda = QLineEdit("0")
-                celda.setFixedSize(140, 72)
-                celda.setAlignment(Qt.AlignCenter)
-                celda.setValidator(fraccion_valida)  
-                grid_a.addWidget(celda, i, j)
-                fila.append(celda)
-            self.entradas_m1.append(fila)
-
-        self.grid_layout.addWidget(group_a)
-
-        # Crear matriz B si la operación lo requiere
-        if self.operacion not in ["Inversa", "Determinante"]:
-            group_b = QGroupBox("Matriz B")
-            grid_b = QGridLayout()
-            grid_b.setSpacing(0)
-            group_b.setLayout(grid_b)
-
-            for i in range(fB):
-                fila = []
-                for j in range(cB):
-                    celda = QLineEdit("0")
-                    celda.setFixedSize(140, 72)
-                    celda.setAlignment(Qt.AlignCenter)
-                    celda.setValidator(fraccion_valida)  
-                    grid_b.addWidget(celda, i, j)
-                    fila.append(celda)
-                self.entradas_m2.append(fila)
-
-            self.grid_layout.addSpacing(30)  # Espacio entre matrices
-            self.grid_layout.addWidget(group_b)
+        # Un editor virtualizado por matriz (acepta enteros, decimales y fracciones, pegar y rellenar)
+        dimensiones = {"A": (fA, cA), "B": (fB, cB)}
+        self.editores = {}
+        for nombre in self.nombres_matrices:
+            grupo = QGroupBox(f"Matriz {nombre}")
+            layout_grupo = QVBoxLayout(grupo)
+            editor = EditorMatriz(*dimensiones[nombre])
+            editor.setMinimumHeight(260)
+            layout_grupo.addWidget(editor)
+            self.editores[nombre] = editor
+            self.grid_layout.addWidget(grupo)
         self.boton_calcular.setEnabled(True)
 
-
-    def obtener_matriz(self, entradas, filas, columnas):
-        # Convierte los valores de las celdas en una matriz numérica
-        matriz = []
-        for i in range(filas):
-            fila = []
-            for j in range(columnas):
-                texto = entradas[i][j].text()
-                try:
-                    # Si es fracción, la convierte
-                    if "/" in texto:
-                        num, den = texto.split("/")
-                        fila.append(float(num) / float(den))
-                    else:
-                        fila.append(float(texto))  # Convierte a número decimal
-                except:
-                    fila.append(0.0)  # Si hay error, coloca 0
-            matriz.append(fila)
-        return np.array(matriz)  # Convierte a matriz de NumPy
+    # Convierte los valores de la matriz A o B en una matriz de fracciones exactas
+    def obtener_matriz_exacta(self, nombre):
+        return self.editores[nombre].matriz_exacta()
+
+    # Decide si se usa la aritmética exacta: nunca con matrices cargadas desde archivo
+    # y, en modo automático, solo para matrices pequeñas
+    def usar_exacto(self, M1):
+        modo = self.selector_aritmetica.currentText()
+        if self.matrices_cargadas or modo == "Decimal":
+            return False
+        if modo == "Exacta (fracciones)":
+            return True
+        return racional.usar_exacto(max(M1.shape))
+
+    # Calcula con fracciones y compara el tiempo con la ruta de punto flotante
+    def calcular_exacto(self, M1, M2):
+        A = self.obtener_matriz_exacta("A")
+        B = self.obtener_matriz_exacta("B") if M2 is not None else None
+        resultado, tiempo_exacto = racional.cronometrar(racional.calcular, self.operacion, A, B)
+        try:
+            _, tiempo_flotante = racional.cronometrar(motor_matrices.calcular, self.operacion, M1, M2)
+        except (ValueError, LinAlgError):
+            tiempo_flotante = float("nan")
+
+        if self.operacion == "Determinante":
+            if resultado == 0:
+                raise ValueError(f"⚠️ Advertencia:\nLa matriz no tiene inversa porque su determinante es 0.")
+            texto = racional.formatear_fraccion(resultado)
+            if resultado.denominator != 1:
+                texto += f"  (≈ {float(resultado):.6g})"
+        else:
+            texto = racional.formatear_matriz(resultado)
+        # El resultado exacto se guarda en archivo como decimales
+        self.resultado_actual = None if self.operacion == "Determinante" else np.array(resultado, dtype=float)
+        self.boton_guardar.setEnabled(self.resultado_actual is not None)
+        self.tabla_resultado.setVisible(False)
+        self.resultado.setText(texto + "\n\n" + racional.comparar_tiempos(tiempo_exacto, tiempo_flotante))
 
     def calcular(self):
         try:
-            # Obtiene nuevamente las dimensiones
-            fA = int(self.inputs["Filas A"].text())
-            cA = int(self.inputs["Columnas A"].text())
-            fB = int(self.inputs.get("Filas B", QLineEdit()).text() or 0)
-            cB = int(self.inputs.get("Columnas B", QLineEdit()).text() or 0)
-        except:
-            QMessageBox.warning(self, "Error", "Dimensiones inválidas.")
+            # Obtiene las matrices en forma numérica (desde archivo o desde las celdas)
+            M1 = self.obtener_operando("A")
+            M2 = self.obtener_operando("B") if "B" in self.nombres_matrices else None
+        except ValueError as ve:
+            QMessageBox.warning(self, "Error", str(ve))
             return
 
-        # Obtiene las matrices en forma numérica
-        M1 = self.obtener_matriz(self.entradas_m1, fA, cA)
-        M2 = self.obtener_matriz(self.entradas_m2, fB, cB) if self.operacion not in ["Inversa", "Determinante"] else None
-
         try:
-            # Realiza la operación seleccionada
-            if self.operacion == "Sumar":
-                resultado = M1 + M2
-            elif self.operacion == "Restar":
-                resultado = M1 - M2
-            elif self.operacion == "Multiplicar":
-                resultado = np.dot(M1, M2)
-            elif self.operacion == "Inversa":
-                if np.isclose(det(M1), 0):
-                    raise ValueError("La matriz no tiene inversa porque su determinante es 0.")
-                resultado = inv(M1)
-            elif self.operacion == "Determinante":
-                if np.isclose(det(M1), 0):
+            if self.usar_exacto(M1):
+                self.calcular_exacto(M1, M2)
+                return
+            notas = None
+            if self.operacion in motor_matrices.OPERACIONES_UNARIAS and not motor_matrices.es_dispersa(M1):
+                # Una sola factorización da el determinante, la inversa, el rango y el condicionamiento
+                diagnostico = motor_matrices.diagnosticar(M1, calcular_inversa=self.operacion == "Inversa")
+                if diagnostico["singular"]:
+                    raise ValueError(f"⚠️ Advertencia:\nLa matriz no tiene inversa porque su determinante es 0.\n"
+                                     f"{motor_matrices.formatear_diagnostico(diagnostico)}")
+                resultado = diagnostico["inversa"] if self.operacion == "Inversa" else diagnostico["determinante"]
+                notas = motor_matrices.formatear_diagnostico(diagnostico)
+                if resultado is None:
+                    raise ValueError(motor_matrices.formatear_determinante_fuera_de_rango(*diagnostico["log_determinante"]))
+            else:
+                # Realiza la operación seleccionada con el motor de matrices
+                resultado = motor_matrices.calcular(self.operacion, M1, M2)
+            if self.operacion == "Determinante":
+                if np.isclose(resultado, 0) and notas is None:
                     raise ValueError(f"⚠️ Advertencia:\nLa matriz no tiene inversa porque su determinante es 0.")
-                resultado = round(det(M1),2)
+                # Dos decimales, salvo en determinantes pequeños (de una matriz no singular) que se verían como 0
+                resultado = round(resultado, 2) if abs(resultado) >= 0.01 else float(f"{resultado:.4g}")
         
         # Manejadores de errores
         except LinAlgError:
@@ -422,24 +546,197 @@ class CalculadoraMatrices(QWidget):
             return
 
         # Muestra el resultado en pantalla
-        self.resultado.setText(str(resultado))
+        self.mostrar_resultado(resultado, notas)
 
     def limpiar_campos(self):
         # Limpia las celdas de ambas matrices
-        for fila in getattr(self, 'entradas_m1', []):
-            for celda in fila:
-                celda.setText("0")
-        for fila in getattr(self, 'entradas_m2', []):
-            for celda in fila:
-                celda.setText("0")
+        for editor in self.editores.values():
+            editor.modelo.rellenar("0")
         self.resultado.clear()  # Borra el resultado
+        # Olvida las matrices cargadas desde archivo y el resultado anterior
+        self.matrices_cargadas.clear()
+        self.actualizar_etiqueta_archivos()
+        self.mostrar_resultado(None)
+        self.resultado.clear()
+
+    # Multiplica dos matrices guardadas en .npy sin cargarlas completas en memoria
+    def multiplicar_fuera_de_memoria(self):
+        ruta_a, _ = QFileDialog.getOpenFileName(self, "Matriz A (.npy)", "", "NumPy (*.npy)")
+        if not ruta_a:
+            return
+        ruta_b, _ = QFileDialog.getOpenFileName(self, "Matriz B (.npy)", "", "NumPy (*.npy)")
+        if not ruta_b:
+            return
+        ruta_salida, _ = QFileDialog.getSaveFileName(self, "Guardar producto", "producto.npy", "NumPy (*.npy)")
+        if not ruta_salida:
+            return
+        if os.path.abspath(ruta_salida) in (os.path.abspath(ruta_a), os.path.abspath(ruta_b)):
+            QMessageBox.warning(self, "Error", "El producto no puede guardarse sobre uno de los archivos de entrada.")
+            return
+
+        self.boton_calcular.setEnabled(False)
+        self.resultado.setText("Multiplicando por bloques...")
+        tarea = obtener_ejecutor().ejecutar(
+            motor_matrices.multiplicar_por_bloques, ruta_a, ruta_b, ruta_salida,
+            al_resultado=self.mostrar_producto_por_bloques,
+            al_error=lambda e: self.resultado.setText(f"No se pudo multiplicar por bloques:\n{e}"),
+            al_cancelar=lambda: self.resultado.setText("Multiplicación cancelada."),
+            al_terminar=lambda: self.boton_calcular.setEnabled(True),
+        )
+        self.barra_tarea.seguir(tarea)
+
+    def mostrar_producto_por_bloques(self, informe):
+        # La tabla lee el resultado directamente del archivo, solo las celdas visibles
+        producto = np.load(informe["ruta"], mmap_mode="r")
+        self.resultado_actual = producto
+        self.modelo_resultado.establecer_matriz(producto)
+        self.tabla_resultado.setVisible(True)
+        self.boton_guardar.setEnabled(True)
+        filas, columnas = informe["forma"]
+        bloque = informe["bloque"]
+        self.resultado.setText(
+            f"Producto guardado en {informe['ruta']} ({filas}×{columnas}).\n"
+            f"Bloques de {bloque}×{bloque} | tiempo: {informe['segundos']:.2f} s | "
+            f"rendimiento: {informe['gflops']:.2f} GFLOP/s"
+        )
+
+    # Calcula la operación sobre todas las matrices de un .npz (pila "A" y, si hace falta, "B")
+    def procesar_lote(self):
+        ruta_entrada, _ = QFileDialog.getOpenFileName(self, "Lote de matrices (.npz)", "", "NumPy (*.npz)")
+        if not ruta_entrada:
+            return
+        ruta_salida, _ = QFileDialog.getSaveFileName(self, "Guardar resultados", "resultados.npz", "NumPy (*.npz)")
+        if not ruta_salida:
+            return
+        if os.path.abspath(ruta_salida) == os.path.abspath(ruta_entrada):
+            QMessageBox.warning(self, "Error", "Los resultados no pueden guardarse sobre el archivo de entrada.")
+            return
+
+        self.boton_calcular.setEnabled(False)
+        self.resultado.setText("Procesando el lote...")
+        tarea = obtener_ejecutor().ejecutar(
+            motor_matrices.procesar_lote, ruta_entrada, self.operacion, ruta_salida,
+            al_resultado=self.mostrar_lote,
+            al_error=lambda e: self.resultado.setText(f"No se pudo procesar el lote:\n{e}"),
+            al_cancelar=lambda: self.resultado.setText("Lote cancelado."),
+            al_terminar=lambda: self.boton_calcular.setEnabled(bool(self.editores or self.matrices_cargadas)),
+        )
+        self.barra_tarea.seguir(tarea)
+
+    def mostrar_lote(self, informe, vista_previa=3):
+        self.resultado_actual = None
+        self.boton_guardar.setEnabled(False)
+        self.tabla_resultado.setVisible(False)
+        filas, columnas = informe["forma"]
+        lineas = [
+            f"{informe['cantidad']} matrices de {filas}×{columnas} guardadas en {informe['ruta']}.",
+            f"Tiempo: {informe['segundos'] * 1000:.2f} ms | {informe['por_segundo']:,.0f} matrices por segundo",
+        ]
+        if informe["invalidas"]:
+            lineas.append(f"⚠️ {informe['invalidas']} matrices no tienen inversa (marcadas en \"validas\").")
+        lineas.append("\nPrimeros resultados:")
+        for i, valor in enumerate(informe["resultado"][:vista_previa]):
+            lineas.append(f"[{i}]\n{valor}")
+        self.resultado.setText("\n".join(lineas))
 
     def volver_al_menu(self):
-        # Cierra la ventana actual y vuelve al menú principal
+        # Cancela el cálculo en curso, cierra la ventana actual y vuelve al menú principal
+        self.barra_tarea.cancelar()
         self.menu = MenuMatrices()
         self.menu.show()
         self.close()
 
+# Descomposiciones LU, QR, Cholesky y SVD. Usa la misma entrada que las demás operaciones (celdas
+# o archivo) y guarda los factores en la caché de la sesión: la inversa, el rango, la pseudoinversa
+# o Sistemas Lineales con la misma matriz reutilizan esos factores
+class CalculadoraDescomposiciones(CalculadoraMatrices):
+    def __init__(self):
+        super().__init__("Descomposiciones")
+        self.factores = []
+
+        opciones_layout = QHBoxLayout()
+        opciones_layout.addWidget(QLabel("Descomposición:"))
+        self.selector_descomposicion = QComboBox()
+        self.selector_descomposicion.addItems(descomposiciones.DESCOMPOSICIONES)
+        opciones_layout.addWidget(self.selector_descomposicion)
+
+        # Cada factor se ve por separado (texto o tabla, según su tamaño) y se puede guardar
+        opciones_layout.addWidget(QLabel("Ver factor:"))
+        self.selector_factor = QComboBox()
+        self.selector_factor.currentIndexChanged.connect(self.mostrar_factor)
+        opciones_layout.addWidget(self.selector_factor)
+        opciones_layout.addStretch(1)
+
+        # Operaciones que reutilizan los factores guardados
+        for texto in ["Inversa", "Rango", "Pseudoinversa", "Condición"]:
+            boton = QPushButton(texto)
+            boton.clicked.connect(lambda _, t=texto: self.calcular_derivada(t))
+            opciones_layout.addWidget(boton)
+        self.layout.insertLayout(self.layout.indexOf(self.scroll_area), opciones_layout)
+
+    # Texto que indica si la última operación encontró los factores en la caché
+    def nota_cache(self, aciertos):
+        if motor_matrices.obtener_cache().aciertos > aciertos:
+            return "♻️ Se reutilizaron factores guardados en la caché de la sesión."
+        return "Factores calculados y guardados en la caché de la sesión."
+
+    def calcular(self):
+        try:
+            A = self.obtener_operando("A")
+            aciertos = motor_matrices.obtener_cache().aciertos
+            tipo = self.selector_descomposicion.currentText()
+            self.factores = descomposiciones.descomponer(A, tipo)
+            error = descomposiciones.error_reconstruccion(A, self.factores)
+        except ValueError as ve:
+            QMessageBox.critical(self, "Error", str(ve))
+            return
+        self.notas_factores = f"Error relativo de reconstrucción: {error:.2e}\n{self.nota_cache(aciertos)}"
+
+        self.selector_factor.blockSignals(True)
+        self.selector_factor.clear()
+        self.selector_factor.addItems([nombre for nombre, _ in self.factores])
+        self.selector_factor.blockSignals(False)
+        self.mostrar_factor(0)
+
+    def mostrar_factor(self, indice):
+        if not 0 <= indice < len(self.factores):
+            return
+        nombre, factor = self.factores[indice]
+        tipo = self.selector_descomposicion.currentText()
+        formula = {"LU": "A = P·L·U", "QR": "A = Q·R", "Cholesky": "A = L·Lᵀ", "SVD": "A = U·Σ·Vᵀ"}[tipo]
+        self.mostrar_resultado(factor, f"{formula} | factor {nombre}\n{self.notas_factores}")
+        # El primer renglón del texto dice qué factor se está viendo
+        self.resultado.setText(f"{nombre} =\n{self.resultado.toPlainText()}")
+
+    def calcular_derivada(self, operacion):
+        try:
+            A = self.obtener_operando("A")
+            aciertos = motor_matrices.obtener_cache().aciertos
+            if operacion == "Inversa":
+                resultado = descomposiciones.inversa(A)
+            elif operacion == "Pseudoinversa":
+                resultado = descomposiciones.pseudoinversa(A)
+            elif operacion == "Rango":
+                resultado = descomposiciones.rango(A)
+            else:
+                resultado = descomposiciones.condicion(A)
+        except ValueError as ve:
+            QMessageBox.critical(self, "Error", str(ve))
+            return
+        nota = self.nota_cache(aciertos)
+        if np.ndim(resultado) == 2:
+            self.mostrar_resultado(resultado, nota)
+        else:
+            self.mostrar_resultado(None)
+            texto = f"{resultado}" if operacion == "Rango" else f"{resultado:.6g} (norma 2)"
+            self.resultado.setText(f"{operacion}: {texto}\n\n{nota}")
+
+    def limpiar_campos(self):
+        super().limpiar_campos()
+        self.factores = []
+        self.selector_factor.clear()
+
+
 # Función que limpia un número en texto (quita espacios y corrige signos)
 def limpiar_numero(texto):
     texto = texto.strip()
@@ -461,7 +758,12 @@ class SistemasLineales(QWidget):
         self.setLayout(layout)
 
         # Texto de instrucciones para el usuario
-        self.instrucciones = QLabel("Escribe un sistema de ecuaciones lineales (una por línea):")
+        self.instrucciones = QLabel(
+            "Escribe un sistema de ecuaciones lineales (una por línea).\n"
+            "Las variables pueden tener varias letras o números (x1, vel) y los coeficientes pueden ser fracciones (3/4x)\n"
+            "e ir antes o después de la variable (2*x, x*2, x/2).\n"
+            "Para resolver con varios lados derechos a la vez, sepáralos con ';' (por ejemplo: x + y = 3; 5; 1/2)"
+        )
         layout.addWidget(self.instrucciones)
 
         # Editor de texto donde se escriben las ecuaciones
@@ -476,13 +778,61 @@ class SistemasLineales(QWidget):
         self.boton_resolver.clicked.connect(self.resolver)
         layout.addWidget(self.boton_resolver)
 
+        # Sistemas grandes: A (densa o dispersa) y B se cargan desde archivos en lugar de escribirse
+        self.boton_archivos = QPushButton("Cargar A y B desde archivos")
+        self.boton_archivos.clicked.connect(self.resolver_desde_archivos)
+        layout.addWidget(self.boton_archivos)
+
+        # Tipo de aritmética: exacta con fracciones, decimal con NumPy, o automática según el tamaño
+        aritmetica_layout = QHBoxLayout()
+        aritmetica_layout.addWidget(QLabel("Aritmética:"))
+        self.selector_aritmetica = QComboBox()
+        self.selector_aritmetica.addItems(["Automática", "Exacta (fracciones)", "Decimal"])
+        aritmetica_layout.addWidget(self.selector_aritmetica)
+
+        # Método de solución; los iterativos usan precondicionador, tolerancia y máximo de iteraciones
+        aritmetica_layout.addWidget(QLabel("Método:"))
+        self.selector_metodo = QComboBox()
+        self.selector_metodo.addItems(iterativos.METODOS)
+        self.selector_metodo.currentTextChanged.connect(self.actualizar_opciones_metodo)
+        aritmetica_layout.addWidget(self.selector_metodo)
+
+        aritmetica_layout.addWidget(QLabel("Precondicionador:"))
+        self.selector_precondicionador = QComboBox()
+        self.selector_precondicionador.addItems(iterativos.PRECONDICIONADORES)
+        aritmetica_layout.addWidget(self.selector_precondicionador)
+
+        aritmetica_layout.addWidget(QLabel("Tolerancia:"))
+        self.entrada_tolerancia = QLineEdit("1e-8")
+        self.entrada_tolerancia.setFixedWidth(80)
+        aritmetica_layout.addWidget(self.entrada_tolerancia)
+
+        aritmetica_layout.addWidget(QLabel("Máx. iteraciones:"))
+        self.entrada_iteraciones = QSpinBox()
+        self.entrada_iteraciones.setRange(1, 1_000_000)
+        self.entrada_iteraciones.setValue(1000)
+        aritmetica_layout.addWidget(self.entrada_iteraciones)
+        aritmetica_layout.addStretch()
+        layout.addLayout(aritmetica_layout)
+        self.actualizar_opciones_metodo(self.selector_metodo.currentText())
+
+        # Barra de progreso con botón para cancelar los métodos iterativos
+        self.barra_tarea = BarraTarea()
+        layout.addWidget(self.barra_tarea)
+
         # Etiqueta para mostrar el resultado
         layout.addWidget(QLabel("Resultado:"))
 
-        # Área de texto donde se muestra el resultado
+        # Área de texto donde se muestra el resultado y, a su lado, la gráfica de convergencia
+        resultado_layout = QHBoxLayout()
         self.resultado = QTextEdit()
         self.resultado.setReadOnly(True)
-        layout.addWidget(self.resultado)
+        resultado_layout.addWidget(self.resultado)
+
+        # La gráfica de convergencia (matplotlib) se crea la primera vez que hace falta
+        self.resultado_layout = resultado_layout
+        self.figura = self.canvas = None
+        layout.addLayout(resultado_layout)
 
         # Layout horizontal para los botones extra
         botones_extras = QHBoxLayout()
@@ -500,67 +850,56 @@ class SistemasLineales(QWidget):
         # Añadimos los botones al layout principal
         layout.addLayout(botones_extras)
 
+    # Figura de matplotlib para graficar la convergencia de los métodos iterativos. Se importa aquí
+    # y no al cargar el módulo, para que abrir la ventana de matrices no cargue matplotlib
+    def grafica_convergencia(self):
+        if self.canvas is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+            self.figura = Figure(figsize=(4, 3), dpi=100)
+            self.canvas = FigureCanvas(self.figura)
+            self.resultado_layout.addWidget(self.canvas)
+        return self.figura, self.canvas
+
+    def ocultar_convergencia(self):
+        if self.canvas is not None:
+            self.canvas.setVisible(False)
+
     def limpiar_campos(self):
         # Limpia tanto el área de ecuaciones como el resultado
         self.editor_ecuaciones.clear()
         self.resultado.clear()
-        
+        self.ocultar_convergencia()
+
+    # Las opciones de los métodos iterativos solo se habilitan cuando aplican
+    def actualizar_opciones_metodo(self, metodo):
+        self.selector_precondicionador.setEnabled(metodo in iterativos.METODOS_PRECONDICIONADOS)
+        self.entrada_tolerancia.setEnabled(metodo != "Directo (LU)")
+        self.entrada_iteraciones.setEnabled(metodo != "Directo (LU)")
+        # La aritmética exacta solo existe para la solución directa
+        self.selector_aritmetica.setEnabled(metodo == "Directo (LU)")
+
     def volver_al_menu(self):
-        # Cierra esta ventana y vuelve al menú principal
+        # Cancela el cálculo en curso, cierra esta ventana y vuelve al menú principal
+        self.barra_tarea.cancelar()
         self.menu = MenuMatrices()
         self.menu.show()
         self.close()
 
-    def analizar_sistema(self, texto):
+    def analizar_sistema(self, texto, exacto=False):
         # Convierte el texto del sistema en matrices A y B y extrae las variables
-        lineas = texto.strip().split('\n')  # Separa línea por línea
-        variables = sorted(list(set(re.findall(r'[a-zA-Z]', texto))))  # Detecta todas las letras (variables)
-        A = []
-        B = []
-
-        for linea in lineas:
-            coeficientes = [0] * len(variables)
-
-            izquierda, derecha = linea.split('=')  # Divide en izquierda y derecha del igual
-            izquierda = izquierda.replace(' ', '')  # Elimina espacios
-
-            # Encuentra todos los términos con variable en la izquierda
-            terminos = re.findall(r'[\+\-]?\d*\.?\d*[a-zA-Z]|\d+/\d+', izquierda)
-
-            for termino in terminos:
-                match = re.match(r'([\+\-]?\d*\.?\d*)([a-zA-Z])', termino)
-                if match:
-                    coef_str, var = match.groups()
-                    if coef_str in ['', '+', '-']:
-                        coef_str += '1'  # Si el coeficiente es vacío, + o -, asumimos 1 o -1
-                    coef = self.convertir_fraccion_a_decimal(coef_str)
-                    idx = variables.index(var)
-                    coeficientes[idx] = coef  # Se asigna el coeficiente a la variable correspondiente
-
-            A.append(coeficientes)  # Agrega la fila a la matriz A
-            B.append(float(derecha.strip()))  # Agrega el valor independiente a B
-        
-        return np.array(A), np.array(B), variables
-
-    def convertir_fraccion_a_decimal(self, texto):
-        # Convierte un texto que puede ser fracción o número decimal a float
-        if '/' in texto:
-            num, den = texto.split('/')
-            return float(num) / float(den)
-        else:
-            return float(texto)
+        # (con exacto=True los coeficientes se guardan como fracciones sin redondeo)
+        return analizador_sistemas.analizar(texto, exacto=exacto)
 
     def resolver_sistema(self, A, B):
         try:
-            # Verificamos que A sea cuadrada
-            if A.shape[0] != A.shape[1]:
-                return "Error: La matriz A no es cuadrada."
-            # Verificamos que A y B tengan el mismo número de filas
-            if A.shape[0] != B.shape[0]:
-                return "Error: Dimensiones incompatibles entre A y B."
-            # Se resuelve el sistema de ecuaciones Ax = B
-            x = np.linalg.solve(A, B)
+            # Se resuelve el sistema de ecuaciones Ax = B (LU dispersa si A es dispersa)
+            x = motor_matrices.resolver(A, B)
             return x
+        except ValueError as e:
+            # A no es cuadrada o sus dimensiones no coinciden con B
+            return f"Error: {e}"
         except np.linalg.LinAlgError as e:
             # Error típico de matrices no invertibles
             return f"Error al resolver el sistema: {e}"
@@ -574,17 +913,170 @@ class SistemasLineales(QWidget):
         if not texto.strip():
             QMessageBox.warning(self, "Advertencia", "Por favor escribe un sistema de ecuaciones.")
             return
+        self.ocultar_convergencia()
 
         try:
             A, B, variables = self.analizar_sistema(texto)  # Analiza el texto y genera matrices
+            # Métodos iterativos, mínimos cuadrados o sistema no cuadrado
+            if self.selector_metodo.currentText() != "Directo (LU)" or A.shape[0] != A.shape[1]:
+                self.resolver_con_metodo(A, B, variables)
+                return
+            if self.usar_exacto(len(variables)):
+                # Sistema pequeño: se vuelve a leer con coeficientes exactos (fracciones)
+                A_exacta, B_exacta, _ = self.analizar_sistema(texto, exacto=True)
+                self.resolver_exacto(A_exacta, B_exacta, A, B, variables)
+                return
+            aciertos = motor_matrices.obtener_cache().aciertos
             resultado = self.resolver_sistema(A, B)  # Resuelve el sistema
 
             if isinstance(resultado, str):
                 # Si el resultado es un mensaje de error
                 self.resultado.setText(resultado)
             else:
-                # Muestra cada variable con su valor redondeado
-                texto_resultado = "\n".join(f"{var} = {round(valor, 2)}" for var, valor in zip(variables, resultado))
+                # Muestra cada variable con su valor redondeado (una columna por lado derecho)
+                texto_resultado = "\n".join(
+                    f"{var} = {self.unir_valores(valor, lambda v: str(round(v, 2)))}"
+                    for var, valor in zip(variables, resultado)
+                )
+                if motor_matrices.obtener_cache().aciertos > aciertos:
+                    texto_resultado += "\n\nSe reutilizó la factorización de A guardada en caché."
                 self.resultado.setText(texto_resultado)
+        except ValueError as e:
+            # El analizador indica qué ecuación está mal escrita
+            QMessageBox.critical(self, "Error", f"Ocurrió un error al analizar el sistema:\n{e}")
         except Exception:
             QMessageBox.critical(self, "Error", f"Ocurrió un error al analizar el sistema:\nIngrese bien el Sistema de Ecuaciones.")
+
+    # Valor de una variable; con varios lados derechos se muestran todos separados por " | "
+    def unir_valores(self, valor, formatear):
+        if isinstance(valor, (list, tuple, np.ndarray)):
+            return " | ".join(formatear(v) for v in valor)
+        return formatear(valor)
+
+    def formatear_exacto(self, valor):
+        texto = racional.formatear_fraccion(valor)
+        if valor.denominator != 1:
+            texto += f"  (≈ {float(valor):.6g})"
+        return texto
+
+    def usar_exacto(self, n):
+        modo = self.selector_aritmetica.currentText()
+        if modo == "Decimal":
+            return False
+        return modo == "Exacta (fracciones)" or racional.usar_exacto(n)
+
+    # Resuelve con fracciones exactas y compara el tiempo con la ruta de punto flotante
+    def resolver_exacto(self, A_exacta, B_exacta, A, B, variables):
+        if any(len(fila) != len(B_exacta) for fila in A_exacta):
+            self.resultado.setText("Error: La matriz A no es cuadrada.")
+            return
+        try:
+            solucion, tiempo_exacto = racional.cronometrar(racional.resolver, A_exacta, B_exacta)
+        except ValueError as e:
+            self.resultado.setText(f"Error al resolver el sistema: {e}")
+            return
+        _, tiempo_flotante = racional.cronometrar(self.resolver_sistema, A, B)
+        lineas = [
+            f"{var} = {self.unir_valores(valor, self.formatear_exacto)}" for var, valor in zip(variables, solucion)
+        ]
+        lineas.append("")
+        lineas.append(racional.comparar_tiempos(tiempo_exacto, tiempo_flotante))
+        self.resultado.setText("\n".join(lineas))
+
+    # Resuelve un sistema cuyas matrices A y B están guardadas en archivos (CSV, .npy o .mtx)
+    def resolver_desde_archivos(self):
+        filtro = "Matrices (*.csv *.txt *.npy *.mtx);;Todos los archivos (*)"
+        ruta_a, _ = QFileDialog.getOpenFileName(self, "Cargar matriz A", "", filtro)
+        if not ruta_a:
+            return
+        ruta_b, _ = QFileDialog.getOpenFileName(self, "Cargar vector B", "", filtro)
+        if not ruta_b:
+            return
+        self.ocultar_convergencia()
+        try:
+            A = motor_matrices.cargar_matriz(ruta_a)
+            B = motor_matrices.cargar_matriz(ruta_b)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"No se pudieron cargar los archivos:\n{e}")
+            return
+        # B puede venir como fila o columna (un vector) o como matriz con un lado derecho por columna
+        B = B.toarray() if motor_matrices.es_dispersa(B) else B
+        if 1 in B.shape:
+            B = B.ravel()
+        if self.selector_metodo.currentText() != "Directo (LU)" or A.shape[0] != A.shape[1]:
+            self.resolver_con_metodo(A, B, None, motor_matrices.describir_matriz(A))
+            return
+        resultado = self.resolver_sistema(A, B)
+        if isinstance(resultado, str):
+            self.resultado.setText(resultado)
+            return
+        self.resultado.setText(self.formatear_solucion(resultado, motor_matrices.describir_matriz(A)))
+
+    # Resuelve con el método elegido en segundo plano (los sistemas grandes pueden tardar)
+    def resolver_con_metodo(self, A, B, variables, descripcion=None):
+        try:
+            tolerancia = float(self.entrada_tolerancia.text())
+        except ValueError:
+            QMessageBox.warning(self, "Advertencia", "La tolerancia debe ser un número (por ejemplo 1e-8).")
+            return
+        self.boton_resolver.setEnabled(False)
+        self.boton_archivos.setEnabled(False)
+        tarea = obtener_ejecutor().ejecutar(
+            iterativos.resolver, A, B,
+            self.selector_metodo.currentText(),
+            self.selector_precondicionador.currentText(),
+            tolerancia,
+            self.entrada_iteraciones.value(),
+            al_resultado=lambda informe: self.mostrar_informe(informe, variables, descripcion, tolerancia),
+            al_error=lambda e: self.resultado.setText(f"Error al resolver el sistema: {e}"),
+            al_cancelar=lambda: self.resultado.setText("Cálculo cancelado."),
+            al_terminar=self.habilitar_botones,
+        )
+        self.barra_tarea.seguir(tarea)
+
+    def habilitar_botones(self):
+        self.boton_resolver.setEnabled(True)
+        self.boton_archivos.setEnabled(True)
+
+    # Muestra la solución con el número de iteraciones y el residuo, y grafica la convergencia
+    # "tolerancia" es la ya validada al lanzar el cálculo (el campo se puede editar mientras tanto)
+    def mostrar_informe(self, informe, variables, descripcion, tolerancia):
+        lineas = [
+            f"Método: {informe['metodo']}",
+            f"Iteraciones: {informe['iteraciones']}",
+            f"Residuo relativo ||b - Ax|| / ||b||: {informe['residuo']:.3e}",
+        ]
+        if not informe["convergio"]:
+            lineas.append("⚠️ No convergió: aumenta el máximo de iteraciones, cambia de método o usa un precondicionador.")
+        lineas.append("")
+        self.resultado.setText("\n".join(lineas) + self.formatear_solucion(informe["x"], descripcion, variables=variables))
+
+        historial = informe["historial"]
+        if not historial:
+            self.ocultar_convergencia()
+            return
+        figura, canvas = self.grafica_convergencia()
+        canvas.setVisible(True)
+        figura.clear()
+        ax = figura.add_subplot(111)
+        ax.semilogy(range(1, len(historial) + 1), historial, marker="." if len(historial) < 50 else None)
+        ax.axhline(tolerancia, color="red", linestyle="--", linewidth=1)
+        ax.set_title("Convergencia")
+        ax.set_xlabel("Iteración")
+        ax.set_ylabel("Residuo relativo")
+        ax.grid(True, which="both", alpha=0.3)
+        figura.tight_layout()
+        canvas.draw()
+
+    # Texto con la solución (x1, x2, ... si no hay nombres); en sistemas muy grandes solo se muestran
+    # los primeros valores
+    def formatear_solucion(self, x, descripcion=None, limite=1000, variables=None):
+        lineas = [f"A: {descripcion}"] if descripcion else []
+        nombres = variables or [f"x{i + 1}" for i in range(min(len(x), limite))]
+        lineas += [
+            f"{nombre} = {self.unir_valores(valor, lambda v: str(round(v, 6)))}"
+            for nombre, valor in zip(nombres, x[:limite])
+        ]
+        if len(x) > limite:
+            lineas.append(f"... ({len(x) - limite} valores más)")
+        return "\n".join(lineas)
@@ -0,0 +1,600 @@
+# Motor de cálculo de matrices sin interfaz gráfica.
+# Recibe arreglos de NumPy (una matriz 2-D o una pila de matrices con forma (k, n, m))
+# y devuelve los resultados, de modo que se puede usar desde scripts y pruebas sin crear widgets.
+import hashlib
+import math
+import os
+import time
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+# De numpy, se importa la función para invertir matrices (inv) y calcular el determinante (det)
+from numpy.linalg import inv, det
+
+# Matrices dispersas (solo se guardan los valores distintos de cero) y su álgebra lineal
+from scipy import sparse
+from scipy.sparse.linalg import splu
+from scipy.io import mmread, mmwrite
+# Factorizaciones LU y de Cholesky densas que se pueden reutilizar con distintos lados derechos
+from scipy.linalg import lu_factor, lu_solve, cho_factor, cho_solve, get_lapack_funcs
+
+# Operaciones que solo necesitan una matriz
+OPERACIONES_UNARIAS = ["Inversa", "Determinante"]
+
+# Por debajo de este rcond (inverso del número de condición) se advierte que la matriz está mal
+# condicionada: con rcond = 1e-8 se pierden unos 8 de los 16 dígitos de un float64
+RCOND_ADVERTENCIA = 1e-8
+
+# Una matriz densa cargada desde archivo pasa a formato disperso si tiene al menos
+# este número de elementos y una fracción de valores distintos de cero menor a DENSIDAD_DISPERSA
+ELEMENTOS_DISPERSA = 10_000
+DENSIDAD_DISPERSA = 0.1
+
+
+# Convierte el texto de una celda (entero, decimal o fracción) en un número decimal
+def convertir_celda(texto):
+    try:
+        # Si es fracción, la convierte
+        if "/" in texto:
+            num, den = texto.split("/")
+            return float(num) / float(den)
+        return float(texto)
+    except (ValueError, ZeroDivisionError):
+        return 0.0  # Si hay error, coloca 0
+
+
+# Convierte la entrada en un arreglo de flotantes y verifica que sea una matriz o una pila de matrices.
+# Las matrices dispersas de scipy se conservan dispersas (formato CSR)
+def como_matriz(M):
+    if sparse.issparse(M):
+        return sparse.csr_matrix(M, dtype=float)
+    M = np.asarray(M, dtype=float)
+    if M.ndim not in (2, 3):
+        raise ValueError("Se esperaba una matriz (2-D) o una pila de matrices (3-D).")
+    return M
+
+
+# Verifica que las dimensiones (filas, columnas) sean compatibles con la operación
+def validar_dimensiones(operacion, forma_a, forma_b=None):
+    fA, cA = forma_a[-2:]
+    if operacion in ["Sumar", "Restar"]:
+        if forma_b is None or tuple(forma_a[-2:]) != tuple(forma_b[-2:]):
+            raise ValueError("Para sumar o restar, las matrices deben tener la misma dimensión.")
+    elif operacion == "Multiplicar":
+        if forma_b is None or cA != forma_b[-2]:
+            raise ValueError("Para multiplicar, las columnas de A deben ser iguales a las filas de B.")
+    elif operacion in OPERACIONES_UNARIAS:
+        if fA != cA:
+            raise ValueError("La matriz debe ser cuadrada.")
+
+
+def es_dispersa(M):
+    return sparse.issparse(M)
+
+
+# Al combinar una matriz dispersa con una densa, scipy devuelve np.matrix; se normaliza a ndarray
+def _normalizar_resultado(R):
+    if isinstance(R, np.matrix):
+        return np.asarray(R)
+    return R
+
+
+def sumar(M1, M2):
+    M1, M2 = como_matriz(M1), como_matriz(M2)
+    validar_dimensiones("Sumar", M1.shape, M2.shape)
+    return _normalizar_resultado(M1 + M2)
+
+
+def restar(M1, M2):
+    M1, M2 = como_matriz(M1), como_matriz(M2)
+    validar_dimensiones("Restar", M1.shape, M2.shape)
+    return _normalizar_resultado(M1 - M2)
+
+
+def multiplicar(M1, M2):
+    M1, M2 = como_matriz(M1), como_matriz(M2)
+    validar_dimensiones("Multiplicar", M1.shape, M2.shape)
+    if es_dispersa(M1) or es_dispersa(M2):
+        return _normalizar_resultado(M1 @ M2)
+    # matmul multiplica matriz por matriz o pila por pila sin bucles en Python
+    return np.matmul(M1, M2)
+
+
+# Diagnóstico de una matriz cuadrada densa con una sola factorización LU: determinante, inversa
+# (opcional), estimación del número de condición (LAPACK gecon, O(n²) sobre la LU ya calculada)
+# y rango. La SVD, más costosa, solo se calcula cuando la matriz está mal condicionada
+def diagnosticar(M1, calcular_inversa=True):
+    M1 = como_matriz(M1)
+    validar_dimensiones("Determinante", M1.shape)
+    if es_dispersa(M1) or M1.ndim != 2:
+        raise ValueError("El diagnóstico necesita una sola matriz densa.")
+    n = M1.shape[0]
+    if n == 0:
+        return {"determinante": 1.0, "inversa": M1.copy(), "rango": 0, "n": 0,
+                "rcond": 1.0, "condicion": 1.0, "singular": False, "advertencias": []}
+
+    if not np.all(np.isfinite(M1)):
+        raise ValueError("La matriz contiene valores infinitos o NaN.")
+    # La LU queda en la caché de la sesión: otra operación sobre la misma matriz no la repite
+    lu, piv = _cache_factorizaciones.obtener(M1, "LU", factorizar_lu)
+    diagonal = np.diag(lu)
+    # Cada intercambio de filas del pivoteo cambia el signo del determinante
+    signo = -1.0 if np.count_nonzero(piv != np.arange(n)) % 2 else 1.0
+    determinante_lu, signo_det, log_det = _determinante_lu(signo, diagonal)
+
+    norma = np.linalg.norm(M1, 1)
+    if np.all(diagonal != 0) and norma > 0:
+        gecon, = get_lapack_funcs(("gecon",), (lu,))
+        rcond = float(gecon(lu, norma, norm="1")[0])
+    else:
+        rcond = 0.0
+
+    rango = n
+    if rcond < RCOND_ADVERTENCIA:
+        # Rango numérico: valores singulares por encima de la tolerancia usual (como matrix_rank)
+        valores = np.linalg.svd(M1, compute_uv=False)
+        rango = int(np.count_nonzero(valores > valores.max() * n * np.finfo(float).eps))
+    singular = rango < n
+
+    advertencias = []
+    if singular:
+        advertencias.append(f"⚠️ La matriz es singular (rango {rango} de {n}): no tiene inversa.")
+    elif rcond < RCOND_ADVERTENCIA:
+        advertencias.append(
+            f"⚠️ Matriz mal condicionada (cond ≈ {1 / rcond:.2e}): se pueden perder unos "
+            f"{int(round(-math.log10(rcond)))} dígitos de precisión y el resultado puede ser inexacto."
+        )
+
+    return {
+        # None si el determinante no cabe en un flotante; "log_determinante" = (signo, ln|det|)
+        "determinante": 0.0 if singular else determinante_lu,
+        "log_determinante": (signo_det, log_det),
+        "inversa": lu_solve((lu, piv), np.eye(n), check_finite=False) if calcular_inversa and not singular else None,
+        "rango": rango,
+        "n": n,
+        "rcond": rcond,
+        "condicion": 1 / rcond if rcond > 0 else float("inf"),
+        "singular": singular,
+        "advertencias": advertencias,
+    }
+
+
+# Determinante a partir del signo de la permutación y de la diagonal de U. Con matrices grandes el
+# producto directo desborda a inf o se anula aunque la matriz no sea singular; entonces se suman
+# logaritmos, como np.linalg.slogdet. Devuelve (determinante o None si no cabe en un flotante,
+# signo, ln|det|)
+def _determinante_lu(signo, diagonal):
+    if np.any(diagonal == 0):
+        return 0.0, 0.0, -math.inf
+    signo = signo * float(np.prod(np.sign(diagonal)))
+    logaritmo = float(np.sum(np.log(np.abs(diagonal))))
+    with np.errstate(over="ignore", under="ignore"):
+        producto = float(np.prod(np.abs(diagonal)))
+    if np.isfinite(producto) and producto >= np.finfo(float).tiny:
+        return signo * producto, signo, logaritmo
+    # El producto parcial pudo desbordar aunque el resultado quepa
+    if math.log(np.finfo(float).tiny) <= logaritmo <= math.log(np.finfo(float).max):
+        return signo * math.exp(logaritmo), signo, logaritmo
+    return None, signo, logaritmo
+
+
+# Mensaje para un determinante que no cabe en un flotante, con su valor en notación científica
+def formatear_determinante_fuera_de_rango(signo, logaritmo):
+    exponente = logaritmo / math.log(10)
+    entero = math.floor(exponente)
+    mantisa = round(10 ** (exponente - entero), 6)
+    if mantisa >= 10:
+        mantisa, entero = mantisa / 10, entero + 1
+    return (f"El determinante no cabe en un número de punto flotante: det ≈ {'-' if signo < 0 else ''}"
+            f"{mantisa:.6f}e{entero:+d} (ln|det| = {logaritmo:.6g}).")
+
+
+# Texto del diagnóstico para el panel de resultados
+def formatear_diagnostico(diagnostico):
+    condicion = diagnostico["condicion"]
+    texto_condicion = "∞" if math.isinf(condicion) else f"{condicion:.3g}"
+    lineas = [f"Rango: {diagnostico['rango']} de {diagnostico['n']} | número de condición (norma 1) ≈ {texto_condicion}"]
+    return "\n".join(lineas + diagnostico["advertencias"])
+
+
+def inversa(M1):
+    M1 = como_matriz(M1)
+    validar_dimensiones("Inversa", M1.shape)
+    if es_dispersa(M1):
+        # La inversa de una matriz dispersa suele ser densa: para matrices grandes se resuelve el sistema
+        raise ValueError("La inversa de una matriz dispersa es densa; usa Sistemas Lineales para resolver Ax = b.")
+    if M1.ndim == 2:
+        # Una sola LU da la inversa y detecta la singularidad por el rango, no por det ≈ 0
+        diagnostico = diagnosticar(M1)
+        if diagnostico["singular"]:
+            raise ValueError("La matriz no tiene inversa porque su determinante es 0.")
+        return diagnostico["inversa"]
+    if np.any(np.isclose(det(M1), 0)):
+        raise ValueError("La matriz no tiene inversa porque su determinante es 0.")
+    return inv(M1)
+
+
+# Signo de una permutación dada como arreglo de índices (par = 1, impar = -1)
+def _signo_permutacion(p):
+    p = np.asarray(p).copy()
+    signo = 1
+    for i in range(len(p)):
+        while p[i] != i:
+            j = p[i]
+            p[i], p[j] = p[j], p[i]
+            signo = -signo
+    return signo
+
+
+def determinante(M1):
+    M1 = como_matriz(M1)
+    validar_dimensiones("Determinante", M1.shape)
+    if es_dispersa(M1):
+        # det(A) = signo(Pr) * signo(Pc) * producto de la diagonal de U en la factorización LU dispersa
+        try:
+            lu = splu(M1.tocsc())
+        except RuntimeError:
+            return 0.0  # La factorización falla cuando la matriz es singular
+        signo = _signo_permutacion(lu.perm_r) * _signo_permutacion(lu.perm_c)
+        valor, signo, logaritmo = _determinante_lu(signo, lu.U.diagonal())
+        if valor is None:
+            raise ValueError(formatear_determinante_fuera_de_rango(signo, logaritmo))
+        return valor
+    with np.errstate(over="ignore", under="ignore"):
+        valor = det(M1)
+    # det desborda a inf (o se anula) con matrices grandes: se informa el valor con logaritmos
+    if M1.ndim == 2 and (not np.isfinite(valor) or valor == 0):
+        signo, logaritmo = np.linalg.slogdet(M1)
+        if signo != 0 and np.isfinite(logaritmo):
+            raise ValueError(formatear_determinante_fuera_de_rango(signo, logaritmo))
+    return valor
+
+
+# LU densa con pivoteo parcial (forma compacta de LAPACK). Se guarda aunque la matriz sea singular:
+# quien la usa para resolver revisa los pivotes
+def factorizar_lu(A):
+    with warnings.catch_warnings():
+        # La singularidad se informa con LinAlgError en lugar de una advertencia en la consola
+        warnings.simplefilter("ignore")
+        return lu_factor(A, check_finite=False)
+
+
+# Cholesky (A = L Lᵀ) o None si A no es definida positiva; así el fallo también queda en la caché
+def factorizar_cholesky(A):
+    try:
+        return cho_factor(A, lower=True, check_finite=False)
+    except np.linalg.LinAlgError:
+        return None
+
+
+def factorizar_lu_dispersa(A):
+    try:
+        return splu(A.tocsc())
+    except RuntimeError:
+        raise np.linalg.LinAlgError("Singular matrix")
+
+
+# Caché de factorizaciones: cuando se resuelven varios sistemas con la misma matriz A y distintos
+# lados derechos, A se factoriza una sola vez (O(n³)) y cada solución cuesta solo O(n²).
+# Cada matriz guarda todas sus factorizaciones por tipo ("LU", "Cholesky", "QR", "SVD", ...), así que
+# la inversa, el rango o la pseudoinversa reutilizan lo que ya calcularon otras operaciones.
+# Las entradas se identifican por un hash del contenido de A y se descarta la menos usada (LRU)
+class CacheFactorizaciones:
+    def __init__(self, capacidad=8):
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    # Hash del contenido de la matriz (valores, forma y, si es dispersa, su estructura)
+    @staticmethod
+    def clave(A):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(A.shape).encode())
+        if es_dispersa(A):
+            A = A.tocsr()
+            for parte in (A.data, A.indices, A.indptr):
+                h.update(np.ascontiguousarray(parte).tobytes())
+        else:
+            h.update(np.ascontiguousarray(A).tobytes())
+        return h.hexdigest()
+
+    # Devuelve la factorización "tipo" de A; "calcular(A)" solo se llama la primera vez
+    def obtener(self, A, tipo, calcular):
+        clave = self.clave(A)
+        factorizaciones = self._entradas.get(clave)
+        if factorizaciones is None:
+            factorizaciones = self._entradas[clave] = {}
+            if len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)  # Descarta la matriz menos usada
+        else:
+            self._entradas.move_to_end(clave)
+        if tipo in factorizaciones:
+            self.aciertos += 1
+            return factorizaciones[tipo]
+        self.fallos += 1
+        factorizaciones[tipo] = calcular(A)
+        return factorizaciones[tipo]
+
+    # Factorización para resolver: LU dispersa, Cholesky si A es simétrica definida positiva,
+    # o LU con pivoteo
+    def factorizacion(self, A):
+        if es_dispersa(A):
+            return "lu_dispersa", self.obtener(A, "LU dispersa", factorizar_lu_dispersa)
+        # Simetría exacta: Cholesky solo lee un triángulo, así que con una matriz casi simétrica
+        # resolvería otro sistema sin avisar
+        if np.array_equal(A, A.T):
+            cholesky = self.obtener(A, "Cholesky", factorizar_cholesky)
+            if cholesky is not None:
+                return "cholesky", cholesky
+        lu, piv = self.obtener(A, "LU", factorizar_lu)
+        if np.any(np.diag(lu) == 0):
+            raise np.linalg.LinAlgError("Singular matrix")
+        return "lu", (lu, piv)
+
+    # Resuelve A X = B; B puede ser un vector o una matriz con un lado derecho por columna
+    def resolver(self, A, B):
+        tipo, factor = self.factorizacion(A)
+        if tipo == "lu_dispersa":
+            return factor.solve(B)
+        if tipo == "cholesky":
+            return cho_solve(factor, B, check_finite=False)
+        return lu_solve(factor, B, check_finite=False)
+
+    def limpiar(self):
+        self._entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+_cache_factorizaciones = CacheFactorizaciones()
+
+
+# Devuelve la caché de factorizaciones compartida por la sesión
+def obtener_cache():
+    return _cache_factorizaciones
+
+
+# Resuelve A x = b reutilizando la factorización de A si ya se calculó antes.
+# b puede tener varias columnas (un lado derecho por columna)
+def resolver(A, b):
+    A = como_matriz(A)
+    b = np.asarray(b, dtype=float)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("La matriz A no es cuadrada.")
+    if A.shape[0] != b.shape[0]:
+        raise ValueError("Dimensiones incompatibles entre A y B.")
+    x = _cache_factorizaciones.resolver(A, b)
+    if not np.all(np.isfinite(x)):
+        raise np.linalg.LinAlgError("Singular matrix")
+    return x
+
+
+# Relaciona el nombre de cada operación (como aparece en la interfaz) con su función
+OPERACIONES = {
+    "Sumar": sumar,
+    "Restar": restar,
+    "Multiplicar": multiplicar,
+    "Inversa": inversa,
+    "Determinante": determinante,
+}
+
+
+# Punto de entrada único: calcula la operación indicada sobre una matriz o un lote de matrices
+def calcular(operacion, M1, M2=None):
+    funcion = OPERACIONES.get(operacion)
+    if funcion is None:
+        raise ValueError(f"Operación no soportada: {operacion}")
+    if operacion in OPERACIONES_UNARIAS:
+        return funcion(M1)
+    return funcion(M1, M2)
+
+
+# Convierte a formato disperso las matrices grandes con pocos valores distintos de cero
+def dispersa_si_conviene(M):
+    if es_dispersa(M) or M.ndim != 2 or M.size < ELEMENTOS_DISPERSA:
+        return M
+    if np.count_nonzero(M) / M.size < DENSIDAD_DISPERSA:
+        return sparse.csr_matrix(M)
+    return M
+
+
+# Carga una matriz desde archivo: CSV/TXT (texto), .npy (NumPy) o .mtx (Matrix Market, disperso)
+def cargar_matriz(ruta):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".npy":
+        M = np.load(ruta)
+    elif extension == ".mtx":
+        M = mmread(ruta)
+        M = sparse.csr_matrix(M) if sparse.issparse(M) else np.asarray(M)
+    elif extension == ".csv":
+        M = np.loadtxt(ruta, delimiter=",", ndmin=2)
+    elif extension == ".txt":
+        M = np.loadtxt(ruta, ndmin=2)
+    else:
+        raise ValueError("Formato no soportado. Usa archivos .csv, .txt, .npy o .mtx.")
+    M = como_matriz(M)
+    if not es_dispersa(M) and M.ndim != 2:
+        raise ValueError("El archivo debe contener una sola matriz (2-D).")
+    return dispersa_si_conviene(M)
+
+
+# Guarda una matriz en el formato que indica la extensión del archivo
+def guardar_matriz(ruta, M):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".mtx":
+        mmwrite(ruta, M if es_dispersa(M) else np.atleast_2d(M))
+    elif extension == ".npy":
+        np.save(ruta, M.toarray() if es_dispersa(M) else M)
+    elif extension in (".csv", ".txt"):
+        delimitador = "," if extension == ".csv" else " "
+        np.savetxt(ruta, np.atleast_2d(M.toarray() if es_dispersa(M) else M), delimiter=delimitador)
+    else:
+        raise ValueError("Formato no soportado. Usa archivos .csv, .txt, .npy o .mtx.")
+
+
+# Texto corto que describe una matriz (dimensiones y, si es dispersa, valores distintos de cero)
+def describir_matriz(M):
+    filas, columnas = M.shape[-2:]
+    if es_dispersa(M):
+        return f"{filas}×{columnas} dispersa ({M.nnz} valores distintos de cero)"
+    return f"{filas}×{columnas} densa"
+
+
+# Matrices por tramo en el modo por lotes: acota la memoria temporal y permite cancelar y ver el avance
+TRAMO_LOTE = 65_536
+
+
+# Inversas de una pila de matrices; las singulares quedan con NaN y "validas" en False
+def _inversas_lote(A):
+    try:
+        inversas = inv(A)
+        validas = np.all(np.isfinite(inversas), axis=(1, 2))
+    except np.linalg.LinAlgError:
+        # Alguna matriz es exactamente singular: el rango (SVD apilada) separa las invertibles
+        validas = np.linalg.matrix_rank(A) == A.shape[-1]
+        inversas = np.full(A.shape, np.nan)
+        if np.any(validas):
+            inversas[validas] = inv(A[validas])
+    return inversas, validas
+
+
+# Calcula la operación sobre una pila de matrices (k, n, m) con llamadas apiladas de NumPy, sin bucles
+# por matriz en Python. B puede ser otra pila o una sola matriz que se aplica a todas.
+# Devuelve el resultado y un arreglo booleano con las matrices válidas (False: sin inversa)
+def calcular_lote(operacion, A, B=None, control=None):
+    A = np.asarray(A, dtype=float)
+    if A.ndim == 2:
+        A = A[np.newaxis]
+    if A.ndim != 3:
+        raise ValueError("El lote debe ser una pila de matrices con forma (cantidad, filas, columnas).")
+    if operacion in OPERACIONES_UNARIAS:
+        validar_dimensiones(operacion, A.shape)
+    else:
+        if B is None:
+            raise ValueError(f"La operación {operacion} necesita un segundo lote B.")
+        B = np.asarray(B, dtype=float)
+        if B.ndim not in (2, 3) or (B.ndim == 3 and B.shape[0] != A.shape[0]):
+            raise ValueError("B debe ser una sola matriz o una pila con la misma cantidad de matrices que A.")
+        validar_dimensiones(operacion, A.shape, B.shape)
+
+    resultados = []
+    validas = []
+    k = A.shape[0]
+    for inicio in range(0, k, TRAMO_LOTE):
+        tramo = A[inicio:inicio + TRAMO_LOTE]
+        otro = B if B is None or B.ndim == 2 else B[inicio:inicio + TRAMO_LOTE]
+        if operacion == "Determinante":
+            resultado = det(tramo)
+            valida = np.isfinite(resultado)
+        elif operacion == "Inversa":
+            resultado, valida = _inversas_lote(tramo)
+        elif operacion == "Multiplicar":
+            resultado = np.matmul(tramo, otro)
+            valida = np.ones(len(tramo), dtype=bool)
+        elif operacion in ("Sumar", "Restar"):
+            resultado = tramo + otro if operacion == "Sumar" else tramo - otro
+            valida = np.ones(len(tramo), dtype=bool)
+        else:
+            raise ValueError(f"Operación no soportada: {operacion}")
+        resultados.append(resultado)
+        validas.append(valida)
+        if control is not None:
+            control.verificar()
+            control.progreso(100 * min(inicio + TRAMO_LOTE, k) / k)
+    return np.concatenate(resultados), np.concatenate(validas)
+
+
+# Busca un arreglo del .npz por nombre ("A", "B") o, si no está, por posición (arr_0, arr_1)
+def _arreglo_npz(datos, nombre, posicion):
+    if nombre in datos.files:
+        return datos[nombre]
+    if posicion < len(datos.files):
+        return datos[datos.files[posicion]]
+    return None
+
+
+# Modo por lotes: lee un .npz con la pila A (y B para las operaciones binarias), calcula todas las
+# matrices y guarda en otro .npz los arreglos "resultado" y "validas"
+def procesar_lote(ruta_entrada, operacion, ruta_salida, control=None):
+    with np.load(ruta_entrada) as datos:
+        A = _arreglo_npz(datos, "A", 0)
+        B = None if operacion in OPERACIONES_UNARIAS else _arreglo_npz(datos, "B", 1)
+    if A is None:
+        raise ValueError("El archivo .npz no contiene matrices.")
+
+    inicio = time.perf_counter()
+    resultado, validas = calcular_lote(operacion, A, B, control)
+    segundos = time.perf_counter() - inicio
+    np.savez(ruta_salida, resultado=resultado, validas=validas)
+
+    cantidad = len(resultado)
+    return {
+        "ruta": ruta_salida,
+        "operacion": operacion,
+        "cantidad": cantidad,
+        "invalidas": int(cantidad - np.count_nonzero(validas)),
+        "forma": tuple(np.shape(A)[-2:]),
+        "resultado": resultado,
+        "segundos": segundos,
+        "por_segundo": cantidad / segundos if segundos > 0 else float("inf"),
+    }
+
+
+# Memoria que puede ocupar la multiplicación por bloques (tres bloques: de A, de B y del resultado)
+MEMORIA_BLOQUES = 256 * 1024 ** 2
+
+
+# Lado de los bloques cuadrados para que tres bloques de float64 quepan en MEMORIA_BLOQUES
+def tamano_bloque_para(memoria=MEMORIA_BLOQUES, bytes_por_valor=8):
+    return max(64, int(math.sqrt(memoria / (3 * bytes_por_valor))))
+
+
+# Multiplicación fuera de memoria: A y B son archivos .npy que se leen por bloques (memoria mapeada)
+# y el producto se escribe directamente en otro .npy mapeado, de modo que las matrices pueden ser
+# más grandes que la RAM. Cada bloque del resultado se acumula en memoria y se escribe una sola vez
+def multiplicar_por_bloques(ruta_a, ruta_b, ruta_salida, tamano_bloque=None, control=None):
+    A = np.load(ruta_a, mmap_mode="r")
+    B = np.load(ruta_b, mmap_mode="r")
+    if A.ndim != 2 or B.ndim != 2:
+        raise ValueError("Los archivos deben contener una sola matriz (2-D).")
+    validar_dimensiones("Multiplicar", A.shape, B.shape)
+
+    m, n = A.shape
+    p = B.shape[1]
+    tipo = np.result_type(A.dtype, B.dtype, np.float64)
+    bloque = tamano_bloque or tamano_bloque_para(bytes_por_valor=tipo.itemsize)
+    C = np.lib.format.open_memmap(ruta_salida, mode="w+", dtype=tipo, shape=(m, p))
+
+    total = math.ceil(m / bloque) * math.ceil(p / bloque)
+    hechos = 0
+    inicio = time.perf_counter()
+    for i in range(0, m, bloque):
+        for j in range(0, p, bloque):
+            acumulado = np.zeros((min(bloque, m - i), min(bloque, p - j)), dtype=tipo)
+            for k in range(0, n, bloque):
+                acumulado += np.asarray(A[i:i + bloque, k:k + bloque], dtype=tipo) @ \
+                    np.asarray(B[k:k + bloque, j:j + bloque], dtype=tipo)
+                if control is not None:
+                    control.verificar()
+            C[i:i + bloque, j:j + bloque] = acumulado
+            hechos += 1
+            if control is not None:
+                control.progreso(100 * hechos / total)
+    C.flush()
+    segundos = time.perf_counter() - inicio
+    del C  # Cierra el mapeo del archivo de salida
+
+    return {
+        "ruta": ruta_salida,
+        "forma": (m, p),
+        "bloque": bloque,
+        "segundos": segundos,
+        # Un producto m×n por n×p hace 2·m·n·p operaciones de punto flotante
+        "gflops": 2 * m * n * p / segundos / 1e9 if segundos > 0 else float("inf"),
+    }
@@ -0,0 +1,205 @@
+# Aritmética racional exacta para matrices.
+# Las celdas aceptan fracciones ("3/4"), así que aquí se trabaja con enteros y Fraction de Python
+# en lugar de flotantes: el determinante, la inversa y la solución de Ax = b salen sin redondeo.
+# La eliminación de Bareiss mantiene todos los valores intermedios enteros (cada división es exacta),
+# con lo que el costo crece como n³ operaciones con enteros pequeños.
+import math
+import time
+from fractions import Fraction
+
+import numpy as np
+
+# Las reglas de dimensiones son las mismas que en el motor de punto flotante
+from Modulos.matrices.motor_matrices import OPERACIONES_UNARIAS, validar_dimensiones
+
+# Hasta este tamaño el modo automático usa aritmética exacta (tarda milisegundos);
+# para matrices más grandes usa flotantes
+LIMITE_EXACTO = 30
+
+
+# Convierte el texto de una celda (entero, decimal o fracción) en una fracción exacta
+def convertir_celda(texto):
+    try:
+        return Fraction(texto.strip())
+    except (ValueError, ZeroDivisionError):
+        return Fraction(0)  # Si hay error, coloca 0
+
+
+# Convierte cualquier matriz (listas, arreglo de NumPy o fracciones) en una lista de filas de Fraction
+def como_fracciones(M):
+    if isinstance(M, np.ndarray):
+        M = M.tolist()
+    return [[Fraction(valor) for valor in fila] for fila in M]
+
+
+# Indica si conviene la aritmética exacta para una matriz de n × n
+def usar_exacto(n):
+    return n <= LIMITE_EXACTO
+
+
+# Multiplica cada fila por el mínimo común múltiplo de sus denominadores para dejarla en enteros.
+# Devuelve las filas enteras y el factor usado en cada una
+def _escalar_a_enteros(filas):
+    enteras = []
+    factores = []
+    for fila in filas:
+        factor = math.lcm(*(valor.denominator for valor in fila)) if fila else 1
+        enteras.append([int(valor * factor) for valor in fila])
+        factores.append(factor)
+    return enteras, factores
+
+
+# Eliminación de Bareiss sin fracciones sobre las primeras n columnas de M (se modifica en su lugar).
+# Las columnas extra (lado derecho aumentado) se transforman igual. Devuelve el signo acumulado
+# por los intercambios de filas, o 0 si la matriz es singular
+def _bareiss(M, n):
+    signo = 1
+    previo = 1
+    ancho = len(M[0]) if M else 0
+    for k in range(n):
+        if M[k][k] == 0:
+            # Busca una fila más abajo con pivote distinto de cero
+            for i in range(k + 1, n):
+                if M[i][k] != 0:
+                    M[k], M[i] = M[i], M[k]
+                    signo = -signo
+                    break
+            else:
+                return 0
+        pivote = M[k][k]
+        fila_k = M[k]
+        for i in range(k + 1, n):
+            fila_i = M[i]
+            factor = fila_i[k]
+            for j in range(k + 1, ancho):
+                # Identidad de Sylvester: la división entre el pivote anterior siempre es exacta
+                fila_i[j] = (fila_i[j] * pivote - factor * fila_k[j]) // previo
+            fila_i[k] = 0
+        previo = pivote
+    return signo
+
+
+def _verificar_cuadrada(A):
+    if any(len(fila) != len(A) for fila in A):
+        raise ValueError("La matriz debe ser cuadrada.")
+
+
+def determinante(A):
+    A = como_fracciones(A)
+    _verificar_cuadrada(A)
+    n = len(A)
+    if n == 0:
+        return Fraction(1)
+    M, factores = _escalar_a_enteros(A)
+    signo = _bareiss(M, n)
+    if signo == 0:
+        return Fraction(0)
+    # Al escalar la fila i por f_i el determinante se multiplicó por f_i
+    return Fraction(signo * M[n - 1][n - 1], math.prod(factores))
+
+
+# Resuelve A X = B de forma exacta. B puede ser un vector (lista) o una matriz (lista de filas);
+# el resultado tiene la misma forma que B
+def resolver(A, B):
+    A = como_fracciones(A)
+    _verificar_cuadrada(A)
+    n = len(A)
+    vector = len(B) > 0 and not isinstance(B[0], (list, tuple, np.ndarray))
+    B = como_fracciones([[b] for b in B] if vector else B)
+    if len(B) != n:
+        raise ValueError("Dimensiones incompatibles entre A y B.")
+
+    # Matriz aumentada [A | B] en enteros; escalar una fila completa no cambia la solución
+    M, _ = _escalar_a_enteros([fila_a + fila_b for fila_a, fila_b in zip(A, B)])
+    if _bareiss(M, n) == 0:
+        raise ValueError("La matriz es singular (determinante 0): el sistema no tiene solución única.")
+
+    # Sustitución hacia atrás sobre la matriz triangular superior que dejó Bareiss
+    columnas = len(M[0]) - n
+    X = [[Fraction(0)] * columnas for _ in range(n)]
+    for c in range(columnas):
+        for i in range(n - 1, -1, -1):
+            suma = M[i][n + c] - sum(M[i][j] * X[j][c] for j in range(i + 1, n))
+            X[i][c] = Fraction(suma) / M[i][i]
+    return [fila[0] for fila in X] if vector else X
+
+
+def inversa(A):
+    A = como_fracciones(A)
+    _verificar_cuadrada(A)
+    n = len(A)
+    identidad = [[Fraction(int(i == j)) for j in range(n)] for i in range(n)]
+    try:
+        return resolver(A, identidad)
+    except ValueError:
+        raise ValueError("La matriz no tiene inversa porque su determinante es 0.")
+
+
+def sumar(A, B):
+    A, B = como_fracciones(A), como_fracciones(B)
+    return [[a + b for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)]
+
+
+def restar(A, B):
+    A, B = como_fracciones(A), como_fracciones(B)
+    return [[a - b for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)]
+
+
+def multiplicar(A, B):
+    A, B = como_fracciones(A), como_fracciones(B)
+    columnas_b = list(zip(*B))
+    return [[sum(a * b for a, b in zip(fila, columna)) for columna in columnas_b] for fila in A]
+
+
+# Relaciona el nombre de cada operación (como aparece en la interfaz) con su versión exacta
+OPERACIONES = {
+    "Sumar": sumar,
+    "Restar": restar,
+    "Multiplicar": multiplicar,
+    "Inversa": inversa,
+    "Determinante": determinante,
+}
+
+
+def _forma(M):
+    return (len(M), len(M[0]) if len(M) else 0)
+
+
+def calcular(operacion, A, B=None):
+    funcion = OPERACIONES.get(operacion)
+    if funcion is None:
+        raise ValueError(f"Operación no soportada: {operacion}")
+    if operacion in OPERACIONES_UNARIAS:
+        validar_dimensiones(operacion, _forma(A))
+        return funcion(A)
+    validar_dimensiones(operacion, _forma(A), _forma(B))
+    return funcion(A, B)
+
+
+# Ejecuta una función y devuelve su resultado junto con el tiempo que tardó (en segundos)
+def cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+# Texto de una fracción: entero si el denominador es 1, "p/q" en otro caso
+def formatear_fraccion(valor):
+    valor = Fraction(valor)
+    if valor.denominator == 1:
+        return str(valor.numerator)
+    return f"{valor.numerator}/{valor.denominator}"
+
+
+def formatear_matriz(M):
+    textos = [[formatear_fraccion(valor) for valor in fila] for fila in M]
+    ancho = max((len(texto) for fila in textos for texto in fila), default=0)
+    return "\n".join("[ " + "  ".join(texto.rjust(ancho) for texto in fila) + " ]" for fila in textos)
+
+
+# Texto que compara el tiempo de la ruta exacta con el de la ruta de punto flotante
+def comparar_tiempos(tiempo_exacto, tiempo_flotante):
+    return (
+        f"Tiempo exacto (fracciones): {tiempo_exacto * 1000:.3f} ms | "
+        f"tiempo con decimales (NumPy): {tiempo_flotante * 1000:.3f} ms"
+    )
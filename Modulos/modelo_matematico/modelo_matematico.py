@@ -8,6 +8,25 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
 
+def deriv_sir(y, t, N, beta, gamma):
+    S, I, R = y
+    dSdt = -beta * S * I / N
+    dIdt = beta * S * I / N - gamma * I
+    dRdt = gamma * I
+    return dSdt, dIdt, dRdt
+
+
+# Integra el modelo SIR durante los días indicados (un punto por día) y devuelve t, S, I, R
+def simular_sir(N, I0, beta, gamma, dias):
+    R0 = 0
+    S0 = N - I0
+    t = np.linspace(0, dias, dias + 1)
+    y0 = S0, I0, R0
+    sol = odeint(deriv_sir, y0, t, args=(N, beta, gamma))
+    S, I, R = sol.T
+    return t, S, I, R
+
+
 class SimuladorSIR(QWidget):
     def __init__(self):
         super().__init__()
@@ -132,8 +151,6 @@ class SimuladorSIR(QWidget):
         try:
             N = int(self.campos["Población (N):"].text())
             I0 = int(self.campos["Infectados iniciales (I₀):"].text())
-            R0 = 0
-            S0 = N - I0
             beta = float(self.campos["β (tasa de infección):"].text())
             gamma = float(self.campos["γ (tasa de recuperación):"].text())
             dias = int(self.campos["Días:"].text())
@@ -141,18 +158,7 @@ class SimuladorSIR(QWidget):
             QMessageBox.critical(self, "Error", "Todos los campos deben contener valores numéricos válidos.")
             return
 
-        t = np.linspace(0, dias, dias + 1)
-
-        def deriv(y, t, N, beta, gamma):
-            S, I, R = y
-            dSdt = -beta * S * I / N
-            dIdt = beta * S * I / N - gamma * I
-            dRdt = gamma * I
-            return dSdt, dIdt, dRdt
-
-        y0 = S0, I0, R0
-        sol = odeint(deriv, y0, t, args=(N, beta, gamma))
-        S, I, R = sol.T
+        t, S, I, R = simular_sir(N, I0, beta, gamma, dias)
 
         self.canvas.figure.clf()
         self.canvas.figure.set_facecolor('#0f111a')
@@ -0,0 +1,321 @@
+# Máximo común divisor y resultante de polinomios en una variable, exactos y sin sympy.
+# Con enteros grandes el algoritmo de Euclides sobre los racionales es lentísimo: los coeficientes
+# de los restos crecen sin control. Aquí se aplica Euclides módulo primos de 30 bits (donde los
+# números nunca crecen), vectorizado con NumPy sobre un lote de primos a la vez, y el resultado
+# entero se reconstruye con el teorema chino del resto:
+# - MCD: se agregan primos hasta que la reconstrucción se estabiliza; el candidato se descarta
+#   rápido si no divide a los dos polinomios módulo primos nuevos y, si pasa, se confirma con la
+#   división exacta (así el resultado no depende de la suerte con los primos).
+# - Resultante: se usan primos hasta superar la cota de Hadamard, así que el valor es exacto.
+# Los coeficientes decimales se toman como fracciones exactas ("0.1" es 1/10).
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from Modulos.polinomios import motor_polinomios
+
+# Primos por lote: cada paso de Euclides procesa todos los primos del lote con una operación de NumPy
+PRIMOS_POR_LOTE = 8
+PRIMOS_POR_LOTE_RESULTANTE = 64
+
+# Primos adicionales con los que se descarta un MCD reconstruido antes de la división exacta
+PRIMOS_VERIFICACION = 3
+
+_primos = []
+
+
+def _es_primo(n):
+    if n < 2 or n % 2 == 0:
+        return n == 2
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    # Bases suficientes para decidir la primalidad de cualquier n < 2^32
+    for a in (2, 7, 61):
+        x = pow(a, d, n)
+        if x in (1, n - 1) or a % n == 0:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+# Los primos menores que 2^30 (de mayor a menor): los productos de dos residuos caben en int64
+def _primo(indice):
+    candidato = _primos[-1] - 2 if _primos else 2 ** 30 - 1
+    while len(_primos) <= indice:
+        if _es_primo(candidato):
+            _primos.append(candidato)
+        candidato -= 2
+    return _primos[indice]
+
+
+# Siguientes primos (a partir de "desde") que no dividen a ninguno de los valores indicados
+def _lote_primos(desde, cantidad, evitar):
+    primos = []
+    indice = desde
+    while len(primos) < cantidad:
+        p = _primo(indice)
+        indice += 1
+        if all(v % p for v in evitar):
+            primos.append(p)
+    return primos, indice
+
+
+# Convierte los coeficientes en enteros de Python: devuelve (enteros, denominador) con
+# polinomio = enteros / denominador
+def _enteros(coeficientes):
+    valores = coeficientes.tolist()
+    if coeficientes.dtype == float:
+        valores = [Fraction(repr(v)) for v in valores]
+    fracciones = [Fraction(v) for v in valores]
+    denominador = math.lcm(*(f.denominator for f in fracciones))
+    return [int(f * denominador) for f in fracciones], denominador
+
+
+def _contenido(enteros):
+    return math.gcd(*enteros)
+
+
+def _residuos(enteros, primos):
+    return np.array([[c % p for c in enteros] for p in primos], dtype=np.int64)
+
+
+def _inversos(valores, primos):
+    return np.array([pow(int(v), int(p) - 2, int(p)) for v, p in zip(valores, primos)], dtype=np.int64)
+
+
+# Resto de A entre B para cada primo del lote (una fila por primo, coeficientes ascendentes)
+def _resto_lote(A, B, P):
+    A = A.copy()
+    m = B.shape[1]
+    inverso = _inversos(B[:, -1], P[:, 0])
+    for k in range(A.shape[1] - m, -1, -1):
+        c = A[:, k + m - 1] * inverso % P[:, 0]
+        A[:, k:k + m] = (A[:, k:k + m] - c[:, None] * B) % P
+    return A[:, :m - 1]
+
+
+# Grado de cada fila (-1 si es el polinomio cero)
+def _grados(R):
+    if R.shape[1] == 0:
+        return np.full(R.shape[0], -1)
+    distintos = R != 0
+    return np.where(distintos.any(axis=1), R.shape[1] - 1 - np.argmax(distintos[:, ::-1], axis=1), -1)
+
+
+# Algoritmo de Euclides módulo cada primo del lote, con grado(a) >= grado(b) >= 0 y los coeficientes
+# principales no nulos módulo los primos. Devuelve (primos, MCD mónicos, resultantes) de los primos
+# que siguieron la secuencia de grados más alta: uno que la rompe (un primo "malo", que divide
+# algún coeficiente principal intermedio) se descarta
+def _euclides_lote(a, b, primos, control=None):
+    P = np.array(primos, dtype=np.int64)[:, None]
+    A, B = _residuos(a, primos), _residuos(b, primos)
+    resultantes = np.ones(len(primos), dtype=np.int64)
+    while True:
+        n, m = A.shape[1] - 1, B.shape[1] - 1
+        if m == 0:
+            # Res(A, c) = c^n y el MCD con una constante no nula es 1
+            for i, p in enumerate(P[:, 0].tolist()):
+                resultantes[i] = resultantes[i] * pow(int(B[i, 0]), n, p) % p
+            return P[:, 0].tolist(), np.ones((len(P), 1), dtype=np.int64), resultantes
+        R = _resto_lote(A, B, P)
+        grados = _grados(R)
+        d = int(grados.max())
+        if d < 0:
+            # B divide a A: B es el MCD y la resultante es 0
+            monicos = B * _inversos(B[:, -1], P[:, 0])[:, None] % P
+            return P[:, 0].tolist(), monicos, np.zeros(len(P), dtype=np.int64)
+        vivos = grados == d
+        # Res(A, B) = (-1)^(n·m) · lc(B)^(n - d) · Res(B, R)
+        signo = -1 if n * m % 2 else 1
+        for i, p in enumerate(P[:, 0].tolist()):
+            resultantes[i] = signo * resultantes[i] * pow(int(B[i, -1]), n - d, p) % p
+        A, B, P, resultantes = B[vivos], R[vivos, :d + 1], P[vivos], resultantes[vivos]
+        if control is not None:
+            control.verificar()
+
+
+# Teorema chino del resto (Garner): combina residuos (una fila por primo) en enteros de Python con
+# representante simétrico, en (-M/2, M/2]
+def _chino(residuos, primos):
+    x = np.array(residuos[0], dtype=np.int64).astype(object)
+    M = primos[0]
+    for r, p in zip(residuos[1:], primos[1:]):
+        t = (np.array(r, dtype=np.int64).astype(object) - x) % p * pow(M, -1, p) % p
+        x = x + M * t
+        M *= p
+    return [v - M if v > M // 2 else v for v in x.tolist()], M
+
+
+# ¿Divide "divisor" (entero) a cada polinomio módulo primos nuevos?
+def _divide(divisor, polinomios, desde):
+    primos, _ = _lote_primos(desde, PRIMOS_VERIFICACION, [divisor[-1]])
+    P = np.array(primos, dtype=np.int64)[:, None]
+    D = _residuos(divisor, primos)
+    for enteros in polinomios:
+        if len(enteros) < len(divisor):
+            return False
+        if len(divisor) > 1 and _resto_lote(_residuos(enteros, primos), D, P).any():
+            return False
+    return True
+
+
+# ¿Divide "divisor" a cada polinomio? División larga exacta con enteros de Python: si el divisor es
+# primitivo y divide sobre los racionales, el cociente es entero, así que basta que cada coeficiente
+# del cociente sea entero y el resto nulo (sin fracciones, que aquí triplican el tiempo)
+def _divide_exacto(divisor, polinomios):
+    divisor = np.array(divisor, dtype=object)
+    m = len(divisor)
+    for enteros in polinomios:
+        resto = np.array(enteros, dtype=object)
+        for k in range(len(resto) - m, -1, -1):
+            c, r = divmod(resto[k + m - 1], divisor[-1])
+            if r:
+                return False
+            if c:
+                resto[k:k + m] -= c * divisor
+        if resto[:m - 1].any():
+            return False
+    return True
+
+
+def _es_cero(enteros):
+    return not any(enteros)
+
+
+# MCD de dos polinomios de coeficientes enteros (listas ascendentes, primitivos y no nulos)
+def _mcd_primitivos(a, b, control=None):
+    if len(a) < len(b):
+        a, b = b, a
+    g = math.gcd(a[-1], b[-1])
+    indice = 0
+    grado = None
+    residuos, primos_usados = [], []
+    anterior = None
+    while True:
+        primos, indice = _lote_primos(indice, PRIMOS_POR_LOTE, [a[-1], b[-1]])
+        primos, monicos, _ = _euclides_lote(a, b, primos, control)
+        d = monicos.shape[1] - 1
+        if d == 0:
+            return [1]
+        if grado is None or d < grado:
+            # Un grado menor significa que los primos anteriores eran malos: se empieza de nuevo
+            grado, residuos, primos_usados, anterior = d, [], [], None
+        elif d > grado:
+            continue
+        for fila, p in zip(monicos, primos):
+            residuos.append(fila * (g % p) % p)
+            primos_usados.append(p)
+        candidato, _ = _chino(residuos, primos_usados)
+        contenido = _contenido(candidato)
+        candidato = [c // contenido for c in candidato]
+        if candidato == anterior and _divide(candidato, [a, b], indice) and _divide_exacto(candidato, [a, b]):
+            return candidato
+        anterior = candidato
+
+
+# MCD de dos arreglos de coeficientes. Con coeficientes enteros el resultado tiene coeficientes
+# enteros (el contenido común incluido) y coeficiente principal positivo; con fracciones o
+# decimales, el MCD es mónico
+def mcd_coeficientes(a, b, control=None):
+    a, b = motor_polinomios._recortar(a), motor_polinomios._recortar(b)
+    enteros_a, denominador_a = _enteros(a)
+    enteros_b, denominador_b = _enteros(b)
+    exactos = a.dtype != float and b.dtype != float and denominador_a == denominador_b == 1
+    if _es_cero(enteros_a) and _es_cero(enteros_b):
+        return motor_polinomios._como_arreglo([0])
+    if _es_cero(enteros_a) or _es_cero(enteros_b):
+        resultado = enteros_b if _es_cero(enteros_a) else enteros_a
+        contenido = _contenido(resultado)
+        primitivo = [c // contenido for c in resultado]
+        comun = contenido
+    else:
+        contenido_a, contenido_b = _contenido(enteros_a), _contenido(enteros_b)
+        primitivo = _mcd_primitivos([c // contenido_a for c in enteros_a],
+                                    [c // contenido_b for c in enteros_b], control)
+        comun = math.gcd(contenido_a, contenido_b)
+    if primitivo[-1] < 0:
+        primitivo = [-c for c in primitivo]
+    if exactos:
+        return motor_polinomios._como_arreglo([comun * c for c in primitivo])
+    return motor_polinomios._como_arreglo([Fraction(c, primitivo[-1]) for c in primitivo])
+
+
+# Cantidad de bits de la cota de Hadamard de la resultante: ||a||^grado(b) · ||b||^grado(a)
+def _bits_hadamard(a, b):
+    norma_a = sum(c * c for c in a).bit_length() / 2
+    norma_b = sum(c * c for c in b).bit_length() / 2
+    return math.ceil((len(b) - 1) * norma_a + (len(a) - 1) * norma_b) + 2
+
+
+# Resultante de dos polinomios de coeficientes enteros (listas ascendentes, primitivos, no constantes)
+def _resultante_primitivos(a, b, control=None):
+    intercambio = len(a) < len(b)
+    if intercambio:
+        a, b = b, a
+    bits = _bits_hadamard(a, b)
+    indice = 0
+    residuos, primos_usados = [], []
+    producto = 1
+    while producto.bit_length() <= bits:
+        primos, indice = _lote_primos(indice, PRIMOS_POR_LOTE_RESULTANTE, [a[-1], b[-1]])
+        primos, _, resultantes = _euclides_lote(a, b, primos, control)
+        for r, p in zip(resultantes.tolist(), primos):
+            residuos.append([r])
+            primos_usados.append(p)
+            producto *= p
+        if control is not None:
+            control.progreso(min(99, 100 * producto.bit_length() // bits))
+    (valor,), _ = _chino(residuos, primos_usados)
+    # Res(b, a) = (-1)^(grado(a)·grado(b)) Res(a, b)
+    if intercambio and (len(a) - 1) * (len(b) - 1) % 2:
+        valor = -valor
+    return valor
+
+
+# Resultante de dos arreglos de coeficientes: un entero exacto (o una fracción, si los coeficientes
+# no son enteros). Es cero si y solo si los polinomios tienen una raíz común
+def resultante_coeficientes(a, b, control=None):
+    a, b = motor_polinomios._recortar(a), motor_polinomios._recortar(b)
+    enteros_a, denominador_a = _enteros(a)
+    enteros_b, denominador_b = _enteros(b)
+    grado_a, grado_b = len(enteros_a) - 1, len(enteros_b) - 1
+    if _es_cero(enteros_a) or _es_cero(enteros_b):
+        return 0
+    if grado_a == 0:
+        # Con un polinomio constante c, Res = c^(grado del otro) (y 1 si los dos son constantes)
+        resultado = Fraction(enteros_a[0], denominador_a) ** grado_b
+    elif grado_b == 0:
+        resultado = Fraction(enteros_b[0], denominador_b) ** grado_a
+    else:
+        # Res(c·a, b) = c^grado(b) · Res(a, b): se trabaja con las partes primitivas enteras
+        contenido_a, contenido_b = _contenido(enteros_a), _contenido(enteros_b)
+        factor = Fraction(contenido_a, denominador_a) ** grado_b * Fraction(contenido_b, denominador_b) ** grado_a
+        resultado = factor * _resultante_primitivos([c // contenido_a for c in enteros_a],
+                                                    [c // contenido_b for c in enteros_b], control)
+    return int(resultado) if resultado.denominator == 1 else resultado
+
+
+# Versiones sobre polinomios del motor (deben ser de una sola variable)
+def _coeficientes(p, q):
+    variables, a, b = motor_polinomios._unificar(p, q)
+    if not isinstance(a, np.ndarray):
+        raise ValueError("El MCD y la resultante están disponibles para polinomios de una variable.")
+    return variables, a, b
+
+
+def mcd(p, q, control=None):
+    variables, a, b = _coeficientes(p, q)
+    return motor_polinomios.Polinomio(variables, coeficientes=mcd_coeficientes(a, b, control))
+
+
+def resultante(p, q, control=None):
+    _, a, b = _coeficientes(p, q)
+    return resultante_coeficientes(a, b, control)
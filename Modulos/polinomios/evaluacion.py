@@ -0,0 +1,111 @@
+# Evaluación de un polinomio en muchos puntos a la vez.
+# Los puntos se escriben como rango ("inicio:fin:paso"), como lista ("1, 2.5, -3") o se cargan de
+# un archivo (.csv, .txt o .npy). Hay dos métodos:
+# - Horner vectorizado con NumPy (flotantes): un millón de puntos en milisegundos.
+# - Horner exacto: para coeficientes y puntos enteros o fraccionarios, da los valores sin el
+#   redondeo de los flotantes (más lento: cada operación es con enteros de Python).
+# La evaluación rápida con árbol de subproductos no se usa: con flotantes es numéricamente inestable
+# y con aritmética exacta los coeficientes de los subproductos crecen tanto que resulta más lenta
+# que Horner exacto (medido con 1.000 puntos y grado 300).
+import os
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from Modulos.polinomios import motor_polinomios
+
+METODOS = ["Horner (decimales)", "Horner exacto (enteros y fracciones)"]
+
+# Límite de puntos de un rango, para no agotar la memoria por un paso demasiado pequeño
+MAXIMO_PUNTOS = 10_000_000
+
+
+def _separar(texto):
+    for separador in (",", ";", "\t", "\n"):
+        texto = texto.replace(separador, " ")
+    return texto.split()
+
+
+def _rango(inicio, fin, paso, exacto):
+    if paso == 0 or (fin - inicio) / paso < 0:
+        raise ValueError("El paso del rango debe ir de inicio a fin.")
+    cantidad = int((fin - inicio) / paso + 1e-9) + 1
+    if cantidad > MAXIMO_PUNTOS:
+        raise ValueError(f"El rango tiene demasiados puntos ({cantidad:,}).")
+    if exacto:
+        return [inicio + k * paso for k in range(cantidad)]
+    return inicio + paso * np.arange(cantidad)
+
+
+# Lee los puntos escritos como rango "inicio:fin[:paso]" (fin incluido) o como lista de números.
+# Con exacto=True devuelve una lista de fracciones ("0.1" es exactamente 1/10); si no, un arreglo
+def leer_puntos(texto, exacto=False):
+    texto = texto.strip()
+    if not texto:
+        raise ValueError("Escribe al menos un punto.")
+    convertir = Fraction if exacto else float
+    try:
+        if ":" in texto:
+            partes = [convertir(parte) for parte in texto.split(":")]
+            if len(partes) not in (2, 3):
+                raise ValueError
+            inicio, fin, paso = partes if len(partes) == 3 else partes + [convertir(1)]
+            return _rango(inicio, fin, paso, exacto)
+        if exacto:
+            return [Fraction(t) for t in _separar(texto)]
+        return np.array(_separar(texto), dtype=float)
+    except (ValueError, ZeroDivisionError) as e:
+        raise ValueError(f"Puntos inválidos: usa una lista (1, 2, 3) o un rango (inicio:fin:paso). {e}")
+
+
+# Carga los puntos de un archivo: .npy (cualquier forma) o texto con un número por línea o separados
+# por comas (si la primera línea es un encabezado, como "x", se ignora)
+def cargar_puntos(ruta, exacto=False):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".npy":
+        puntos = np.load(ruta).ravel()
+        if not exacto:
+            return puntos.astype(float)
+        return [int(x) if isinstance(x, (int, np.integer)) else Fraction(float(x)) for x in puntos.tolist()]
+    if extension in (".csv", ".txt"):
+        with open(ruta, encoding="utf-8") as archivo:
+            texto = archivo.read()
+        primera, _, resto = texto.partition("\n")
+        if primera.strip() and primera.strip()[0] not in "+-.0123456789":
+            texto = resto
+        return leer_puntos(texto.replace(":", " "), exacto)
+    raise ValueError("Formato no soportado. Usa archivos .csv, .txt o .npy.")
+
+
+# Evalúa el polinomio (de una variable) en todos los puntos y devuelve un informe con los puntos,
+# los valores y el tiempo. Se puede ejecutar en segundo plano (control)
+def evaluar_puntos(p, puntos, metodo=METODOS[0], control=None):
+    if not p.es_univariado() or set(p.variables) - {"x"}:
+        raise ValueError("Para evaluar en varios puntos el polinomio debe depender solo de x.")
+    inicio = time.perf_counter()
+    if metodo == METODOS[1]:
+        if p.coeficientes.dtype == float:
+            raise ValueError("La evaluación exacta necesita coeficientes enteros o fracciones.")
+        valores = motor_polinomios.horner_exacto(p.coeficientes, puntos, control)
+    else:
+        valores = motor_polinomios.horner(p.coeficientes, puntos, control)
+    segundos = time.perf_counter() - inicio
+    return {
+        "puntos": puntos,
+        "valores": valores,
+        "metodo": metodo,
+        "segundos": segundos,
+        "por_segundo": len(puntos) / segundos if segundos > 0 else float("inf"),
+    }
+
+
+# Guarda la tabla x, p(x) como CSV (los valores exactos se escriben como enteros o fracciones)
+def guardar_csv(ruta, puntos, valores):
+    if isinstance(valores, np.ndarray):
+        np.savetxt(ruta, np.column_stack([puntos, valores]), delimiter=",", header="x,p(x)",
+                   comments="", fmt="%.17g")
+        return
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("x,p(x)\n")
+        archivo.writelines(f"{x},{v}\n" for x, v in zip(puntos, valores))
@@ -0,0 +1,534 @@
+# Motor numérico de polinomios sin sympy.
+# Un polinomio en una sola variable se guarda como un arreglo de NumPy con los coeficientes en orden
+# ascendente (coeficientes[k] acompaña a x^k); uno en varias variables, como un diccionario disperso
+# {exponentes: coeficiente}. Así, sumar, multiplicar, derivar, integrar o evaluar un polinomio de
+# grado 10.000 toma milisegundos. Los coeficientes enteros se guardan como int64 (exactos), los
+# decimales como float64 y las fracciones como objetos Fraction, para no perder exactitud.
+# El analizador solo acepta sumas de monomios ("3x^2y - 1/2x + 4"); con paréntesis u otras
+# expresiones lanza ValueError y la calculadora usa sympy.
+import math
+import re
+from fractions import Fraction
+
+import numpy as np
+
+from Modulos.polinomios import transformadas
+
+# Mayor valor absoluto que se deja en int64 sin riesgo de desbordar en una suma o producto de enteros
+LIMITE_INT64 = 2 ** 62
+
+# Longitud del factor más corto a partir de la cual cambia el método del producto (medido con
+# benchmarks/bench_polinomios.py). np.convolve (escolar, en C) le gana a Karatsuba en NumPy, así que
+# Karatsuba solo se usa con enteros grandes de Python; la NTT y la FFT ganan desde estos tamaños
+UMBRAL_KARATSUBA = 64
+UMBRAL_NTT = 4096
+UMBRAL_FFT = 512
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<numero>\d+\.?\d*|\.\d+)
+      | (?P<variable>[a-z])
+      | (?P<operador>[-+*/^])
+      | (?P<error>\S)
+    )
+""", re.VERBOSE)
+
+
+def _tokenizar(texto):
+    for m in _TOKEN.finditer(texto):
+        tipo = m.lastgroup
+        if tipo == "error":
+            raise ValueError(f"El polinomio tiene una expresión que el motor numérico no maneja: '{m.group(tipo)}'")
+        yield tipo, m.group(tipo)
+    yield "fin", None
+
+
+# Enteros exactos (Fraction solo aparece al dividir) y decimales como float
+def _numero(texto):
+    return int(texto) if texto.isdigit() else float(texto)
+
+
+# Lee un polinomio escrito como suma de monomios y devuelve {exponentes por variable: coeficiente}
+# con las variables en el orden en que se usan los exponentes (alfabético)
+def _leer(texto):
+    texto = texto.replace("**", "^").lower()
+    terminos = []
+    tokens = _tokenizar(texto)
+    tipo, valor = next(tokens)
+    if tipo == "fin":
+        raise ValueError("El polinomio está vacío.")
+    while tipo != "fin":
+        signo = 1
+        while tipo == "operador" and valor in "+-":
+            if valor == "-":
+                signo = -signo
+            tipo, valor = next(tokens)
+        coeficiente = signo
+        exponentes = {}
+        hay_factor = False
+        # Factores del monomio: números, variables con exponente opcional, "*" y "/número"
+        while True:
+            if tipo == "numero":
+                coeficiente = coeficiente * _numero(valor)
+                tipo, valor = next(tokens)
+            elif tipo == "variable":
+                variable = valor
+                potencia = 1
+                tipo, valor = next(tokens)
+                if tipo == "operador" and valor == "^":
+                    tipo, valor = next(tokens)
+                    if tipo != "numero" or not valor.isdigit():
+                        raise ValueError("Los exponentes deben ser enteros no negativos.")
+                    potencia = int(valor)
+                    tipo, valor = next(tokens)
+                exponentes[variable] = exponentes.get(variable, 0) + potencia
+            else:
+                break
+            hay_factor = True
+            if tipo == "operador" and valor == "*":
+                tipo, valor = next(tokens)
+                if tipo not in ("numero", "variable"):
+                    raise ValueError("Falta un factor después de '*'.")
+            elif tipo == "operador" and valor == "/":
+                tipo, valor = next(tokens)
+                if tipo != "numero":
+                    raise ValueError("Solo se puede dividir entre números.")
+                divisor = _numero(valor)
+                if divisor == 0:
+                    raise ValueError("División entre cero.")
+                coeficiente = coeficiente / divisor if isinstance(coeficiente, float) or isinstance(divisor, float) else Fraction(coeficiente, divisor)
+                tipo, valor = next(tokens)
+        if not hay_factor:
+            raise ValueError("Término incompleto en el polinomio.")
+        if tipo not in ("fin", "operador") or valor in ("*", "/", "^"):
+            raise ValueError("Falta un operador entre los términos.")
+        terminos.append((exponentes, coeficiente))
+
+    variables = tuple(sorted({v for exponentes, _ in terminos for v in exponentes}))
+    resultado = {}
+    for exponentes, coeficiente in terminos:
+        clave = tuple(exponentes.get(v, 0) for v in variables)
+        resultado[clave] = resultado.get(clave, 0) + coeficiente
+    return variables, resultado
+
+
+# Convierte una lista de coeficientes (int, Fraction o float) en el arreglo más compacto y exacto:
+# int64 si todos son enteros pequeños, float64 si hay decimales y object (Fraction) en otro caso
+def _como_arreglo(valores):
+    if any(isinstance(v, float) for v in valores):
+        return np.array([float(v) for v in valores], dtype=float)
+    valores = [v if isinstance(v, Fraction) and v.denominator != 1 else int(v) for v in valores]
+    if all(isinstance(v, int) and abs(v) < LIMITE_INT64 for v in valores):
+        return np.array(valores, dtype=np.int64)
+    arreglo = np.empty(len(valores), dtype=object)
+    arreglo[:] = valores
+    return arreglo
+
+
+# Quita los ceros de las potencias más altas (el polinomio cero queda como [0])
+def _recortar(coeficientes):
+    distintos = np.flatnonzero(coeficientes != 0)
+    if len(distintos) == 0:
+        return coeficientes[:1] * 0 if len(coeficientes) else np.zeros(1, dtype=np.int64)
+    return coeficientes[:distintos[-1] + 1]
+
+
+# Pasa un arreglo de objetos a int64 cuando todos sus valores son enteros pequeños
+def _compactar(coeficientes):
+    if coeficientes.dtype == object:
+        return _como_arreglo(list(coeficientes))
+    return coeficientes
+
+
+class Polinomio:
+    # Univariado (o constante): "coeficientes" es el arreglo ascendente y "terminos" es None.
+    # Multivariado: "terminos" es el diccionario {exponentes: coeficiente} y "coeficientes" es None
+    def __init__(self, variables, coeficientes=None, terminos=None):
+        self.variables = tuple(variables)
+        if len(self.variables) <= 1:
+            if coeficientes is None:
+                coeficientes = self._denso_desde_terminos(terminos or {})
+            self.coeficientes = _recortar(_compactar(np.asarray(coeficientes)))
+            self.terminos = None
+        else:
+            self.coeficientes = None
+            self.terminos = {e: c for e, c in terminos.items() if c != 0}
+
+    @staticmethod
+    def _denso_desde_terminos(terminos):
+        grado = max((e[0] if e else 0 for e in terminos), default=0)
+        valores = [0] * (grado + 1)
+        for exponentes, coeficiente in terminos.items():
+            valores[exponentes[0] if exponentes else 0] += coeficiente
+        return _como_arreglo(valores)
+
+    def es_univariado(self):
+        return self.terminos is None
+
+    def grado(self):
+        if self.es_univariado():
+            return len(self.coeficientes) - 1
+        return max((sum(e) for e in self.terminos), default=0)
+
+    # Representación dispersa con las variables indicadas (que deben incluir las propias)
+    def a_terminos(self, variables=None):
+        variables = tuple(variables or self.variables)
+        posiciones = [variables.index(v) for v in self.variables]
+        if self.es_univariado():
+            pares = ((((k,) if self.variables else ()), c) for k, c in enumerate(self.coeficientes.tolist()) if c != 0)
+        else:
+            pares = self.terminos.items()
+        terminos = {}
+        for exponentes, coeficiente in pares:
+            clave = [0] * len(variables)
+            for posicion, potencia in zip(posiciones, exponentes):
+                clave[posicion] = potencia
+            terminos[tuple(clave)] = coeficiente
+        return terminos
+
+    def __str__(self):
+        return formatear(self)
+
+
+def analizar(texto):
+    variables, terminos = _leer(texto)
+    return Polinomio(variables, terminos=terminos)
+
+
+# Lleva dos polinomios a las mismas variables: dos arreglos si comparten la variable (o son
+# constantes) y dos diccionarios si no
+def _unificar(p, q):
+    variables = tuple(sorted(set(p.variables) | set(q.variables)))
+    if len(variables) <= 1:
+        return variables, p.coeficientes, q.coeficientes
+    return variables, p.a_terminos(variables), q.a_terminos(variables)
+
+
+def _sumar_arreglos(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    tipo = np.result_type(a, b)
+    if tipo == np.int64 and max(_maximo(a), _maximo(b)) >= LIMITE_INT64 // 2:
+        tipo = object
+    resultado = a.astype(tipo)
+    resultado[:len(b)] += b
+    return resultado
+
+
+def _maximo(a):
+    return abs(int(np.abs(a).max())) if a.dtype == np.int64 and len(a) else 0
+
+
+def sumar(p, q):
+    variables, a, b = _unificar(p, q)
+    if isinstance(a, np.ndarray):
+        return Polinomio(variables, coeficientes=_sumar_arreglos(a, b))
+    terminos = dict(a)
+    for exponentes, coeficiente in b.items():
+        terminos[exponentes] = terminos.get(exponentes, 0) + coeficiente
+    return Polinomio(variables, terminos=terminos)
+
+
+def restar(p, q):
+    return sumar(p, escalar(q, -1))
+
+
+def escalar(p, factor):
+    if p.es_univariado():
+        coeficientes = p.coeficientes
+        if coeficientes.dtype == np.int64 and _maximo(coeficientes) * abs(factor) >= LIMITE_INT64:
+            coeficientes = coeficientes.astype(object)
+        return Polinomio(p.variables, coeficientes=coeficientes * factor)
+    return Polinomio(p.variables, terminos={e: c * factor for e, c in p.terminos.items()})
+
+
+# Producto escolar O(n·m): np.convolve para arreglos numéricos y un doble ciclo con aritmética
+# exacta de Python para enteros grandes
+def _escolar(a, b):
+    if a.dtype != object and b.dtype != object:
+        return np.convolve(a, b)
+    resultado = [0] * (len(a) + len(b) - 1)
+    lista_b = b.tolist()
+    for i, x in enumerate(a.tolist()):
+        if x:
+            for j, y in enumerate(lista_b):
+                resultado[i + j] += x * y
+    return _como_objetos(resultado)
+
+
+def _como_objetos(valores):
+    arreglo = np.empty(len(valores), dtype=object)
+    arreglo[:] = valores
+    return arreglo
+
+
+def _sumar_en(destino, origen, desde):
+    destino[desde:desde + len(origen)] += origen
+
+
+# Karatsuba: tres productos de la mitad de tamaño en lugar de cuatro, O(n^1.585)
+def _karatsuba(a, b):
+    if min(len(a), len(b)) < UMBRAL_KARATSUBA:
+        return _escolar(a, b)
+    m = max(len(a), len(b)) // 2
+    resultado = np.zeros(len(a) + len(b) - 1, dtype=np.result_type(a, b))
+    if len(a) <= m or len(b) <= m:
+        # Factores desbalanceados: se parte solo el más largo y se suman los dos productos desplazados
+        if len(a) <= m:
+            a, b = b, a
+        _sumar_en(resultado, _karatsuba(a[:m], b), 0)
+        _sumar_en(resultado, _karatsuba(a[m:], b), m)
+        return resultado
+    a0, a1, b0, b1 = a[:m], a[m:], b[:m], b[m:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_sumar_arreglos(a0, a1), _sumar_arreglos(b0, b1))
+    _sumar_en(z1, -z0, 0)
+    _sumar_en(z1, -z2, 0)
+    _sumar_en(resultado, z0, 0)
+    _sumar_en(resultado, z1, m)
+    _sumar_en(resultado, z2, 2 * m)
+    return resultado
+
+
+def _maximo_entero(a):
+    return _maximo(a) if a.dtype == np.int64 else max(abs(x) for x in a.tolist())
+
+
+# Producto exacto de dos arreglos de enteros (int64 u objetos int)
+def _multiplicar_enteros(a, b):
+    n = min(len(a), len(b))
+    cota = _maximo_entero(a) * _maximo_entero(b) * n
+    nativo = cota < LIMITE_INT64
+    # Con int64 la NTT le gana a np.convolve desde UMBRAL_NTT; con enteros de Python (mucho más lentos
+    # de multiplicar uno a uno) conviene desde el doble del umbral de Karatsuba
+    umbral = UMBRAL_NTT if nativo else 2 * UMBRAL_KARATSUBA
+    if n >= umbral and transformadas.ntt_aplicable(len(a) + len(b) - 1, cota):
+        return transformadas.convolucion_entera(a, b, cota)
+    if nativo:
+        return np.convolve(a.astype(np.int64), b.astype(np.int64))
+    # Coeficientes demasiado grandes para la NTT: Karatsuba con aritmética exacta
+    return _karatsuba(a.astype(object), b.astype(object))
+
+
+# Producto de dos arreglos de coeficientes (convolución). El método se elige según el tipo de los
+# coeficientes y el tamaño del factor más corto: escolar, Karatsuba (enteros grandes) y NTT exacta
+# para enteros y fracciones o FFT para decimales
+def multiplicar_coeficientes(a, b):
+    if a.dtype == float or b.dtype == float:
+        a, b = a.astype(float), b.astype(float)
+        if min(len(a), len(b)) >= UMBRAL_FFT:
+            return transformadas.convolucion_flotante(a, b)
+        return np.convolve(a, b)
+    # Enteros y fracciones: con el denominador común se multiplican solo enteros
+    denominador_a = _denominador_comun(a)
+    denominador_b = _denominador_comun(b)
+    if denominador_a != 1:
+        a = _como_objetos([int(x * denominador_a) for x in a.tolist()])
+    if denominador_b != 1:
+        b = _como_objetos([int(x * denominador_b) for x in b.tolist()])
+    producto = _multiplicar_enteros(a, b)
+    denominador = denominador_a * denominador_b
+    if denominador != 1:
+        return _como_arreglo([Fraction(x, denominador) for x in producto.tolist()])
+    return _compactar(producto)
+
+
+def _denominador_comun(a):
+    if a.dtype != object:
+        return 1
+    return math.lcm(*(x.denominator for x in a.tolist() if isinstance(x, Fraction)))
+
+
+def multiplicar(p, q):
+    variables, a, b = _unificar(p, q)
+    if isinstance(a, np.ndarray):
+        return Polinomio(variables, coeficientes=multiplicar_coeficientes(a, b))
+    # Polinomios dispersos: cada par de monomios aporta un término
+    terminos = {}
+    for ea, ca in a.items():
+        for eb, cb in b.items():
+            exponentes = tuple(x + y for x, y in zip(ea, eb))
+            terminos[exponentes] = terminos.get(exponentes, 0) + ca * cb
+    return Polinomio(variables, terminos=terminos)
+
+
+# División larga exacta (enteros y fracciones): cada paso resta c·b de una ventana del resto
+def _division_escolar(a, b):
+    resto = a.astype(object)
+    divisor = b.astype(object)
+    lider = Fraction(divisor[-1]) if divisor[-1] != 1 else 1
+    m = len(divisor)
+    cociente = [0] * (len(a) - m + 1)
+    for k in range(len(a) - m, -1, -1):
+        c = resto[k + m - 1] / lider if lider != 1 else resto[k + m - 1]
+        cociente[k] = c
+        if c:
+            resto[k:k + m] -= c * divisor
+    return _como_arreglo(cociente), _recortar(_como_arreglo(list(resto[:m - 1]) or [0]))
+
+
+# División larga de coeficientes: devuelve (cociente, resto) con grado(resto) < grado(b).
+# Es exacta con enteros y fracciones y usa flotantes si alguno de los dos tiene decimales.
+# (La división rápida por inversión de Newton no compensa aquí: con aritmética exacta los
+# coeficientes de la serie inversa crecen y resulta más lenta que la escolar)
+def dividir_coeficientes(a, b):
+    b = _recortar(b)
+    if len(b) == 1 and b[0] == 0:
+        raise ValueError("División entre el polinomio cero.")
+    if len(a) < len(b):
+        return np.zeros(1, dtype=np.int64), a
+    if a.dtype != float and b.dtype != float:
+        return _division_escolar(a, b)
+    resto = a.astype(float)
+    divisor = b.astype(float)
+    m = len(divisor)
+    cociente = np.zeros(len(a) - m + 1)
+    for k in range(len(a) - m, -1, -1):
+        c = resto[k + m - 1] / divisor[-1]
+        cociente[k] = c
+        resto[k:k + m] -= c * divisor
+    return cociente, _recortar(resto[:m - 1] if m > 1 else np.zeros(1))
+
+
+def dividir(p, q):
+    variables, a, b = _unificar(p, q)
+    if not isinstance(a, np.ndarray):
+        raise ValueError("La división de polinomios está disponible para polinomios de una variable.")
+    cociente, resto = dividir_coeficientes(a, b)
+    return Polinomio(variables, coeficientes=cociente), Polinomio(variables, coeficientes=resto)
+
+
+def derivar(p, variable):
+    if variable not in p.variables:
+        return Polinomio((), coeficientes=np.zeros(1, dtype=np.int64))
+    if p.es_univariado():
+        a = p.coeficientes
+        if len(a) == 1:
+            return Polinomio(p.variables, coeficientes=a * 0)
+        potencias = np.arange(1, len(a))
+        if a.dtype == np.int64 and _maximo(a) * len(a) >= LIMITE_INT64:
+            a = a.astype(object)
+            potencias = potencias.astype(object)
+        return Polinomio(p.variables, coeficientes=a[1:] * potencias)
+    i = p.variables.index(variable)
+    terminos = {}
+    for exponentes, coeficiente in p.terminos.items():
+        if exponentes[i]:
+            nuevos = exponentes[:i] + (exponentes[i] - 1,) + exponentes[i + 1:]
+            terminos[nuevos] = coeficiente * exponentes[i]
+    return Polinomio(p.variables, terminos=terminos)
+
+
+# Divide un coeficiente entre un entero sin perder exactitud
+def _dividir(coeficiente, divisor):
+    if isinstance(coeficiente, float):
+        return coeficiente / divisor
+    return Fraction(coeficiente, 1) / divisor
+
+
+# Integral indefinida (sin la constante de integración)
+def integrar(p, variable):
+    variables = tuple(sorted(set(p.variables) | {variable}))
+    if len(variables) == 1:
+        a = p.coeficientes
+        if a.dtype == float:
+            nuevos = np.concatenate(([0.0], a / np.arange(1, len(a) + 1)))
+        else:
+            nuevos = [0] + [_dividir(c, k + 1) for k, c in enumerate(a.tolist())]
+        return Polinomio(variables, coeficientes=_como_arreglo(list(nuevos)))
+    i = variables.index(variable)
+    terminos = {}
+    for exponentes, coeficiente in p.a_terminos(variables).items():
+        nuevos = exponentes[:i] + (exponentes[i] + 1,) + exponentes[i + 1:]
+        terminos[nuevos] = _dividir(coeficiente, exponentes[i] + 1)
+    return Polinomio(variables, terminos=terminos)
+
+
+# Esquema de Horner sobre un arreglo de puntos: n multiplicaciones y sumas por punto, vectorizadas
+# (en el mismo arreglo, sin crear uno nuevo por coeficiente). "control" permite cancelar el cálculo
+def horner(coeficientes, puntos, control=None):
+    puntos = np.asarray(puntos, dtype=float)
+    coeficientes = coeficientes.astype(float)
+    resultado = np.full(puntos.shape, coeficientes[-1])
+    for k, c in enumerate(coeficientes[-2::-1]):
+        resultado *= puntos
+        resultado += c
+        if control is not None and k % 64 == 0:
+            control.verificar()
+            control.progreso(100 * k // len(coeficientes))
+    return resultado
+
+
+# Horner con aritmética exacta (enteros de Python y fracciones) sobre un arreglo de objetos:
+# los ciclos por punto los hace NumPy, pero cada operación es exacta y sin redondeo
+def horner_exacto(coeficientes, puntos, control=None):
+    puntos = _como_objetos(list(puntos))
+    coeficientes = coeficientes.tolist()
+    resultado = np.full(len(puntos), coeficientes[-1], dtype=object)
+    for k, c in enumerate(coeficientes[-2::-1]):
+        resultado *= puntos
+        resultado += c
+        if control is not None and k % 16 == 0:
+            control.verificar()
+            control.progreso(100 * k // len(coeficientes))
+    return [int(v) if isinstance(v, Fraction) and v.denominator == 1 else v for v in resultado.tolist()]
+
+
+# Evalúa en un valor (o arreglo de valores) de la única variable del polinomio
+def evaluar(p, valor):
+    if not p.es_univariado():
+        raise ValueError("Solo se pueden evaluar polinomios de una variable.")
+    return horner(p.coeficientes, valor)
+
+
+def _texto_numero(valor):
+    if isinstance(valor, float):
+        return f"{valor:.15g}"
+    return str(valor)
+
+
+def _texto_monomio(variables, exponentes):
+    partes = []
+    for variable, potencia in zip(variables, exponentes):
+        if potencia == 1:
+            partes.append(variable)
+        elif potencia > 1:
+            partes.append(f"{variable}^{potencia}")
+    return "".join(partes)
+
+
+# Texto del polinomio con las potencias de mayor a menor, como lo mostraba la calculadora con sympy
+# ("3x^2 - x + 1"; las fracciones se escriben como "x^3/3")
+def formatear(p):
+    if p.es_univariado():
+        pares = [(((k,) if p.variables else ()), c) for k, c in enumerate(p.coeficientes.tolist()) if c != 0]
+        pares.reverse()
+    else:
+        # Orden lexicográfico (primero las potencias de x, luego las de y...), el mismo que usa sympy
+        pares = sorted(p.terminos.items(), key=lambda t: t[0], reverse=True)
+    if not pares:
+        return "0"
+
+    textos = []
+    for exponentes, coeficiente in pares:
+        negativo = coeficiente < 0
+        coeficiente = -coeficiente if negativo else coeficiente
+        monomio = _texto_monomio(p.variables, exponentes)
+        denominador = ""
+        if isinstance(coeficiente, Fraction):
+            if coeficiente.denominator != 1 and monomio:
+                denominador = f"/{coeficiente.denominator}"
+                coeficiente = coeficiente.numerator
+            elif coeficiente.denominator == 1:
+                coeficiente = coeficiente.numerator
+        if monomio and coeficiente == 1:
+            texto = monomio
+        else:
+            texto = _texto_numero(coeficiente) + monomio
+        textos.append(("-" if negativo else "+", texto + denominador))
+
+    signo, texto = textos[0]
+    partes = [("-" if signo == "-" else "") + texto]
+    partes += [f" {signo} {texto}" for signo, texto in textos[1:]]
+    return "".join(partes)
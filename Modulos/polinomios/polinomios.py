@@ -12,8 +12,187 @@ import sympy as sp
 # Se importa re, que es la librería de expresiones regulares para buscar o validar patrones en textos
 import re
 
+import os
+from fractions import Fraction
+
+import numpy as np
+
 from Modulos.menu_general.menu_general import MenuGeneral
+from Modulos.polinomios import motor_polinomios
+from Modulos.polinomios import evaluacion
+from Modulos.polinomios import algebra
+from Modulos.polinomios import raices
+from utils import expresiones
 from utils.helpers import resource_path
+from utils.modelo_matriz import ModeloMatriz
+from utils.tareas import obtener_ejecutor, BarraTarea
+
+
+# Función para mostrar el resultado en un formato más limpio
+def presentar_polinomio(expr):
+    texto = str(expr)
+    texto = texto.replace('**', '^')
+    texto = re.sub(r'\b1\*', '', texto)
+    texto = re.sub(r'(\d)\*([a-z])', r'\1\2', texto)
+    texto = texto.replace('*', '')
+    return texto
+
+
+# Tarjetas sin imagen propia: usan la del menú de polinomios
+IMAGENES = {"Raíces": "Polinomios", "División": "Polinomios", "MCD": "Polinomios"}
+
+
+# Se crean variables simbólicas para todas las letras del abecedario
+LETRAS = 'abcdefghijklmnopqrstuvwxyz'
+VARIABLES = dict(zip(LETRAS, sp.symbols(' '.join(LETRAS))))
+
+
+# Realiza la operación sobre los polinomios escritos como texto y devuelve el resultado como texto.
+# "variable" se usa en Derivadas e Integrales y "valor" (el valor de x) en Evaluar.
+# Las sumas de monomios se resuelven con el motor numérico (arreglos de coeficientes); sympy solo se
+# usa cuando el texto tiene paréntesis u otras expresiones que el motor no reconoce
+def operar_polinomios(operacion, polinomio_a, polinomio_b="0", variable=None, valor=None):
+    try:
+        return _operar_numerico(operacion, polinomio_a, polinomio_b, variable, valor)
+    except ValueError:
+        return _operar_simbolico(operacion, polinomio_a, polinomio_b, variable, valor)
+
+
+def _operar_numerico(operacion, polinomio_a, polinomio_b, variable, valor):
+    poly_a = motor_polinomios.analizar(polinomio_a if polinomio_a else "0")
+
+    if operacion == "Sumar":
+        poly_b = motor_polinomios.analizar(polinomio_b if polinomio_b else "0")
+        return motor_polinomios.formatear(motor_polinomios.sumar(poly_a, poly_b))
+
+    if operacion == "Multiplicar":
+        poly_b = motor_polinomios.analizar(polinomio_b if polinomio_b else "0")
+        return motor_polinomios.formatear(motor_polinomios.multiplicar(poly_a, poly_b))
+
+    if operacion == "Derivadas":
+        return motor_polinomios.formatear(motor_polinomios.derivar(poly_a, variable))
+
+    if operacion == "Integrales":
+        return motor_polinomios.formatear(motor_polinomios.integrar(poly_a, variable)) + " + C"
+
+    if operacion == "Evaluar":
+        # Con otras variables además de x el resultado no es un número: lo resuelve sympy
+        if set(poly_a.variables) - {"x"}:
+            raise ValueError("El polinomio tiene variables distintas de x.")
+        resultado_eval = motor_polinomios.evaluar(poly_a, float(valor))
+        return presentar_polinomio(round(float(resultado_eval), 2))
+
+    raise ValueError(f"Operación no soportada: {operacion}")
+
+
+def _operar_simbolico(operacion, polinomio_a, polinomio_b="0", variable=None, valor=None):
+    # Cada letra es una variable (también "e"), por eso el analizador compartido no usa constantes
+    entrada_a = polinomio_a if polinomio_a else "0"
+    entrada_b = polinomio_b if polinomio_b else "0"
+
+    # Operación: Suma
+    if operacion == "Sumar":
+        poly_a = sp.Poly(expresiones.interpretar(entrada_a, constantes=False)).as_expr()
+        poly_b = sp.Poly(expresiones.interpretar(entrada_b, constantes=False)).as_expr()
+        resultado_expr = sp.simplify(poly_a + poly_b)
+        return presentar_polinomio(resultado_expr)
+
+    # Operación: Multiplicación
+    if operacion == "Multiplicar":
+        poly_a = expresiones.interpretar(entrada_a, constantes=False)
+        poly_b = expresiones.interpretar(entrada_b, constantes=False)
+        resultado_expr = sp.expand(poly_a * poly_b)  # ¡Aquí expandimos!
+        return presentar_polinomio(resultado_expr)
+
+    # Operación: Derivada
+    if operacion == "Derivadas":
+        poly_a = expresiones.interpretar(entrada_a, constantes=False)
+        resultado_expr = sp.diff(poly_a, VARIABLES[variable])
+        return presentar_polinomio(resultado_expr)
+
+    # Operación: Integral
+    if operacion == "Integrales":
+        poly_a = expresiones.interpretar(entrada_a, constantes=False)
+        resultado_expr = sp.integrate(poly_a, VARIABLES[variable])
+        return presentar_polinomio(resultado_expr) + " + C"  # Se agrega + C al final por ser una integral indefinida
+
+    # Operación: Evaluación
+    if operacion == "Evaluar":
+        poly_a = expresiones.interpretar(entrada_a, constantes=False)
+        resultado_eval = poly_a.subs(VARIABLES['x'], valor)
+        return presentar_polinomio(round(float(resultado_eval), 2))
+
+    raise ValueError(f"Operación no soportada: {operacion}")
+
+
+# Convierte un coeficiente de sympy en int, Fraction o float para el motor numérico
+def _coeficiente(c):
+    if c.is_Integer:
+        return int(c)
+    if c.is_Rational:
+        return Fraction(int(c.p), int(c.q))
+    return float(c)
+
+
+# Polinomio del motor numérico en la variable x. Si el texto no es una suma de monomios
+# (por ejemplo "(x + 1)^3"), sympy lo expande y se toman sus coeficientes
+def polinomio_en_x(texto):
+    try:
+        return motor_polinomios.analizar(texto)
+    except ValueError:
+        expresion = expresiones.interpretar(texto, constantes=False)
+        coeficientes = sp.Poly(expresion, VARIABLES['x']).all_coeffs()[::-1]
+        return motor_polinomios.Polinomio(("x",), coeficientes=motor_polinomios._como_arreglo(
+            [_coeficiente(c) for c in coeficientes]))
+
+
+# Enteros enormes (como la resultante) se abrevian: primeras y últimas cifras y cantidad de dígitos
+def _abreviar(numero, cifras=40):
+    texto = str(numero)
+    if len(texto) <= 2 * cifras:
+        return texto
+    digitos = len(texto.lstrip("-"))
+    return f"{texto[:cifras]}...{texto[-cifras:]} ({digitos:,} dígitos)"
+
+
+# División, MCD y raíces (polinomios en x). Se ejecuta en segundo plano: "control" permite
+# cancelar el MCD exacto y las iteraciones de las raíces
+def operar_algebra(operacion, polinomio_a, polinomio_b="0", control=None):
+    p = polinomio_en_x(polinomio_a)
+    if operacion == "Raíces":
+        lista, iteraciones = raices.raices(p.coeficientes, control=control)
+        if not lista:
+            return "El polinomio es constante: no tiene raíces."
+        lineas = []
+        for i, (raiz, multiplicidad) in enumerate(lista, start=1):
+            extra = f"  (multiplicidad {multiplicidad})" if multiplicidad > 1 else ""
+            lineas.append(f"x{i} = {raices.formatear_raiz(raiz)}{extra}")
+        return "\n".join(lineas) + f"\n\nIteraciones de Aberth: {iteraciones}"
+
+    q = polinomio_en_x(polinomio_b)
+    if operacion == "División":
+        cociente, resto = motor_polinomios.dividir(p, q)
+        return (f"Cociente: {motor_polinomios.formatear(cociente)}\n"
+                f"Resto: {motor_polinomios.formatear(resto)}")
+    if operacion == "MCD":
+        mcd = algebra.mcd(p, q, control)
+        valor = algebra.resultante(p, q, control)
+        return (f"MCD: {motor_polinomios.formatear(mcd)}\n"
+                f"Resultante: {_abreviar(valor)}")
+    raise ValueError(f"Operación no soportada: {operacion}")
+
+
+# Tabla x, p(x) de la evaluación en varios puntos; los valores exactos se muestran como fracciones
+class ModeloEvaluacion(ModeloMatriz):
+    def formatear(self, valor):
+        if isinstance(valor, (int, Fraction)):
+            return str(valor)
+        return super().formatear(valor)
+
+    def headerData(self, seccion, orientacion, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientacion == Qt.Horizontal:
+            return ["x", "p(x)"][seccion]
+        return super().headerData(seccion, orientacion, role)
 
 
 # Desarrollar funcionalidades para trabajar con polinomios, como suma,
@@ -46,6 +225,9 @@ class MenuPolinomios(QWidget):
             ("Derivadas", self.abrir_derivada),
             ("Integrales", self.abrir_integracion),
             ("Evaluar", self.abrir_evaluacion),
+            ("Raíces", self.abrir_raices),
+            ("División", self.abrir_division),
+            ("MCD", self.abrir_mcd),
         ]
 
         row, col = 0, 0  # Posición inicial en el grid
@@ -78,7 +260,7 @@ class MenuPolinomios(QWidget):
 
         # Imagen decorativa de la operación
         imagen_label = QLabel()
-        ruta_imagen = resource_path(f"images/{texto.lower()}.png")  # Ruta de la imagen
+        ruta_imagen = resource_path(f"images/{IMAGENES.get(texto, texto).lower()}.png")  # Ruta de la imagen
         pixmap = QPixmap(ruta_imagen).scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
         imagen_label.setPixmap(pixmap)
@@ -174,6 +356,15 @@ class MenuPolinomios(QWidget):
     def abrir_evaluacion(self):
         self.abrir_operacion("Evaluar")
 
+    def abrir_raices(self):
+        self.abrir_operacion("Raíces")
+
+    def abrir_division(self):
+        self.abrir_operacion("División")
+
+    def abrir_mcd(self):
+        self.abrir_operacion("MCD")
+
     # Función que abre la ventana correspondiente a la operación seleccionada
     def abrir_operacion(self, operacion):
         self.ventana = CalculadoraPolinomios(operacion)
@@ -214,7 +405,7 @@ class CalculadoraPolinomios(QWidget):
         self.polynomial_b_input.setPlaceholderText("Ejemplo: 3x^2 + 2x + 1 ")
 
         # Mostrar campo B solo si la operación lo necesita
-        if self.operacion in ["Sumar", "Multiplicar"]:
+        if self.operacion in ["Sumar", "Multiplicar", "División", "MCD"]:
             self.layout.addWidget(self.polynomial_b_label)
             self.layout.addWidget(self.polynomial_b_input)
 
@@ -229,9 +420,40 @@ class CalculadoraPolinomios(QWidget):
             border-radius: 10px;
             padding: 10px;
         """)
+        # Evaluar: los valores de x se escriben (uno, una lista o un rango) o se cargan de un archivo
+        self.ruta_puntos = None
+        self.evaluacion_actual = None
+        if self.operacion == "Evaluar":
+            puntos_layout = QHBoxLayout()
+            self.puntos_input = QLineEdit()
+            self.puntos_input.setPlaceholderText("Valores de x: 1.25  |  1, 2, 3  |  0:10:0.5 (inicio:fin:paso)")
+            self.puntos_input.textEdited.connect(self.descartar_archivo)
+            self.boton_cargar_puntos = QPushButton("Cargar puntos")
+            self.boton_cargar_puntos.clicked.connect(self.cargar_puntos)
+            self.selector_metodo = QComboBox()
+            self.selector_metodo.addItems(evaluacion.METODOS)
+            self.etiqueta_archivo = QLabel()
+            puntos_layout.addWidget(self.puntos_input, stretch=1)
+            puntos_layout.addWidget(self.etiqueta_archivo)
+            puntos_layout.addWidget(self.boton_cargar_puntos)
+            puntos_layout.addWidget(self.selector_metodo)
+            self.layout.addWidget(QLabel("Puntos de evaluación:"))
+            self.layout.addLayout(puntos_layout)
+
         self.layout.addWidget(QLabel("Resultado:"))
         self.layout.addWidget(self.resultado)
 
+        # Tabla x, p(x) para la evaluación en varios puntos (virtualizada: admite millones de filas)
+        self.modelo_evaluacion = ModeloEvaluacion()
+        self.tabla_evaluacion = QTableView()
+        self.tabla_evaluacion.setModel(self.modelo_evaluacion)
+        self.tabla_evaluacion.setVisible(False)
+        self.layout.addWidget(self.tabla_evaluacion)
+
+        # Progreso y cancelación de las evaluaciones largas
+        self.barra_tarea = BarraTarea()
+        self.layout.addWidget(self.barra_tarea)
+
         # Botones: Calcular, Limpiar, Volver
         botones_layout = QHBoxLayout()
         self.boton_calcular = QPushButton("Calcular")
@@ -242,6 +464,11 @@ class CalculadoraPolinomios(QWidget):
         self.boton_volver.clicked.connect(self.volver_al_menu)
 
         botones_layout.addWidget(self.boton_calcular)
+        if self.operacion == "Evaluar":
+            self.boton_guardar_csv = QPushButton("Guardar CSV")
+            self.boton_guardar_csv.setEnabled(False)
+            self.boton_guardar_csv.clicked.connect(self.guardar_csv)
+            botones_layout.addWidget(self.boton_guardar_csv)
         botones_layout.addWidget(self.boton_limpiar)
         botones_layout.addWidget(self.boton_volver)
         self.layout.addLayout(botones_layout)
@@ -259,110 +486,142 @@ class CalculadoraPolinomios(QWidget):
             polinomio_b = "0"
             self.polynomial_b_input.setText("0")
 
-        # Función para formatear el texto ingresado en un formato que sympy entienda
-        def formatear_polinomio(entrada):
-            entrada = entrada.replace('^', '**')  # Cambia potencias a formato de Python
-            entrada = entrada.lower()
-            entrada = re.sub(r'([a-z])(?=[a-z])', r'\1*', entrada)
-            entrada = re.sub(r'(\d)([a-z])', r'\1*\2', entrada)
-            entrada = re.sub(r'([a-z])(\d)', r'\1*\2', entrada)
-            entrada = re.sub(r'([a-z])\(', r'\1*(', entrada)
-            return entrada
-
-        # Función para mostrar el resultado en un formato más limpio
-        def presentar_polinomio(expr):
-            texto = str(expr)
-            texto = texto.replace('**', '^')
-            texto = re.sub(r'\b1\*', '', texto)
-            texto = re.sub(r'(\d)\*([a-z])', r'\1\2', texto)
-            texto = texto.replace('*', '')
-            return texto
-
-        # Se crean variables simbólicas para todas las letras del abecedario
-        letras = 'abcdefghijklmnopqrstuvwxyz'
-        variables = sp.symbols(' '.join(letras))
-        variables_dict = dict(zip(letras, variables))
-
         try:
-            # Formatear entradas
-            entrada_a = formatear_polinomio(polinomio_a if polinomio_a else "0")
-            entrada_b = formatear_polinomio(polinomio_b if polinomio_b else "0")
-
-            # Operación: Suma
-            if self.operacion == "Sumar":   
-                poly_a = sp.Poly(sp.sympify(entrada_a, locals=variables_dict)).as_expr()
-                poly_b = sp.Poly(sp.sympify(entrada_b, locals=variables_dict)).as_expr()
-                resultado_expr = sp.simplify(poly_a + poly_b)
-                resultado_str = presentar_polinomio(resultado_expr)
-                self.resultado.setText(f"Resultado:\n{resultado_str}")
-
-            # Operación: Multiplicación
-            elif self.operacion == "Multiplicar":
-                poly_a = sp.sympify(entrada_a, locals=variables_dict)
-                poly_b = sp.sympify(entrada_b, locals=variables_dict)
-                resultado_expr = sp.expand(poly_a * poly_b)  # ¡Aquí expandimos!
-                resultado_str = presentar_polinomio(resultado_expr)
-                self.resultado.setText(f"Resultado:\n{resultado_str}")
-
-
-            # Operación: Derivada
-            elif self.operacion == "Derivadas":
-                var_str, ok = QInputDialog.getText(self, "Variable", "¿Respecto a qué variable quieres derivar? (por ejemplo: x, y, z)")
+            variable = None
+            valor = None
+            # Derivadas e integrales necesitan la variable; la evaluación, el valor de x
+            if self.operacion in ["Derivadas", "Integrales"]:
+                accion = "derivar" if self.operacion == "Derivadas" else "integrar"
+                var_str, ok = QInputDialog.getText(self, "Variable", f"¿Respecto a qué variable quieres {accion}? (por ejemplo: x, y, z)")
                 if not ok or not var_str.isalpha():
                     QMessageBox.warning(self, "Variable inválida", "Debes ingresar una variable válida (una letra como x, y, z).")
                     return
 
-                variable = variables_dict.get(var_str.strip().lower())
-                if variable is None:
+                variable = var_str.strip().lower()
+                if variable not in VARIABLES:
                     QMessageBox.warning(self, "Variable inválida", "Variable no reconocida.")
                     return
 
-                poly_a = sp.sympify(entrada_a, locals=variables_dict)
-                resultado_expr = sp.diff(poly_a, variable)
-                resultado_str = presentar_polinomio(resultado_expr)
-                self.resultado.setText(f"Resultado:\n{resultado_str}")
-
-            # Operación: Integral
-            elif self.operacion == "Integrales":
-                var_str, ok = QInputDialog.getText(self, "Variable", "¿Respecto a qué variable quieres integrar? (por ejemplo: x, y, z)")
-                if not ok or not var_str.isalpha():
-                    QMessageBox.warning(self, "Variable inválida", "Debes ingresar una variable válida (una letra como x, y, z).")
-                    return
-
-                variable = variables_dict.get(var_str.strip().lower())
-                if variable is None:
-                    QMessageBox.warning(self, "Variable inválida", "Variable no reconocida.")
-                    return
+            elif self.operacion == "Evaluar":
+                self.evaluar_puntos(polinomio_a)
+                return
 
-                poly_a = sp.sympify(entrada_a, locals=variables_dict)
-                resultado_expr = sp.integrate(poly_a, variable)
-                resultado_str = presentar_polinomio(resultado_expr) + " + C"  # Se agrega + C al final por ser una integral indefinida
-                self.resultado.setText(f"Resultado:\n{resultado_str}")
+            elif self.operacion in ["Raíces", "División", "MCD"]:
+                self.operar_en_segundo_plano(polinomio_a, polinomio_b)
+                return
 
-            # Operación: Evaluación
-            elif self.operacion == "Evaluar":
-                valor, ok = QInputDialog.getDouble(self, "Evaluar", "¿En qué valor deseas evaluar el polinomio?")
-                if ok:
-                    x = variables_dict['x']
-                    poly_a = sp.sympify(entrada_a, locals=variables_dict)
-                    resultado_eval = poly_a.subs(x, valor)
-                    resultado_str = presentar_polinomio(round(float(resultado_eval), 2))
-                    self.resultado.setText(f"Resultado:\n{resultado_str}")
-                else:
-                    self.resultado.setText("Evaluación cancelada.")
+            resultado_str = operar_polinomios(self.operacion, polinomio_a, polinomio_b, variable, valor)
+            self.resultado.setText(f"Resultado:\n{resultado_str}")
 
         except Exception as e:
             # Si ocurre un error en el proceso, se muestra un mensaje de advertencia
             self.resultado.setText("Error en el procesamiento del polinomio.\nVerifica la sintaxis.\nEjemplo: 3x^2 + 2x + 1")
 
+    # Raíces, división y MCD pueden tardar con grados altos: se calculan en segundo plano
+    def operar_en_segundo_plano(self, polinomio_a, polinomio_b):
+        self.boton_calcular.setEnabled(False)
+        self.resultado.setText("Calculando...")
+        tarea = obtener_ejecutor().ejecutar(
+            operar_algebra, self.operacion, polinomio_a, polinomio_b,
+            al_resultado=lambda texto: self.resultado.setText(f"Resultado:\n{texto}"),
+            al_error=lambda e: self.resultado.setText(f"No se pudo calcular:\n{e}"),
+            al_cancelar=lambda: self.resultado.setText("Cálculo cancelado."),
+            al_terminar=lambda: self.boton_calcular.setEnabled(True),
+        )
+        self.barra_tarea.seguir(tarea)
+
+    # Evalúa el polinomio en todos los puntos en segundo plano y muestra la tabla x, p(x)
+    def evaluar_puntos(self, polinomio_a):
+        metodo = self.selector_metodo.currentText()
+        exacto = metodo == evaluacion.METODOS[1]
+        try:
+            polinomio = polinomio_en_x(polinomio_a)
+            if self.ruta_puntos:
+                puntos = evaluacion.cargar_puntos(self.ruta_puntos, exacto)
+            else:
+                puntos = evaluacion.leer_puntos(self.puntos_input.text(), exacto)
+        except ValueError as e:
+            self.resultado.setText(str(e))
+            return
+        except Exception:
+            self.resultado.setText("Error en el procesamiento del polinomio.\nVerifica la sintaxis.\nEjemplo: 3x^2 + 2x + 1")
+            return
+
+        self.boton_calcular.setEnabled(False)
+        self.resultado.setText(f"Evaluando en {len(puntos):,} puntos...")
+        tarea = obtener_ejecutor().ejecutar(
+            evaluacion.evaluar_puntos, polinomio, puntos, metodo,
+            al_resultado=self.mostrar_evaluacion,
+            al_error=lambda e: self.resultado.setText(f"No se pudo evaluar:\n{e}"),
+            al_cancelar=lambda: self.resultado.setText("Evaluación cancelada."),
+            al_terminar=lambda: self.boton_calcular.setEnabled(True),
+        )
+        self.barra_tarea.seguir(tarea)
+
+    def mostrar_evaluacion(self, informe):
+        puntos, valores = informe["puntos"], informe["valores"]
+        self.evaluacion_actual = informe
+        self.boton_guardar_csv.setEnabled(True)
+        if len(puntos) == 1:
+            # Un solo valor: se muestra como antes, redondeado a dos decimales si no es exacto
+            valor = valores[0]
+            texto = str(valor) if isinstance(valor, (int, Fraction)) else presentar_polinomio(round(float(valor), 2))
+            self.tabla_evaluacion.setVisible(False)
+            self.resultado.setText(f"Resultado:\n{texto}")
+            return
+        if isinstance(valores, np.ndarray):
+            tabla = np.column_stack([puntos, valores])
+        else:
+            tabla = np.empty((len(puntos), 2), dtype=object)
+            tabla[:, 0] = puntos
+            tabla[:, 1] = valores
+        self.modelo_evaluacion.establecer_matriz(tabla)
+        self.tabla_evaluacion.setVisible(True)
+        self.resultado.setText(
+            f"{len(puntos):,} puntos evaluados con {informe['metodo']}.\n"
+            f"Tiempo: {informe['segundos'] * 1000:.2f} ms | {informe['por_segundo']:,.0f} puntos por segundo"
+        )
+
+    def cargar_puntos(self):
+        ruta, _ = QFileDialog.getOpenFileName(
+            self, "Cargar puntos", "", "Puntos (*.csv *.txt *.npy);;Todos los archivos (*)"
+        )
+        if ruta:
+            self.ruta_puntos = ruta
+            self.puntos_input.clear()
+            self.etiqueta_archivo.setText(f"📄 {os.path.basename(ruta)}")
+
+    # Al escribir en el campo de puntos se deja de usar el archivo cargado
+    def descartar_archivo(self):
+        self.ruta_puntos = None
+        self.etiqueta_archivo.clear()
+
+    def guardar_csv(self):
+        if self.evaluacion_actual is None:
+            return
+        ruta, _ = QFileDialog.getSaveFileName(self, "Guardar evaluación", "evaluacion.csv", "CSV (*.csv)")
+        if not ruta:
+            return
+        try:
+            evaluacion.guardar_csv(ruta, self.evaluacion_actual["puntos"], self.evaluacion_actual["valores"])
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"No se pudo guardar el archivo:\n{e}")
+
     # Limpia todos los campos de entrada y resultado
     def limpiar_campos(self):
         self.polynomial_a_input.clear()
         self.polynomial_b_input.clear()
         self.resultado.clear()
+        if self.operacion == "Evaluar":
+            self.descartar_archivo()
+            self.evaluacion_actual = None
+            self.puntos_input.clear()
+            self.tabla_evaluacion.setVisible(False)
+            self.boton_guardar_csv.setEnabled(False)
 
     # Regresa al menú anterior
     def volver_al_menu(self):
+        self.barra_tarea.cancelar()
         self.menu = MenuPolinomios()
         self.menu.show()
         self.close()
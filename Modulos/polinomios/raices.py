@@ -0,0 +1,169 @@
+# Raíces (reales y complejas) de un polinomio en una variable.
+# - Hasta grado UMBRAL_COMPANERA, las aproximaciones iniciales son los valores propios de la matriz
+#   compañera (escalada, como np.polynomial). Con grados mayores eso cuesta O(n³) y se parte de
+#   puntos sobre un círculo.
+# - Después se refinan todas a la vez con el método de Aberth-Ehrlich (Newton con repulsión entre
+#   raíces), vectorizado con NumPy: cada iteración cuesta O(n²) y converge en pocas iteraciones.
+# Las raíces múltiples se separan antes (factorización libre de cuadrados con el MCD exacto; los
+# decimales se toman como fracciones) para que Aberth trabaje con raíces simples y cada raíz se
+# informe con su multiplicidad.
+from fractions import Fraction
+
+import numpy as np
+
+from Modulos.polinomios import algebra
+from Modulos.polinomios import motor_polinomios
+
+UMBRAL_COMPANERA = 400
+MAXIMO_ITERACIONES = 200
+
+# Elementos máximos de cada bloque de la matriz de diferencias z_k - z_j (limita la memoria)
+BLOQUE_DIFERENCIAS = 2_000_000
+
+
+# Coeficientes como flotantes, escalados por el mayor para no desbordar con enteros enormes
+def _flotantes(coeficientes):
+    if coeficientes.dtype == object:
+        mayor = max(abs(Fraction(c)) for c in coeficientes.tolist())
+        return np.array([float(Fraction(c) / mayor) for c in coeficientes.tolist()])
+    coeficientes = coeficientes.astype(float)
+    return coeficientes / np.abs(coeficientes).max()
+
+
+# Cociente p(z)/p'(z) para cada z y si |p(z)| ya está al nivel del error de redondeo
+# (|p(z)| <= eps·Σ|a_i||z|^i, el criterio de parada habitual de Aberth). Para |z| > 1 se evalúa
+# el polinomio invertido en 1/z, así z^n no desborda aunque el grado sea alto:
+# p(z)/p'(z) = z·q(y) / (n·q(y) - y·q'(y)), y = 1/z
+def _cociente_newton(c, z):
+    n = len(c) - 1
+    cociente = np.empty_like(z)
+    ruido = np.empty(len(z), dtype=bool)
+    dentro = np.abs(z) <= 1
+    for mascara, coeficientes, puntos in ((dentro, c, z[dentro]), (~dentro, c[::-1], 1 / z[~dentro])):
+        valor = np.full(puntos.shape, coeficientes[-1], dtype=complex)
+        derivada = np.zeros(puntos.shape, dtype=complex)
+        cota = np.full(puntos.shape, abs(coeficientes[-1]))
+        modulo = np.abs(puntos)
+        for a in coeficientes[-2::-1]:
+            derivada = derivada * puntos + valor
+            valor = valor * puntos + a
+            cota = cota * modulo + abs(a)
+        ruido[mascara] = np.abs(valor) <= np.finfo(float).eps * cota
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if mascara is dentro:
+                cociente[mascara] = valor / derivada
+            else:
+                cociente[mascara] = valor / (puntos * (n * valor - puntos * derivada))
+    return np.where(np.isfinite(cociente), cociente, 0), ruido
+
+
+# Suma de 1/(z_k - z_j) para j ≠ k, por bloques de filas
+def _repulsion(z, indices):
+    suma = np.empty(len(indices), dtype=complex)
+    filas = max(1, BLOQUE_DIFERENCIAS // len(z))
+    for inicio in range(0, len(indices), filas):
+        bloque = indices[inicio:inicio + filas]
+        diferencias = z[bloque, None] - z[None, :]
+        diferencias[np.arange(len(bloque)), bloque] = np.inf
+        suma[inicio:inicio + filas] = (1 / diferencias).sum(axis=1)
+    return suma
+
+
+# Puntos iniciales sobre un círculo de radio (|a0|/|an|)^(1/n), girados para romper la simetría
+def _iniciales(c):
+    n = len(c) - 1
+    radio = (abs(c[0]) / abs(c[-1])) ** (1 / n) if c[0] != 0 else 1.0
+    angulos = 2 * np.pi * np.arange(n) / n + 0.4
+    return radio * np.exp(1j * angulos)
+
+
+# Una raíz deja de refinarse cuando la corrección es menor que la tolerancia relativa o cuando el
+# valor del polinomio ya es ruido de redondeo (raíces mal condicionadas, como las de Wilkinson)
+def _aberth(c, z, tolerancia, control=None):
+    activas = np.ones(len(z), dtype=bool)
+    iteraciones = 0
+    while activas.any() and iteraciones < MAXIMO_ITERACIONES:
+        indices = np.flatnonzero(activas)
+        w, ruido = _cociente_newton(c, z[indices])
+        correccion = w / (1 - w * _repulsion(z, indices))
+        correccion = np.where(np.isfinite(correccion) & ~ruido, correccion, 0)
+        z[indices] -= correccion
+        escala = np.maximum(np.abs(z[indices]), 1e-300)
+        activas[indices] = ~ruido & (np.abs(correccion) > tolerancia * escala)
+        iteraciones += 1
+        if control is not None:
+            control.verificar()
+            control.progreso(min(99, 100 * (len(z) - int(activas.sum())) // len(z)))
+    return z, iteraciones
+
+
+# Raíces simples (o aproximadas) de los coeficientes: devuelve (raíces, iteraciones de Aberth)
+def _raices_simples(coeficientes, tolerancia, control=None):
+    c = _flotantes(motor_polinomios._recortar(coeficientes))
+    n = len(c) - 1
+    if n < 1:
+        return np.array([], dtype=complex), 0
+    if n == 1:
+        return np.array([-c[0] / c[1]], dtype=complex), 0
+    if n <= UMBRAL_COMPANERA:
+        z = np.linalg.eigvals(np.polynomial.polynomial.polycompanion(c)).astype(complex)
+    else:
+        z = _iniciales(c)
+    return _aberth(c, z, tolerancia, control)
+
+
+# Factorización libre de cuadrados (algoritmo de Yun) con el MCD exacto: lista de
+# (factor, multiplicidad) cuyos factores solo tienen raíces simples
+def _libre_de_cuadrados(a, control=None):
+    derivada = a[1:] * np.arange(1, len(a), dtype=object)
+    g = algebra.mcd_coeficientes(a, derivada, control)
+    if len(g) == 1:
+        return [(a, 1)]
+    w = motor_polinomios.dividir_coeficientes(a, g)[0]
+    y = motor_polinomios.dividir_coeficientes(derivada, g)[0]
+    factores = []
+    multiplicidad = 1
+    while len(w) > 1:
+        derivada_w = w[1:] * np.arange(1, len(w), dtype=object) if len(w) > 1 else np.zeros(1, dtype=object)
+        z = motor_polinomios._sumar_arreglos(y.astype(object), -derivada_w)
+        h = algebra.mcd_coeficientes(w, motor_polinomios._recortar(z), control)
+        if len(h) > 1:
+            factores.append((h, multiplicidad))
+        w = motor_polinomios.dividir_coeficientes(w, h)[0]
+        y = motor_polinomios.dividir_coeficientes(z, h)[0]
+        multiplicidad += 1
+    return factores
+
+
+# Raíces con su multiplicidad: lista de (raíz compleja, multiplicidad) ordenada por parte real.
+# Las raíces nulas (x^k como factor) se separan antes; "tolerancia" es el cambio relativo con el
+# que Aberth da por convergida una raíz
+def raices(coeficientes, tolerancia=1e-15, control=None):
+    coeficientes = motor_polinomios._recortar(coeficientes)
+    if len(coeficientes) == 1:
+        if coeficientes[0] == 0:
+            raise ValueError("El polinomio cero tiene infinitas raíces.")
+        return [], 0
+    nulas = int(np.argmax(coeficientes != 0))
+    coeficientes = coeficientes[nulas:]
+    resultado = [(0j, nulas)] if nulas else []
+    iteraciones = 0
+    # Los decimales se toman como fracciones exactas, así también se detectan sus raíces múltiples
+    enteros, _ = algebra._enteros(coeficientes)
+    factores = _libre_de_cuadrados(motor_polinomios._como_objetos(enteros), control)
+    for factor, multiplicidad in factores:
+        z, k = _raices_simples(factor, tolerancia, control)
+        iteraciones = max(iteraciones, k)
+        resultado.extend((complex(r), multiplicidad) for r in z)
+    resultado.sort(key=lambda t: (round(t[0].real, 12), t[0].imag))
+    return resultado, iteraciones
+
+
+# Texto de una raíz: real si la parte imaginaria es despreciable
+def formatear_raiz(z, decimales=10):
+    escala = max(1.0, abs(z))
+    real = 0.0 if abs(z.real) < 1e-14 * escala else z.real
+    if abs(z.imag) <= 1e-10 * escala:
+        return f"{real:.{decimales}g}"
+    signo = "-" if z.imag < 0 else "+"
+    return f"{real:.{decimales}g} {signo} {abs(z.imag):.{decimales}g}i"
@@ -0,0 +1,112 @@
+# Convolución rápida de coeficientes con transformadas, en O(n log n):
+# - NTT (transformada teórica de números) para coeficientes enteros: se trabaja módulo primos de la
+#   forma c·2^k + 1 y el resultado se reconstruye con el teorema chino del resto, así que es exacto.
+# - FFT real de NumPy para coeficientes decimales.
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Primos p = c·2^k + 1 con raíz primitiva 3; admiten transformadas de hasta 2^23 puntos
+PRIMOS_NTT = (998244353, 167772161, 469762049)
+RAIZ_NTT = 3
+MAXIMO_NTT = 2 ** 23
+
+
+# Índices de la permutación por inversión de bits para n = 2^k puntos (se reutilizan entre productos)
+@lru_cache(maxsize=32)
+def _inversion_bits(n):
+    bits = n.bit_length() - 1
+    indices = np.arange(n)
+    invertidos = np.zeros(n, dtype=np.int64)
+    for _ in range(bits):
+        invertidos = (invertidos << 1) | (indices & 1)
+        indices >>= 1
+    return invertidos
+
+
+# Potencias w^0, w^1, ..., w^(n/2 - 1) módulo p, duplicando la tabla en cada paso
+@lru_cache(maxsize=64)
+def _potencias(w, n, p):
+    tabla = np.ones(max(n // 2, 1), dtype=np.uint64)
+    k = 1
+    while k < n // 2:
+        tabla[k:2 * k] = tabla[:k] * np.uint64(pow(w, k, p)) % np.uint64(p)
+        k *= 2
+    return tabla
+
+
+# NTT iterativa (Cooley-Tukey) vectorizada por etapas; los valores están en [0, p) y caben en uint64
+def _ntt(a, p, inversa=False):
+    n = len(a)
+    a = a[_inversion_bits(n)]
+    w = pow(RAIZ_NTT, (p - 1) // n, p)
+    if inversa:
+        w = pow(w, p - 2, p)
+    tabla = _potencias(w, n, p)
+    modulo = np.uint64(p)
+    mitad = 1
+    while mitad < n:
+        bloques = a.reshape(-1, 2 * mitad)
+        u = bloques[:, :mitad].copy()
+        v = bloques[:, mitad:] * tabla[::n // (2 * mitad)] % modulo
+        bloques[:, :mitad] = (u + v) % modulo
+        bloques[:, mitad:] = (u + modulo - v) % modulo
+        mitad *= 2
+    if inversa:
+        a = a * np.uint64(pow(n, p - 2, p)) % modulo
+    return a
+
+
+# Reduce los coeficientes módulo p (vectorizado si están en int64) y los completa con ceros hasta n
+def _reducir(a, p, n):
+    reducido = np.zeros(n, dtype=np.uint64)
+    if a.dtype == np.int64:
+        reducido[:len(a)] = a % p
+    else:
+        reducido[:len(a)] = [x % p for x in a.tolist()]
+    return reducido
+
+
+def _convolucion_modular(a, b, p, n):
+    fa = _reducir(a, p, n)
+    fb = _reducir(b, p, n)
+    producto = _ntt(fa, p) * _ntt(fb, p) % np.uint64(p)
+    return _ntt(producto, p, inversa=True)[:len(a) + len(b) - 1]
+
+
+# ¿Alcanza la NTT con los primos disponibles? cota = máximo valor absoluto posible del resultado
+def ntt_aplicable(longitud, cota):
+    return longitud <= MAXIMO_NTT and 2 * cota < math.prod(PRIMOS_NTT)
+
+
+# Producto exacto de dos arreglos de enteros (int64 u objetos int) con NTT. Usa dos primos si el
+# resultado cabe en int64 y tres (con reconstrucción en enteros de Python) si es más grande
+def convolucion_entera(a, b, cota):
+    n = 1 << (len(a) + len(b) - 2).bit_length()
+    p1, p2, p3 = PRIMOS_NTT
+    r1 = _convolucion_modular(a, b, p1, n).astype(np.int64)
+    r2 = _convolucion_modular(a, b, p2, n).astype(np.int64)
+    # Garner: x = r1 + p1·x2 (mod p1·p2), con x2 = (r2 - r1)·p1⁻¹ (mod p2)
+    x2 = (r2 - r1 % p2) % p2 * pow(p1, -1, p2) % p2
+    if 2 * cota < p1 * p2:
+        x = r1 + p1 * x2
+        modulo = p1 * p2
+        return np.where(x > modulo // 2, x - modulo, x)
+    r3 = _convolucion_modular(a, b, p3, n).astype(np.int64)
+    # Tercer dígito de Garner módulo p3 (todos los productos intermedios caben en int64)
+    parcial = (r1 % p3 + p1 % p3 * x2 % p3) % p3
+    x3 = (r3 - parcial) % p3 * pow(p1 * p2, -1, p3) % p3
+    modulo = p1 * p2 * p3
+    resultado = np.empty(len(r1), dtype=object)
+    for i, (d1, d2, d3) in enumerate(zip(r1.tolist(), x2.tolist(), x3.tolist())):
+        x = d1 + p1 * d2 + p1 * p2 * d3
+        resultado[i] = x - modulo if x > modulo // 2 else x
+    return resultado
+
+
+# Producto de dos arreglos de flotantes con la FFT real
+def convolucion_flotante(a, b):
+    longitud = len(a) + len(b) - 1
+    n = 1 << (longitud - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)[:longitud]
@@ -9,6 +9,22 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import numpy as np
 
+
+# Recta de mínimos cuadrados Y = b0 + b1·X
+def ajustar_recta(x, y):
+    b1 = np.cov(x, y, bias=True)[0][1] / np.var(x)
+    b0 = np.mean(y) - b1 * np.mean(x)
+    return b0, b1
+
+
+def coeficiente_r2(x, y):
+    b0, b1 = ajustar_recta(x, y)
+    y_pred = b0 + b1 * x
+    ss_tot = np.sum((y - np.mean(y))**2)
+    ss_res = np.sum((y - y_pred)**2)
+    return 1 - ss_res / ss_tot
+
+
 class RegresionLineal(QWidget):
     def __init__(self):
         super().__init__()
@@ -128,16 +144,14 @@ class RegresionLineal(QWidget):
         if len(x) < 2:
             self.resultado_text.setText("Se requieren al menos 2 datos.")
             return
-        b1 = np.cov(x, y, bias=True)[0][1] / np.var(x)
-        b0 = np.mean(y) - b1 * np.mean(x)
+        b0, b1 = ajustar_recta(x, y)
         self.resultado_text.setText(f"b0 (intercepto): {b0:.2f}\nb1 (pendiente): {b1:.2f}")
 
     def calcular_prediccion(self):
         x, y = self.obtener_datos()
         try:
             x_pred = float(self.x_pred_input.text())
-            b1 = np.cov(x, y, bias=True)[0][1] / np.var(x)
-            b0 = np.mean(y) - b1 * np.mean(x)
+            b0, b1 = ajustar_recta(x, y)
             y_pred = b0 + b1 * x_pred
             self.resultado_text.setText(f"Predicción para X={x_pred}: Y={y_pred:.2f}")
         except Exception:
@@ -145,13 +159,7 @@ class RegresionLineal(QWidget):
 
     def calcular_r2(self):
         x, y = self.obtener_datos()
-        y_mean = np.mean(y)
-        b1 = np.cov(x, y, bias=True)[0][1] / np.var(x)
-        b0 = np.mean(y) - b1 * np.mean(x)
-        y_pred = b0 + b1 * x
-        ss_tot = np.sum((y - y_mean)**2)
-        ss_res = np.sum((y - y_pred)**2)
-        r2 = 1 - ss_res / ss_tot
+        r2 = coeficiente_r2(x, y)
         self.resultado_text.setText(f"Coeficiente de determinación R² = {r2:.2f}")
 
     def calcular_correlacion(self):
@@ -164,8 +172,7 @@ class RegresionLineal(QWidget):
         if len(x) < 2:
             self.resultado_text.setText("Se requieren al menos 2 datos para graficar.")
             return
-        b1 = np.cov(x, y, bias=True)[0][1] / np.var(x)
-        b0 = np.mean(y) - b1 * np.mean(x)
+        b0, b1 = ajustar_recta(x, y)
         y_pred = b0 + b1 * x
         self.ax.clear()
         self.ax.scatter(x, y, color='blue', label='Datos')
@@ -6,6 +6,17 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 import numpy as np
 
+
+# Coeficientes de Y = β0 + β1·X1 + ... + βk·Xk por mínimos cuadrados y el R² del ajuste
+def ajustar_regresion_multiple(X, y):
+    X_b = np.hstack([np.ones((X.shape[0], 1)), X])
+    beta = np.linalg.pinv(X_b.T @ X_b) @ X_b.T @ y.reshape(-1, 1)
+    y_pred = X_b @ beta
+    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    ss_res = np.sum((y - y_pred.flatten()) ** 2)
+    return beta.flatten(), 1 - ss_res / ss_tot
+
+
 class RegresionLinealMultiple(QWidget):
     def __init__(self):
         super().__init__()
@@ -148,14 +159,7 @@ class RegresionLinealMultiple(QWidget):
             self.resultado_text.setText("Se necesitan mínimo 2 observaciones y 1 variable.")
             return
         try:
-            X_b = np.hstack([np.ones((X.shape[0], 1)), X])
-            beta = np.linalg.pinv(X_b.T @ X_b) @ X_b.T @ y.reshape(-1, 1)
-
-            self.beta = beta.flatten()
-            y_pred = X_b @ beta
-            ss_tot = np.sum((y - np.mean(y)) ** 2)
-            ss_res = np.sum((y - y_pred.flatten()) ** 2)
-            r2 = 1 - ss_res / ss_tot
+            self.beta, r2 = ajustar_regresion_multiple(X, y)
 
             ecuacion = f"Y = {self.beta[0]:.4f} " + " ".join(
                 [f"+ ({b:.4f})X{i+1}" for i, b in enumerate(self.beta[1:])]
@@ -1,17 +1,19 @@
 import sys
 import numpy as np
-from fractions import Fraction
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QGridLayout, QTableWidget, QTableWidgetItem, QMessageBox,
     QScrollArea
 )
-from PyQt5.QtCore import Qt, QRegExp
-from PyQt5.QtGui import QRegExpValidator, QDoubleValidator
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QDoubleValidator
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Editor de matrices virtualizado: no crea un QLineEdit por celda
+from utils.editor_matriz import EditorMatriz
+
 
 class VectoresPropios(QWidget):
     def __init__(self):
@@ -25,9 +27,6 @@ class VectoresPropios(QWidget):
         # Columna izquierda (entradas)
         self.layout_izquierda = QVBoxLayout()
 
-        # Validador para fracciones y decimales
-        self.fraccion_valida = QRegExpValidator(QRegExp(r"^-?\d+(\.\d+)?(/\d+)?$"))
-
         # Contenedor para todos los inputs
         inputs_layout = QVBoxLayout()
 
@@ -65,22 +64,14 @@ class VectoresPropios(QWidget):
 
         self.layout_izquierda.addLayout(inputs_layout)
 
-        # Contenedor para matriz A y x0
-        self.matrix_container = QWidget()
-        self.matrix_layout = QVBoxLayout(self.matrix_container)
-        self.grid_widget = QWidget()
-        self.grid_layout = QGridLayout(self.grid_widget)
-        self.x0_container = QWidget()
-        self.x0_grid_layout = QGridLayout(self.x0_container)
-        self.matrix_layout.addWidget(QLabel("Matriz A"))
-        self.matrix_layout.addWidget(self.grid_widget)
-        self.matrix_layout.addWidget(QLabel("Condiciones iniciales (x0)"))
-        self.matrix_layout.addWidget(self.x0_container)
-
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.matrix_container)
-        self.layout_izquierda.addWidget(self.scroll_area)
+        # Editores de la matriz A y de x0 (x0 se muestra como fila para ahorrar espacio)
+        self.editor_matriz = EditorMatriz()
+        self.editor_x0 = EditorMatriz(herramientas=False)
+        self.editor_x0.setMaximumHeight(90)
+        self.layout_izquierda.addWidget(QLabel("Matriz A"))
+        self.layout_izquierda.addWidget(self.editor_matriz, stretch=1)
+        self.layout_izquierda.addWidget(QLabel("Condiciones iniciales (x0)"))
+        self.layout_izquierda.addWidget(self.editor_x0)
 
         # Botones
         botones_layout = QHBoxLayout()
@@ -127,9 +118,6 @@ class VectoresPropios(QWidget):
         self.scroll_resultado.setWidget(self.container_derecho)
         self.layout_principal.addWidget(self.scroll_resultado, 2)
 
-        self.celdas_matriz = []
-        self.celdas_x0 = []
-
     def crear_matriz(self):
         try:
             tamano = int(self.input_tamano.text())
@@ -139,66 +127,17 @@ class VectoresPropios(QWidget):
             QMessageBox.warning(self, "Entrada inválida", "Introduce un número entero positivo para el tamaño de la matriz.")
             return
 
-        # Limpiar matriz anterior
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        # Limpiar x0 anterior
-        for i in reversed(range(self.x0_grid_layout.count())):
-            widget = self.x0_grid_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-
-        # Crear entradas para matriz A
-        self.celdas_matriz = []
-        for i in range(tamano):
-            fila = []
-            for j in range(tamano):
-                celda = QLineEdit("0")
-                celda.setFixedSize(150, 150)
-                celda.setAlignment(Qt.AlignCenter)
-                celda.setValidator(self.fraccion_valida)
-                self.grid_layout.addWidget(celda, i, j)
-                fila.append(celda)
-            self.celdas_matriz.append(fila)
-
-        # Crear entradas para x0
-        self.celdas_x0 = []
-        for i in range(tamano):
-            celda = QLineEdit("0")
-            celda.setFixedSize(150, 150)
-            celda.setAlignment(Qt.AlignCenter)
-            celda.setValidator(self.fraccion_valida)
-            self.x0_grid_layout.addWidget(celda, i, 0)
-            self.celdas_x0.append([celda])
-
+        # Crea las celdas de A y de x0 en cero
+        self.editor_matriz.establecer_matriz(np.zeros((tamano, tamano)))
+        self.editor_x0.establecer_matriz(np.zeros((1, tamano)))
         self.boton_calcular.setEnabled(True)
 
     def calcular_valores_vectores(self):
         try:
-            # Obtener matriz A
-            tamano = len(self.celdas_matriz)
-            matriz = np.zeros((tamano, tamano))
-            for i in range(tamano):
-                for j in range(tamano):
-                    texto = self.celdas_matriz[i][j].text()
-                    try:
-                        valor = float(Fraction(texto))
-                        matriz[i][j] = valor
-                    except:
-                        raise ValueError(f"Valor no válido en la celda ({i+1}, {j+1})")
-
-            # Obtener x0
-            x0 = np.zeros((tamano, 1))
-            for i in range(tamano):
-                texto = self.celdas_x0[i][0].text()
-                try:
-                    valor = float(Fraction(texto))
-                    x0[i, 0] = valor
-                except:
-                    raise ValueError(f"Valor no válido en x0, posición {i+1}")
+            # Obtener matriz A y x0 (el editor solo acepta números válidos)
+            matriz = self.editor_matriz.matriz()
+            tamano = matriz.shape[0]
+            x0 = self.editor_x0.matriz().reshape(tamano, 1)
 
             # Obtener h y n
             try:
@@ -289,20 +228,12 @@ class VectoresPropios(QWidget):
         self.input_tamano.clear()
         self.input_h.clear()
         self.input_n.clear()
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
-        for i in reversed(range(self.x0_grid_layout.count())):
-            widget = self.x0_grid_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.setParent(None)
+        self.editor_matriz.establecer_matriz(np.zeros((0, 0)))
+        self.editor_x0.establecer_matriz(np.zeros((0, 0)))
         self.result_table.setRowCount(0)
         self.result_table.setColumnCount(0)
         self.ax.clear()
         self.canvas.draw()
-        self.celdas_matriz = []
-        self.celdas_x0 = []
         self.boton_calcular.setEnabled(False)
 
     def volver(self):
@@ -1,21 +1,42 @@
 
 # Proporciona acceso a variables y funciones del sistema
+import multiprocessing
 import sys
 
 from PyQt5.QtWidgets import *  # También importa todos los widgets
 
+# Se importa QTimer para programar la precarga cuando el menú ya está visible
+from PyQt5.QtCore import QTimer
+
 from Modulos.menu_general.menu_general import MenuGeneral
 # from Modulos.vectores.vectores import MenuVectores
 from utils.helpers import resource_path
+from utils.importaciones import precargar_en_segundo_plano, reportar_tiempos_importacion
+
+
+# Código de ejecución de la aplicación. Va dentro de main() porque los procesos de cálculo
+# (utils.tareas) se inician con "spawn" en Windows y en el ejecutable de PyInstaller: cada proceso
+# hijo vuelve a importar este archivo y no debe abrir otra ventana
+def main():
+    # Modo de perfilado: "python app.py --perfil-importaciones" muestra los tiempos de importación y termina
+    if "--perfil-importaciones" in sys.argv:
+        reportar_tiempos_importacion()
+        sys.exit(0)
+
+    app = QApplication(sys.argv)
 
-# Código de ejecución de la aplicación
-app = QApplication(sys.argv)
+    ventana = MenuGeneral()  # Crea una instancia de la ventana del menú general
+    with open(resource_path("styles.css"), "r") as f:  # Carga los estilos desde un archivo CSS
+        stylesheet = f.read()  # Lee los estilos
+    app.setStyleSheet(stylesheet)  # Aplica los estilos a la aplicación
 
-ventana = MenuGeneral()  # Crea una instancia de la ventana del menú general
-with open(resource_path("styles.css"), "r") as f:  # Carga los estilos desde un archivo CSS
-    stylesheet = f.read()  # Lee los estilos
-app.setStyleSheet(stylesheet)  # Aplica los estilos a la aplicación
+    ventana.show()  # Muestra la ventana del menú general
+    # Cuando el menú ya está visible, se precargan sympy, scipy y matplotlib en segundo plano
+    QTimer.singleShot(0, precargar_en_segundo_plano)
+    sys.exit(app.exec_())  # Ejecuta la aplicación
 
-ventana.show()  # Muestra la ventana del menú general
-sys.exit(app.exec_())  # Ejecuta la aplicación
 
+if __name__ == "__main__":
+    # En el ejecutable congelado, los procesos hijos arrancan aquí y deben ejecutar su tarea, no la aplicación
+    multiprocessing.freeze_support()
+    main()
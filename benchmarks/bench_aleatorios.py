@@ -0,0 +1,58 @@
+# Benchmarks de los generadores de números pseudoaleatorios (10 000 números cada uno).
+import random
+
+from benchmarks.nucleo import benchmark
+from Modulos.estadistica.numeros_aleatorios import numeros_aleatorios as na
+
+CANTIDAD = 10_000
+
+
+@benchmark("aleatorios")
+def mersenne_twister():
+    random.seed(0)
+    na.mersenne_twister(CANTIDAD)
+
+
+@benchmark("aleatorios")
+def xorshift32():
+    na.xorshift32(2463534242, CANTIDAD)
+
+
+@benchmark("aleatorios")
+def pcg32():
+    na.pcg32(42, CANTIDAD)
+
+
+@benchmark("aleatorios")
+def well512():
+    na.well512([i * 2654435761 & 0xFFFFFFFF for i in range(1, 17)], CANTIDAD)
+
+
+@benchmark("aleatorios")
+def congruencial_lineal():
+    na.congruencial_lineal(7, 1103515245, 12345, 2**31, CANTIDAD)
+
+
+@benchmark("aleatorios")
+def congruencial_multiplicativo():
+    na.congruencial_multiplicativo(7, 16807, 2**31 - 1, CANTIDAD)
+
+
+@benchmark("aleatorios")
+def tausworthe():
+    na.tausworthe(12345, CANTIDAD)
+
+
+@benchmark("aleatorios")
+def lfsr():
+    na.lfsr(0xACE1, [0, 2, 3, 5], CANTIDAD)
+
+
+@benchmark("aleatorios")
+def cuadrados_medios():
+    na.cuadrados_medios(5735, CANTIDAD, 4)
+
+
+@benchmark("aleatorios")
+def producto_medio():
+    na.producto_medio(5015, 5734, CANTIDAD, 4)
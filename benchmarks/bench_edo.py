@@ -0,0 +1,14 @@
+# Benchmarks de los métodos de un paso para EDO (Euler, Heun, Runge-Kutta 4 y Taylor), 1000 pasos.
+from benchmarks.nucleo import benchmark
+from Modulos.EDO.EDO import METODOS_EDO, resolver_edo
+
+
+def _caso(metodo):
+    def paso():
+        resolver_edo("x + y*sin(x)", 0.0, 1.0, 10.0, 0.01, [metodo])
+    paso.__name__ = metodo.lower().replace(" ", "_").replace("-", "_")
+    return paso
+
+
+for _metodo in METODOS_EDO:
+    benchmark("edo")(_caso(_metodo))
@@ -0,0 +1,56 @@
+# Benchmarks de simulación y modelos: integración de Monte Carlo, cadenas de Markov,
+# modelo SIR con odeint y regresión lineal simple y múltiple.
+import numpy as np
+
+from benchmarks.nucleo import benchmark
+from Modulos.Cadenas_Markov.Cadenas_Markov import evolucionar_markov
+from Modulos.estadistica.montecarlo.montecarlo import simular_montecarlo
+from Modulos.modelo_matematico.modelo_matematico import simular_sir
+from Modulos.regresion_lineal.regresion_lineal import ajustar_recta, coeficiente_r2
+from Modulos.regresion_lineal.regresion_lineal_multiple import ajustar_regresion_multiple
+
+
+def cadena(n=50):
+    P = np.random.default_rng(0).random((n, n))
+    P /= P.sum(axis=1, keepdims=True)
+    pi = np.zeros((1, n))
+    pi[0, 0] = 1.0
+    return pi, P
+
+
+def datos_simples(n=100_000):
+    rng = np.random.default_rng(0)
+    x = rng.random(n)
+    return x, 3 * x + 2 + rng.normal(0, 0.1, n)
+
+
+def datos_multiples(n=10_000, k=10):
+    rng = np.random.default_rng(0)
+    X = rng.random((n, k))
+    return X, X @ np.arange(1, k + 1) + rng.normal(0, 0.1, n)
+
+
+@benchmark("estadistica")
+def montecarlo():
+    simular_montecarlo("x**2", "x**3", 0.0, 1.0, 100_000)
+
+
+@benchmark("estadistica", preparar=cadena)
+def markov(pi, P):
+    evolucionar_markov(pi, P, 1000)
+
+
+@benchmark("estadistica")
+def sir_odeint():
+    simular_sir(1_000_000, 10, 0.3, 0.1, 365)
+
+
+@benchmark("estadistica", preparar=datos_simples)
+def regresion_simple(x, y):
+    ajustar_recta(x, y)
+    coeficiente_r2(x, y)
+
+
+@benchmark("estadistica", preparar=datos_multiples)
+def regresion_multiple(X, y):
+    ajustar_regresion_multiple(X, y)
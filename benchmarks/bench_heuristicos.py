@@ -0,0 +1,35 @@
+# Benchmarks de los heurísticos y metaheurísticos del problema de la mochila.
+# Los algoritmos viven en la ventana, así que se crea una (sin mostrarla) con los ítems por defecto.
+import random
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.nucleo import benchmark
+
+METODOS = ["greedy", "local_search", "taboo_search", "simulated_annealing",
+           "gradient_descent", "ant_colony", "genetic_algorithm"]
+
+_aplicacion = None
+_ventana = None
+
+
+def ventana():
+    global _aplicacion, _ventana
+    if _ventana is None:
+        from Modulos.Algoritmos.Algoritmanos_Heuristicos import Algoritmos_Heuristicos
+        # La referencia a la aplicación se conserva mientras exista la ventana
+        _aplicacion = QApplication.instance() or QApplication([])
+        _ventana = Algoritmos_Heuristicos()
+    return (_ventana,)
+
+
+def _caso(metodo):
+    def ejecutar(v):
+        random.seed(0)
+        getattr(v, metodo)()
+    ejecutar.__name__ = metodo
+    return ejecutar
+
+
+for _metodo in METODOS:
+    benchmark("heuristicos", preparar=ventana)(_caso(_metodo))
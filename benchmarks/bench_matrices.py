@@ -0,0 +1,128 @@
+# Benchmarks del motor de matrices: operaciones densas, lotes, dispersas, aritmética exacta,
+# caché de factorizaciones, analizador de sistemas, métodos iterativos y multiplicación por bloques.
+import os
+import tempfile
+from fractions import Fraction
+
+import numpy as np
+from scipy import sparse
+
+from benchmarks.nucleo import benchmark
+from Modulos.matrices import analizador_sistemas, iterativos, motor_matrices, racional
+
+
+def densas(n=200):
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((n, n)), rng.standard_normal((n, n))
+
+
+def lote():
+    return (np.random.default_rng(0).standard_normal((1000, 3, 3)),)
+
+
+def dispersa_tridiagonal(n=100_000):
+    A = sparse.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr")
+    return A, np.ones(n)
+
+
+# Tridiagonal con determinante representable (n + 1); con diagonal 4 el determinante desborda
+def dispersa_escalada(n=100_000):
+    return (sparse.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr"),)
+
+
+def fracciones(n=12):
+    rng = np.random.default_rng(0)
+    return ([[Fraction(int(rng.integers(-9, 10)), int(rng.integers(1, 10))) for _ in range(n)] for _ in range(n)],)
+
+
+def texto_sistema(n=2000):
+    return ("\n".join(f"4x{i} - x{(i + 1) % n} - x{(i - 1) % n} = {i % 7}/3" for i in range(n)),)
+
+
+def archivos_npy(n=1000):
+    carpeta = tempfile.mkdtemp(prefix="bench_matrices_")
+    A, B = densas(n)
+    rutas = [os.path.join(carpeta, nombre) for nombre in ("A.npy", "B.npy", "C.npy")]
+    np.save(rutas[0], A)
+    np.save(rutas[1], B)
+    return (*rutas, 256)
+
+
+@benchmark("matrices", preparar=densas)
+def sumar(A, B):
+    motor_matrices.sumar(A, B)
+
+
+@benchmark("matrices", preparar=densas)
+def multiplicar(A, B):
+    motor_matrices.multiplicar(A, B)
+
+
+@benchmark("matrices", preparar=densas)
+def inversa(A, B):
+    motor_matrices.inversa(A)
+
+
+@benchmark("matrices", preparar=densas)
+def determinante(A, B):
+    motor_matrices.determinante(A)
+
+
+@benchmark("matrices", preparar=lote)
+def determinante_lote(M):
+    motor_matrices.determinante(M)
+
+
+@benchmark("matrices", preparar=dispersa_escalada)
+def determinante_dispersa(A):
+    motor_matrices.determinante(A)
+
+
+@benchmark("matrices", preparar=densas)
+def resolver_con_cache(A, B):
+    # Misma A en cada ronda: después de la primera solo cuesta la sustitución
+    motor_matrices.resolver(A, B[:, 0])
+
+
+@benchmark("matrices", preparar=fracciones)
+def determinante_exacto(A):
+    racional.determinante(A)
+
+
+@benchmark("matrices", preparar=fracciones)
+def inversa_exacta(A):
+    racional.inversa(A)
+
+
+@benchmark("matrices", preparar=texto_sistema)
+def analizar_sistema(texto):
+    analizador_sistemas.analizar(texto)
+
+
+@benchmark("matrices", preparar=dispersa_tridiagonal)
+def gradiente_conjugado(A, b):
+    iterativos.resolver(A, b, "Gradiente conjugado (CG)", tolerancia=1e-10)
+
+
+@benchmark("matrices", preparar=dispersa_tridiagonal)
+def gauss_seidel(A, b):
+    iterativos.resolver(A, b, "Gauss-Seidel", tolerancia=1e-10)
+
+
+@benchmark("matrices", preparar=archivos_npy)
+def multiplicar_por_bloques(ruta_a, ruta_b, ruta_c, bloque):
+    motor_matrices.multiplicar_por_bloques(ruta_a, ruta_b, ruta_c, bloque)
+
+
+@benchmark("matrices", preparar=densas)
+def diagnostico_inversa(A, B):
+    motor_matrices.diagnosticar(A)
+
+
+def lote_grande():
+    return (np.random.default_rng(0).standard_normal((100_000, 3, 3)),)
+
+
+@benchmark("matrices", preparar=lote_grande)
+def inversa_por_lotes(M):
+    motor_matrices.calcular_lote("Inversa", M)
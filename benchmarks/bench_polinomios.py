@@ -0,0 +1,137 @@
+# Benchmarks de las operaciones con polinomios (suma, producto, derivada, integral, evaluación,
+# división, MCD y raíces).
+import numpy as np
+
+from benchmarks.nucleo import benchmark
+from Modulos.polinomios import algebra
+from Modulos.polinomios import evaluacion
+from Modulos.polinomios import motor_polinomios
+from Modulos.polinomios import raices
+from Modulos.polinomios.polinomios import operar_polinomios
+
+
+def polinomios(grado=30):
+    a = " + ".join(f"{k + 1}x^{k}" for k in range(grado, -1, -1))
+    b = " - ".join(f"{2 * k + 1}x^{k}" for k in range(grado, -1, -1))
+    return a, b
+
+
+@benchmark("polinomios", preparar=polinomios)
+def sumar(a, b):
+    operar_polinomios("Sumar", a, b)
+
+
+@benchmark("polinomios", preparar=polinomios)
+def multiplicar(a, b):
+    operar_polinomios("Multiplicar", a, b)
+
+
+@benchmark("polinomios", preparar=polinomios)
+def derivar(a, b):
+    operar_polinomios("Derivadas", a, variable="x")
+
+
+@benchmark("polinomios", preparar=polinomios)
+def integrar(a, b):
+    operar_polinomios("Integrales", a, variable="x")
+
+
+@benchmark("polinomios", preparar=polinomios)
+def evaluar(a, b):
+    operar_polinomios("Evaluar", a, valor=1.5)
+
+
+# Motor numérico directo sobre polinomios de grado 10.000 (sin analizar ni formatear el texto)
+def polinomios_grandes(grado=10_000):
+    a, b = polinomios(grado)
+    return motor_polinomios.analizar(a), motor_polinomios.analizar(b)
+
+
+@benchmark("polinomios", preparar=polinomios_grandes)
+def motor_sumar_grado_10000(p, q):
+    motor_polinomios.sumar(p, q)
+
+
+@benchmark("polinomios", preparar=polinomios_grandes)
+def motor_multiplicar_grado_10000(p, q):
+    motor_polinomios.multiplicar(p, q)
+
+
+@benchmark("polinomios", preparar=polinomios_grandes)
+def motor_derivar_grado_10000(p, q):
+    motor_polinomios.derivar(p, "x")
+
+
+@benchmark("polinomios", preparar=polinomios_grandes)
+def motor_integrar_grado_10000(p, q):
+    motor_polinomios.integrar(p, "x")
+
+
+@benchmark("polinomios", preparar=polinomios_grandes)
+def motor_evaluar_grado_10000(p, q):
+    motor_polinomios.evaluar(p, 0.999)
+
+
+# Coeficientes decimales (FFT), enteros de 10 cifras (NTT con tres primos) y enteros de 30 cifras,
+# que ya no caben en la NTT y se multiplican con Karatsuba
+def coeficientes_grandes(grado=10_000):
+    rng = np.random.default_rng(0)
+    decimales = rng.random(grado + 1), rng.random(grado + 1)
+    enteros = [rng.integers(10 ** 9, 10 ** 10, grado + 1) for _ in range(2)]
+    return decimales, enteros
+
+
+def enteros_enormes(grado=2_000):
+    rng = np.random.default_rng(0)
+    return [motor_polinomios._como_arreglo([int(x) * 10 ** 20 + 1 for x in rng.integers(1, 10 ** 9, grado + 1)])
+            for _ in range(2)]
+
+
+@benchmark("polinomios", preparar=coeficientes_grandes)
+def producto_fft_grado_10000(decimales, enteros):
+    motor_polinomios.multiplicar_coeficientes(*decimales)
+
+
+@benchmark("polinomios", preparar=coeficientes_grandes)
+def producto_ntt_tres_primos_grado_10000(decimales, enteros):
+    motor_polinomios.multiplicar_coeficientes(*enteros)
+
+
+@benchmark("polinomios", preparar=enteros_enormes)
+def producto_karatsuba_grado_2000(a, b):
+    motor_polinomios.multiplicar_coeficientes(a, b)
+
+
+# Evaluación vectorizada (Horner) de un polinomio de grado 20 en un millón de puntos
+def puntos_evaluacion(grado=20, cantidad=1_000_000):
+    a, _ = polinomios(grado)
+    return motor_polinomios.analizar(a), np.linspace(-1, 1, cantidad)
+
+
+@benchmark("polinomios", preparar=puntos_evaluacion)
+def evaluar_un_millon_de_puntos(p, puntos):
+    evaluacion.evaluar_puntos(p, puntos)
+
+
+# Polinomios de grado 1.000 con coeficientes enteros pequeños y un factor común de grado 100
+def factor_comun(grado=1_000, comun=100):
+    rng = np.random.default_rng(0)
+    c = motor_polinomios._como_arreglo(rng.integers(-9, 10, comun + 1).tolist())
+    a, b = (motor_polinomios.multiplicar_coeficientes(
+        c, motor_polinomios._como_arreglo(rng.integers(-9, 10, grado - comun + 1).tolist())) for _ in range(2))
+    return a, b, c
+
+
+@benchmark("polinomios", preparar=factor_comun)
+def dividir_grado_1000(a, b, c):
+    motor_polinomios.dividir_coeficientes(a, c)
+
+
+@benchmark("polinomios", preparar=factor_comun)
+def mcd_modular_grado_1000(a, b, c):
+    algebra.mcd_coeficientes(a, b)
+
+
+@benchmark("polinomios", preparar=factor_comun)
+def raices_aberth_grado_1000(a, b, c):
+    raices.raices(a)
@@ -0,0 +1,100 @@
+# Benchmarks del cálculo simbólico: derivadas (también parciales y hessianos), integrales
+# (indefinida, definida y por partes), series y límites, con niveles de simplificación, analizador y
+# caché de expresiones.
+import sympy as sp
+
+from benchmarks.nucleo import benchmark
+from Modulos.calculo_simbolico.calculosimbolico import resolver_operacion
+from utils import expresiones
+
+
+@benchmark("simbolico")
+def derivar():
+    resolver_operacion("Derivar", "x**3*sin(x)*exp(2*x)", "x")
+
+
+@benchmark("simbolico")
+def integrar_indefinida():
+    resolver_operacion("Integrar Indefinida", "x**2*exp(x)", "x")
+
+
+@benchmark("simbolico")
+def integrar_definida():
+    resolver_operacion("Integrar Definida", "x*cos(x)", "x", "0", "pi")
+
+
+@benchmark("simbolico")
+def integrar_por_partes():
+    resolver_operacion("Integrar por Partes", "x*log(x)", "x")
+
+
+# Redibujo de Gráficas con diez funciones guardadas: interpretar y generar código en cada clic
+# (como antes) frente a tomarlas de la caché compartida de expresiones
+FUNCIONES_GUARDADAS = [f"sin({k}*x)*exp(-x**2/{k + 1}) + x**{k % 4}" for k in range(1, 11)]
+
+
+@benchmark("simbolico")
+def redibujo_diez_funciones_sin_cache():
+    x = sp.Symbol("x")
+    for texto in FUNCIONES_GUARDADAS:
+        sp.lambdify(x, sp.sympify(texto), "numpy")
+
+
+@benchmark("simbolico")
+def redibujo_diez_funciones_con_cache():
+    x = sp.Symbol("x")
+    for texto in FUNCIONES_GUARDADAS:
+        expresiones.funcion_numpy(texto, x)
+
+
+# Analizador compartido sin caché (texto con sintaxis de usuario: 3x, sen, e^x)
+@benchmark("simbolico")
+def analizar_diez_funciones():
+    for texto in FUNCIONES_GUARDADAS:
+        expresiones.analizar(texto)
+
+
+# Niveles de simplificación del resultado (la completa es la de los casos anteriores)
+@benchmark("simbolico")
+def derivar_simplificacion_rapida():
+    resolver_operacion("Derivar", "x**3*sin(x)*exp(2*x)", "x", nivel_simplificacion="Rápida")
+
+
+@benchmark("simbolico")
+def integrar_por_partes_simplificacion_rapida():
+    resolver_operacion("Integrar por Partes", "x*log(x)", "x", nivel_simplificacion="Rápida")
+
+
+# Partes repetidas (método tabular) con u elegida por la regla LIATE
+@benchmark("simbolico")
+def integrar_por_partes_tabular():
+    resolver_operacion("Integrar por Partes", "x^3 e^x sen(x)", "x")
+
+
+# Hessiano de seis variables presentado con subexpresiones comunes, y evaluado en un punto
+@benchmark("simbolico")
+def hessiano_seis_variables():
+    resolver_operacion("Hessiano", "e^(-(a^2+b^2+c^2+d^2+f^2+g^2)) sen(a b c d f g)", "",
+                       nivel_simplificacion="Rápida", punto="a=1, b=1, c=1, d=1, f=1, g=0.5")
+
+
+@benchmark("simbolico")
+def derivada_parcial_mixta():
+    resolver_operacion("Derivar", "x^3 y^2 sen(x y) e^(x + y)", "x^2, y")
+
+
+# Series: aritmética de series truncadas (50 términos de e^sen(x); sp.series tarda decenas de
+# segundos con 16) y, para cocientes, sp.series por tandas de orden creciente
+@benchmark("simbolico")
+def serie_exp_seno_50_terminos():
+    resolver_operacion("Serie de Taylor", "e^(sen(x))", "x", centro="0", orden=50)
+
+
+@benchmark("simbolico")
+def serie_cociente_por_tandas():
+    resolver_operacion("Serie de Taylor", "sen(x)/(1+x)", "x", centro="0", orden=20)
+
+
+@benchmark("simbolico")
+def limite_en_el_infinito():
+    resolver_operacion("Límite", "(1+1/x)^x", "x", centro="oo")
@@ -0,0 +1,108 @@
+# Ejecutor de la suite de benchmarks desde la línea de comandos.
+#
+#   python -m benchmarks.ejecutar                       ejecuta todo y guarda el JSON en benchmarks/resultados/
+#   python -m benchmarks.ejecutar --grupo matrices      solo un grupo (se puede repetir)
+#   python -m benchmarks.ejecutar --filtro inversa      solo los casos cuyo nombre contiene el texto
+#   python -m benchmarks.ejecutar --comparar base.json  ejecuta y compara contra una corrida anterior
+#   python -m benchmarks.ejecutar --comparar-archivos a.json b.json   compara dos corridas guardadas
+#   python -m benchmarks.ejecutar --listar              muestra los casos disponibles
+#
+# Al comparar, el programa termina con código 1 si algún caso es más lento que el umbral.
+import argparse
+import json
+import os
+import sys
+
+# Los casos que crean ventanas (por ejemplo, los heurísticos) no necesitan pantalla
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks import nucleo
+
+
+def imprimir_resultado(nombre, resultado):
+    if "error" in resultado:
+        print(f"{nombre:<50}{'ERROR':>14}  {resultado['error']}")
+        return
+    print(
+        f"{nombre:<50}{nucleo.formatear_tiempo(resultado['mediana']):>14}"
+        f"{nucleo.formatear_tiempo(resultado['min']):>14}"
+        f"{'±' + nucleo.formatear_tiempo(resultado['desviacion']):>15}{resultado['rondas']:>8}"
+    )
+
+
+def imprimir_comparacion(filas, base, actual):
+    print()
+    print(f"Comparación: {base['metadatos'].get('commit')} -> {actual['metadatos'].get('commit')}")
+    print(f"{'Caso':<50}{'Antes':>14}{'Después':>14}{'Cambio':>10}  Estado")
+    for nombre, antes, despues, cambio, estado in filas:
+        texto_cambio = f"{cambio:+.1%}" if cambio is not None else "-"
+        print(
+            f"{nombre:<50}{nucleo.formatear_tiempo(antes):>14}{nucleo.formatear_tiempo(despues):>14}"
+            f"{texto_cambio:>10}  {estado}"
+        )
+    regresiones = sum(1 for fila in filas if fila[4] == "regresión")
+    print(f"\n{regresiones} regresión(es) por encima del umbral.")
+    return regresiones
+
+
+def cargar(ruta):
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def ruta_por_defecto(informe):
+    carpeta = os.path.join(nucleo.CARPETA, "resultados")
+    os.makedirs(carpeta, exist_ok=True)
+    fecha = informe["metadatos"]["fecha"].replace(":", "-")
+    return os.path.join(carpeta, f"{fecha}_{informe['metadatos'].get('commit') or 'sin-commit'}.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de los núcleos numéricos de la calculadora.")
+    parser.add_argument("--grupo", action="append", help="Ejecuta solo este grupo (se puede repetir).")
+    parser.add_argument("--filtro", help="Ejecuta solo los casos cuyo nombre contiene este texto.")
+    parser.add_argument("--listar", action="store_true", help="Muestra los casos disponibles y termina.")
+    parser.add_argument("--rondas-min", type=int, default=5, help="Rondas mínimas por caso (5).")
+    parser.add_argument("--tiempo-min", type=float, default=0.2, help="Tiempo mínimo medido por caso en segundos (0.2).")
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto, benchmarks/resultados/).")
+    parser.add_argument("--comparar", metavar="BASE", help="Compara la corrida con un JSON anterior.")
+    parser.add_argument("--comparar-archivos", nargs=2, metavar=("BASE", "ACTUAL"),
+                        help="Compara dos JSON guardados sin ejecutar nada.")
+    parser.add_argument("--umbral", type=float, default=0.10,
+                        help="Cambio relativo de la mediana que cuenta como regresión (0.10 = 10%%).")
+    args = parser.parse_args(argv)
+
+    if args.comparar_archivos:
+        base, actual = (cargar(ruta) for ruta in args.comparar_archivos)
+        regresiones = imprimir_comparacion(nucleo.comparar(base, actual, args.umbral), base, actual)
+        return 1 if regresiones else 0
+
+    nucleo.descubrir()
+    casos = nucleo.seleccionar(args.filtro, args.grupo)
+    if args.listar:
+        for caso in casos:
+            print(caso.nombre)
+        return 0
+    if not casos:
+        print("No hay casos que coincidan con el filtro.")
+        return 1
+
+    print(f"{'Caso':<50}{'Mediana':>14}{'Mínimo':>14}{'Desviación':>15}{'Rondas':>8}")
+    informe = nucleo.ejecutar(casos, args.rondas_min, args.tiempo_min, al_medir=imprimir_resultado)
+
+    ruta = args.salida or ruta_por_defecto(informe)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(informe, archivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en {ruta}")
+
+    if args.comparar:
+        base = cargar(args.comparar)
+        filtrado = bool(args.filtro or args.grupo)
+        filas = nucleo.comparar(base, informe, args.umbral, solo_actuales=filtrado)
+        regresiones = imprimir_comparacion(filas, base, informe)
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+# Núcleo de la suite de benchmarks: registro de casos, medición de tiempos y comparación de corridas.
+# Cada archivo bench_*.py registra sus casos con el decorador @benchmark; la medición repite cada
+# caso hasta juntar un mínimo de rondas y de tiempo (como pytest-benchmark) y guarda estadísticas
+# en JSON para comparar commits y detectar regresiones.
+import datetime
+import importlib
+import os
+import pkgutil
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(CARPETA)
+
+# Casos registrados: nombre -> Caso
+REGISTRO = {}
+
+
+class Caso:
+    def __init__(self, nombre, grupo, funcion, preparar=None):
+        self.nombre = nombre
+        self.grupo = grupo
+        self.funcion = funcion
+        # Función que arma los datos de entrada fuera de la medición; devuelve la tupla de argumentos
+        self.preparar = preparar
+
+
+# Registra una función como caso de benchmark. El nombre completo es "grupo.nombre"
+def benchmark(grupo, nombre=None, preparar=None):
+    def registrar(funcion):
+        caso = Caso(f"{grupo}.{nombre or funcion.__name__}", grupo, funcion, preparar)
+        REGISTRO[caso.nombre] = caso
+        return funcion
+    return registrar
+
+
+# Importa todos los archivos bench_*.py de la carpeta para que registren sus casos
+def descubrir():
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+    for modulo in pkgutil.iter_modules([CARPETA]):
+        if modulo.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{modulo.name}")
+    return REGISTRO
+
+
+def estadisticas(tiempos):
+    return {
+        "min": min(tiempos),
+        "max": max(tiempos),
+        "media": statistics.fmean(tiempos),
+        "mediana": statistics.median(tiempos),
+        "desviacion": statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+        "rondas": len(tiempos),
+    }
+
+
+# Mide un caso: una ejecución de calentamiento y luego rondas hasta cumplir el mínimo de rondas
+# y de tiempo total (sin pasar del máximo de rondas)
+def medir(caso, rondas_min=5, tiempo_min=0.2, rondas_max=1000):
+    args = caso.preparar() if caso.preparar is not None else ()
+    caso.funcion(*args)
+    tiempos = []
+    total = 0.0
+    while len(tiempos) < rondas_min or (total < tiempo_min and len(tiempos) < rondas_max):
+        inicio = time.perf_counter()
+        caso.funcion(*args)
+        tiempos.append(time.perf_counter() - inicio)
+        total += tiempos[-1]
+    return estadisticas(tiempos)
+
+
+def _version(nombre):
+    try:
+        return importlib.import_module(nombre).__version__
+    except Exception:
+        return None
+
+
+def _commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        cambios = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=RAIZ,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ("-modificado" if cambios else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Datos del entorno que se guardan con cada corrida para saber qué se está comparando
+def metadatos():
+    return {
+        "commit": _commit(),
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "procesadores": os.cpu_count(),
+        "librerias": {nombre: _version(nombre) for nombre in ("numpy", "scipy", "sympy", "PyQt5.QtCore")},
+    }
+
+
+def seleccionar(filtro=None, grupos=None):
+    return [
+        caso for nombre, caso in sorted(REGISTRO.items())
+        if (not filtro or filtro in nombre) and (not grupos or caso.grupo in grupos)
+    ]
+
+
+# Ejecuta los casos y devuelve el informe completo; "al_medir" recibe cada resultado al terminar
+def ejecutar(casos, rondas_min=5, tiempo_min=0.2, al_medir=None):
+    informe = {"metadatos": metadatos(), "benchmarks": {}}
+    for caso in casos:
+        try:
+            resultado = dict(grupo=caso.grupo, **medir(caso, rondas_min, tiempo_min))
+        except Exception as e:
+            resultado = {"grupo": caso.grupo, "error": f"{e.__class__.__name__}: {e}"}
+        informe["benchmarks"][caso.nombre] = resultado
+        if al_medir is not None:
+            al_medir(caso.nombre, resultado)
+    return informe
+
+
+# Compara dos informes por la mediana. Un cambio mayor que el umbral (fracción) cuenta como
+# regresión (más lento) o mejora (más rápido). Con solo_actuales=True se ignoran los casos de la base
+# que no se ejecutaron ahora (por ejemplo, al correr un solo grupo)
+def comparar(base, actual, umbral=0.10, solo_actuales=False):
+    filas = []
+    nombres = set(actual["benchmarks"])
+    if not solo_actuales:
+        nombres |= set(base["benchmarks"])
+    nombres = sorted(nombres)
+    for nombre in nombres:
+        antes = base["benchmarks"].get(nombre, {})
+        despues = actual["benchmarks"].get(nombre, {})
+        if "mediana" not in antes or "mediana" not in despues:
+            estado = "nuevo" if "mediana" in despues else "eliminado" if "mediana" in antes else "error"
+            filas.append((nombre, antes.get("mediana"), despues.get("mediana"), None, estado))
+            continue
+        cambio = despues["mediana"] / antes["mediana"] - 1 if antes["mediana"] > 0 else 0.0
+        if cambio > umbral:
+            estado = "regresión"
+        elif cambio < -umbral:
+            estado = "mejora"
+        else:
+            estado = "igual"
+        filas.append((nombre, antes["mediana"], despues["mediana"], cambio, estado))
+    return filas
+
+
+# Tiempo con la unidad más legible (s, ms o µs)
+def formatear_tiempo(segundos):
+    if segundos is None:
+        return "-"
+    if segundos >= 1:
+        return f"{segundos:.3f} s"
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:.3f} ms"
+    return f"{segundos * 1e6:.1f} µs"
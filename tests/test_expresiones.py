@@ -0,0 +1,31 @@
+# Regresiones del analizador de expresiones compartido (utils/expresiones.py)
+import pytest
+import sympy as sp
+
+from utils import expresiones
+
+
+@pytest.fixture(autouse=True)
+def cache_vacia():
+    expresiones.limpiar_cache()
+    yield
+    expresiones.limpiar_cache()
+
+
+# Los espacios alrededor de "-" deciden si "2e-3" es notación científica; la caché no puede
+# quitarlos antes de interpretar
+def test_notacion_cientifica_y_constante_e():
+    assert expresiones.interpretar("2e-3") == sp.Float("0.002")
+    assert expresiones.interpretar("2e - 3") == 2 * sp.E - 3
+    assert expresiones.interpretar("x + 2e - 1") == sp.Symbol("x") + 2 * sp.E - 1
+
+
+def test_cache_igual_que_sin_cache():
+    for texto in ("2e - 3", "2e-3", "x + 2e - 1", "x^2 + 1", "x^2+1"):
+        assert expresiones.interpretar(texto) == expresiones.analizar(texto)
+
+
+def test_cache_comparte_textos_equivalentes():
+    expresiones.interpretar("x^2 + 1")
+    expresiones.interpretar("x^2+1")
+    assert expresiones.estadisticas()["entradas"] == 1
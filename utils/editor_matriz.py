@@ -0,0 +1,245 @@
+# Editor de matrices virtualizado: un QTableView sobre un arreglo de NumPy.
+# A diferencia de una cuadrícula de QLineEdit (un widget por celda), la vista solo dibuja las celdas
+# visibles, así que una matriz de 500 × 500 se crea, se edita y se lee al instante.
+# Acepta enteros, decimales y fracciones ("3/4"); permite pegar desde el portapapeles (texto
+# copiado de Excel, LibreOffice o un CSV) y rellenar toda la matriz o la selección de una vez.
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from PyQt5.QtCore import Qt, QRegularExpression
+from PyQt5.QtGui import QKeySequence, QRegularExpressionValidator
+from PyQt5.QtWidgets import (
+    QApplication, QHBoxLayout, QLineEdit, QMessageBox, QPushButton, QShortcut, QStyledItemDelegate,
+    QTableView, QVBoxLayout, QWidget
+)
+
+from utils.modelo_matriz import ModeloMatriz
+
+# Enteros, decimales y fracciones, con signo opcional
+PATRON_CELDA = r"^-?\d*\.?\d*(/\d+)?$"
+
+
+# Convierte el texto de una celda en una fracción exacta; lanza ValueError si no es un número
+def convertir_texto(texto):
+    try:
+        return Fraction(texto.strip())
+    except ZeroDivisionError:
+        raise ValueError(f"División entre cero: '{texto}'")
+
+
+# Valor de una celda en flotante; lanza ValueError si no es un número finito. float acepta "nan",
+# "inf" y "1e500" (que desborda a inf): al pegar no pasan por el validador de la celda
+def valor_celda(texto):
+    try:
+        # Camino rápido para enteros y decimales; Fraction solo hace falta con "/"
+        valor = float(texto)
+    except ValueError:
+        try:
+            valor = float(convertir_texto(texto))
+        except OverflowError:
+            valor = math.inf
+    if not math.isfinite(valor):
+        raise ValueError(f"'{texto.strip()}' no es un número finito (o no cabe en un flotante)")
+    return valor
+
+
+# Separa el texto pegado en filas y columnas (tabuladores, comas, punto y coma o espacios)
+def separar_texto(texto):
+    filas = []
+    for linea in texto.strip().splitlines():
+        for separador in ("\t", ";", ","):
+            if separador in linea:
+                partes = linea.split(separador)
+                break
+        else:
+            partes = linea.split()
+        filas.append([parte.strip() for parte in partes])
+    return filas
+
+
+class ModeloMatrizEditable(ModeloMatriz):
+    def __init__(self, filas=0, columnas=0, decimales=4, parent=None):
+        super().__init__(np.zeros((filas, columnas)), decimales, parent)
+        # Texto original de las celdas que no son enteras ("1/3", "0.1"): permite recuperar
+        # el valor exacto para la aritmética con fracciones
+        self._textos = {}
+
+    def establecer_matriz(self, matriz):
+        self._textos = {}
+        super().establecer_matriz(np.array(np.asarray(matriz, dtype=float), ndmin=2))
+
+    def redimensionar(self, filas, columnas):
+        anterior = self._matriz
+        nueva = np.zeros((filas, columnas))
+        f, c = min(filas, anterior.shape[0]), min(columnas, anterior.shape[1])
+        nueva[:f, :c] = anterior[:f, :c]
+        textos = {(i, j): t for (i, j), t in self._textos.items() if i < filas and j < columnas}
+        self.beginResetModel()
+        self._matriz = nueva
+        self._textos = textos
+        self.endResetModel()
+
+    # Copia de la matriz en flotantes
+    def matriz(self):
+        return self._matriz.copy()
+
+    # La matriz como filas de Fraction, sin el redondeo de los flotantes
+    def matriz_exacta(self):
+        exacta = [[Fraction(int(v)) if v.is_integer() else Fraction(v) for v in fila] for fila in self._matriz.tolist()]
+        for (i, j), texto in self._textos.items():
+            exacta[i][j] = convertir_texto(texto)
+        return exacta
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def texto(self, fila, columna):
+        texto = self._textos.get((fila, columna))
+        return texto if texto is not None else self.formatear(self._matriz[fila, columna])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self.texto(index.row(), index.column())
+        return super().data(index, role)
+
+    # Guarda un valor sin avisar a la vista (las operaciones masivas avisan una sola vez al final)
+    def _asignar(self, fila, columna, texto):
+        valor = valor_celda(texto)
+        self._matriz[fila, columna] = valor
+        if valor.is_integer() and "/" not in texto:
+            self._textos.pop((fila, columna), None)
+        else:
+            self._textos[(fila, columna)] = texto.strip()
+
+    def setData(self, index, valor, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        try:
+            self._asignar(index.row(), index.column(), str(valor))
+        except ValueError:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    # Escribe un bloque de textos a partir de (fila, columna); lo que no cabe se descarta.
+    # Devuelve cuántas celdas se escribieron
+    def pegar(self, filas_texto, fila=0, columna=0):
+        filas, columnas = self._matriz.shape
+        escritas = 0
+        try:
+            for i, fila_texto in enumerate(filas_texto[:max(0, filas - fila)]):
+                for j, texto in enumerate(fila_texto[:max(0, columnas - columna)]):
+                    if texto:
+                        self._asignar(fila + i, columna + j, texto)
+                        escritas += 1
+        finally:
+            # Aunque un valor sea inválido, la vista muestra lo que alcanzó a escribirse
+            if escritas:
+                self.dataChanged.emit(self.index(0, 0), self.index(filas - 1, columnas - 1))
+        return escritas
+
+    # Rellena con un mismo valor las celdas indicadas (lista de (fila, columna)) o toda la matriz
+    def rellenar(self, texto, celdas=None):
+        valor = convertir_texto(texto)
+        if celdas is None:
+            self._matriz[:] = valor_celda(texto)
+            self._textos = {}
+            if valor.denominator != 1:
+                self._textos = {(i, j): texto.strip() for i in range(self.rowCount()) for j in range(self.columnCount())}
+        else:
+            for fila, columna in celdas:
+                self._asignar(fila, columna, texto)
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def identidad(self):
+        filas, columnas = self._matriz.shape
+        self.establecer_matriz(np.eye(filas, columnas))
+
+
+# Delegado que limita la edición de cada celda a números y fracciones
+class DelegadoCelda(QStyledItemDelegate):
+    def createEditor(self, parent, opcion, index):
+        editor = QLineEdit(parent)
+        editor.setAlignment(Qt.AlignCenter)
+        editor.setValidator(QRegularExpressionValidator(QRegularExpression(PATRON_CELDA), editor))
+        return editor
+
+
+class EditorMatriz(QWidget):
+    def __init__(self, filas=0, columnas=0, herramientas=True, parent=None):
+        super().__init__(parent)
+        self.modelo = ModeloMatrizEditable(filas, columnas)
+        self.tabla = QTableView()
+        self.tabla.setModel(self.modelo)
+        self.tabla.setItemDelegate(DelegadoCelda(self.tabla))
+        self.tabla.horizontalHeader().setDefaultSectionSize(80)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        if herramientas:
+            # Barra de herramientas: pegar, rellenar con un valor (selección o todo) e identidad
+            barra = QHBoxLayout()
+            boton_pegar = QPushButton("Pegar")
+            boton_pegar.clicked.connect(self.pegar_portapapeles)
+            self.valor_relleno = QLineEdit("0")
+            self.valor_relleno.setValidator(QRegularExpressionValidator(QRegularExpression(PATRON_CELDA)))
+            self.valor_relleno.setFixedWidth(80)
+            boton_rellenar = QPushButton("Rellenar")
+            boton_rellenar.clicked.connect(self.rellenar)
+            boton_identidad = QPushButton("Identidad")
+            boton_identidad.clicked.connect(self.modelo.identidad)
+            for widget in (boton_pegar, self.valor_relleno, boton_rellenar, boton_identidad):
+                barra.addWidget(widget)
+            barra.addStretch(1)
+            layout.addLayout(barra)
+        layout.addWidget(self.tabla)
+
+        # Atajos de teclado como en una hoja de cálculo
+        QShortcut(QKeySequence.Paste, self.tabla, self.pegar_portapapeles)
+        QShortcut(QKeySequence.Copy, self.tabla, self.copiar_seleccion)
+
+    def redimensionar(self, filas, columnas):
+        self.modelo.redimensionar(filas, columnas)
+
+    def establecer_matriz(self, matriz):
+        self.modelo.establecer_matriz(matriz)
+
+    def matriz(self):
+        return self.modelo.matriz()
+
+    def matriz_exacta(self):
+        return self.modelo.matriz_exacta()
+
+    def forma(self):
+        return self.modelo.rowCount(), self.modelo.columnCount()
+
+    # Pega el texto del portapapeles a partir de la celda actual (o de la primera)
+    def pegar_portapapeles(self):
+        actual = self.tabla.currentIndex()
+        fila, columna = (actual.row(), actual.column()) if actual.isValid() else (0, 0)
+        try:
+            self.modelo.pegar(separar_texto(QApplication.clipboard().text()), fila, columna)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", f"El texto pegado no es una matriz de números:\n{e}")
+
+    # Copia la selección como texto separado por tabuladores (se puede pegar en una hoja de cálculo)
+    def copiar_seleccion(self):
+        indices = self.tabla.selectedIndexes()
+        if not indices:
+            return
+        filas = sorted({i.row() for i in indices})
+        columnas = sorted({i.column() for i in indices})
+        texto = "\n".join("\t".join(self.modelo.texto(f, c) for c in columnas) for f in filas)
+        QApplication.clipboard().setText(texto)
+
+    # Rellena la selección (si abarca más de una celda) o toda la matriz con el valor indicado
+    def rellenar(self):
+        texto = self.valor_relleno.text() or "0"
+        indices = self.tabla.selectedIndexes()
+        celdas = [(i.row(), i.column()) for i in indices] if len(indices) > 1 else None
+        try:
+            self.modelo.rellenar(texto, celdas)
+        except ValueError:
+            pass  # El validador ya impide la mayoría de los textos inválidos (p. ej. "-" solo)
@@ -0,0 +1,289 @@
+# Interpretación de expresiones escritas por el usuario, compartida por todos los módulos.
+# - Un solo analizador (tokenizador de una pasada + descenso recursivo) construye directamente la
+#   expresión de sympy, con la misma sintaxis en todas partes: potencias con ^ o **, multiplicación
+#   implícita (2x, 3(x + 1), x sen(x), (x + 1)(x - 1)), nombres en español e inglés (sen/sin, ln/log,
+#   raiz/sqrt...), e^x, π, ∞ (también oo o inf) y √.
+# - Variables: cada letra es una variable ("xy" es x·y), salvo que forme un nombre conocido
+#   ("xsen" es x·sen, "pix" es π·x); una letra seguida de dígitos es una variable con subíndice
+#   ("x1 + x2", "a0"). Notación científica: "1e-3" es 0.001; "1e-3x" es un error (se escribe
+#   "1e-3 x" o "1e-3*x") en lugar de leerse como e - 3x.
+# - Convertir texto y generar código con sp.lambdify es lo más lento de un cálculo sencillo, y los
+#   módulos lo repetían en cada clic (Gráficas, por ejemplo, con cada función guardada en cada
+#   redibujo). Aquí cada texto se interpreta una sola vez: se guarda la expresión, sus símbolos
+#   libres y las funciones de NumPy ya generadas, en una caché LRU de tamaño limitado.
+# Las expresiones de sympy son inmutables, así que se pueden compartir entre módulos y hilos.
+import re
+import threading
+from collections import OrderedDict
+
+from utils.importaciones import importar_diferido
+
+sp = importar_diferido("sympy")
+
+# Cantidad máxima de textos distintos que se guardan; al superarla se descarta el menos usado
+MAXIMO_EXPRESIONES = 256
+
+
+# Funciones reconocidas (nombre escrito -> nombre en sympy) y constantes
+FUNCIONES = {
+    "sin": "sin", "sen": "sin", "cos": "cos", "tan": "tan", "tg": "tan",
+    "cot": "cot", "sec": "sec", "csc": "csc", "cosec": "csc",
+    "asin": "asin", "arcsin": "asin", "asen": "asin", "arcsen": "asin",
+    "acos": "acos", "arccos": "acos", "atan": "atan", "arctan": "atan", "arctg": "atan",
+    "sinh": "sinh", "senh": "sinh", "cosh": "cosh", "tanh": "tanh",
+    "exp": "exp", "log": "log", "ln": "log", "sqrt": "sqrt", "raiz": "sqrt", "abs": "Abs",
+}
+CONSTANTES = {"pi": "pi", "π": "pi", "e": "E", "oo": "oo", "inf": "oo", "∞": "oo"}
+
+# Un único patrón para todos los símbolos; cada llamada a match avanza un token
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<nombre>[a-zA-Zπ∞]+\d*)
+      | (?P<potencia>\*\*|\^)
+      | (?P<simbolo>[-+*/(),√·×÷−])
+    )""", re.VERBOSE)
+
+_EQUIVALENTES = {"·": "*", "×": "*", "÷": "/", "−": "-"}
+
+
+# Parte una palabra en nombres conocidos (el más largo primero) y variables de una letra:
+# "xsen" -> x, sen; "pix" -> pi, x. Con constantes=False, "e" y "pi" son variables
+def _patron_nombres(nombres):
+    alternativas = "|".join(re.escape(n) for n in sorted(nombres, key=len, reverse=True))
+    return re.compile(f"{alternativas}|.")
+
+
+_PARTIR = {
+    True: _patron_nombres([*FUNCIONES, *CONSTANTES]),
+    False: _patron_nombres(FUNCIONES),
+}
+
+
+# Lista de tokens (tipo, texto); los errores indican la posición del símbolo no reconocido
+def tokenizar(texto, constantes=True):
+    tokens = []
+    posicion = 0
+    texto = texto.rstrip()
+    while posicion < len(texto):
+        coincidencia = _TOKEN.match(texto, posicion)
+        if coincidencia is None:
+            raise ValueError(f"Símbolo no reconocido '{texto[posicion:].lstrip()[0]}' en la posición {posicion + 1}.")
+        tipo = coincidencia.lastgroup
+        valor = coincidencia.group(tipo)
+        siguiente = texto[coincidencia.end():coincidencia.end() + 1]
+        if tipo == "numero" and valor[-1].isdigit() and re.search("[eE]", valor) and (siguiente.isalpha() or siguiente == "("):
+            raise ValueError(f"Número mal escrito '{valor}{siguiente}' en la posición {coincidencia.start(tipo) + 1}: "
+                             f"separa el exponente de lo que sigue (ej. '{valor} {siguiente}' o '{valor}*{siguiente}').")
+        if tipo == "nombre":
+            letras = valor.rstrip("0123456789")
+            indice = valor[len(letras):]
+            for nombre in _PARTIR[constantes].findall(letras.lower()):
+                if nombre in FUNCIONES:
+                    tokens.append(("funcion", nombre))
+                elif constantes and nombre in CONSTANTES:
+                    tokens.append(("constante", nombre))
+                else:
+                    tokens.append(("nombre", nombre))
+            if indice:
+                # Los dígitos son el subíndice de una variable ("x1"); tras una función o constante,
+                # un número ("sen2x", "pi2")
+                if tokens[-1][0] == "nombre":
+                    tokens[-1] = ("nombre", tokens[-1][1] + indice)
+                else:
+                    tokens.append(("numero", indice))
+        elif tipo == "simbolo":
+            tokens.append(("simbolo", _EQUIVALENTES.get(valor, valor)))
+        else:
+            tokens.append((tipo, valor))
+        posicion = coincidencia.end()
+    return tokens
+
+
+# Analizador de descenso recursivo. Precedencias (de menor a mayor):
+#   suma/resta < producto/división/multiplicación implícita < signo < potencia (asociativa a derecha)
+# "-x^2" es -(x^2) y "2x^2" es 2·(x^2), como se escribe a mano
+class _Analizador:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.posicion = 0
+
+    def actual(self):
+        return self.tokens[self.posicion] if self.posicion < len(self.tokens) else (None, None)
+
+    def avanzar(self):
+        token = self.actual()
+        self.posicion += 1
+        return token
+
+    def esperar(self, simbolo):
+        if self.actual() != ("simbolo", simbolo):
+            raise ValueError(f"Se esperaba '{simbolo}'.")
+        self.avanzar()
+
+    def expresion(self):
+        resultado = self.termino()
+        while self.actual() in (("simbolo", "+"), ("simbolo", "-")):
+            _, operador = self.avanzar()
+            derecha = self.termino()
+            resultado = resultado + derecha if operador == "+" else resultado - derecha
+        return resultado
+
+    # Un término continúa con *, / o con cualquier cosa que pueda empezar un factor (implícito)
+    def termino(self):
+        resultado = self.signo()
+        while True:
+            tipo, valor = self.actual()
+            if (tipo, valor) in (("simbolo", "*"), ("simbolo", "/")):
+                self.avanzar()
+                derecha = self.signo()
+                resultado = resultado * derecha if valor == "*" else resultado / derecha
+            elif tipo in ("numero", "nombre", "constante", "funcion") or (tipo, valor) in (("simbolo", "("), ("simbolo", "√")):
+                resultado = resultado * self.potencia()
+            else:
+                return resultado
+
+    def signo(self):
+        if self.actual() in (("simbolo", "+"), ("simbolo", "-")):
+            _, operador = self.avanzar()
+            valor = self.signo()
+            return -valor if operador == "-" else valor
+        return self.potencia()
+
+    def potencia(self):
+        base = self.primario()
+        if self.actual()[0] == "potencia":
+            self.avanzar()
+            return base ** self.signo()
+        return base
+
+    def primario(self):
+        tipo, valor = self.avanzar()
+        if tipo == "numero":
+            return sp.Float(valor) if any(c in valor for c in ".eE") else sp.Integer(valor)
+        if tipo == "nombre":
+            return sp.Symbol(valor)
+        if tipo == "constante":
+            return getattr(sp, CONSTANTES[valor])
+        if tipo == "funcion":
+            return self.funcion(valor)
+        if (tipo, valor) == ("simbolo", "("):
+            resultado = self.expresion()
+            self.esperar(")")
+            return resultado
+        if (tipo, valor) == ("simbolo", "√"):
+            return sp.sqrt(self.potencia())
+        if tipo is None:
+            raise ValueError("La expresión está incompleta.")
+        raise ValueError(f"Símbolo inesperado '{valor}'.")
+
+    # Con paréntesis admite varios argumentos (log(x, 2)); sin ellos se aplica a la multiplicación
+    # implícita que sigue, hasta otra función o un operador, como se escribe a mano:
+    # "sen 2x" es sin(2x), "ln x^2 + 1" es log(x²) + 1 y "sen x cos x" es sin(x)·cos(x)
+    def funcion(self, nombre):
+        funcion = getattr(sp, FUNCIONES[nombre])
+        if self.actual() != ("simbolo", "("):
+            argumento = self.potencia()
+            while self.actual()[0] in ("numero", "nombre", "constante") or self.actual() in (("simbolo", "("), ("simbolo", "√")):
+                argumento = argumento * self.potencia()
+            return funcion(argumento)
+        self.avanzar()
+        argumentos = [self.expresion()]
+        while self.actual() == ("simbolo", ","):
+            self.avanzar()
+            argumentos.append(self.expresion())
+        self.esperar(")")
+        return funcion(*argumentos)
+
+
+# Convierte el texto en una expresión de sympy (sin caché; los módulos usan interpretar)
+def analizar(texto, constantes=True):
+    return _construir(tokenizar(texto, constantes))
+
+
+def _construir(tokens):
+    analizador = _Analizador(list(tokens))
+    if not analizador.tokens:
+        raise ValueError("La expresión está vacía.")
+    resultado = analizador.expresion()
+    if analizador.posicion < len(analizador.tokens):
+        raise ValueError(f"Símbolo inesperado '{analizador.actual()[1]}'.")
+    return resultado
+
+
+# Expresión interpretada junto con sus símbolos libres y las funciones numéricas generadas
+# (una por cada combinación de variables y módulos pedida)
+class ExpresionCacheada:
+    def __init__(self, expresion):
+        self.expresion = expresion
+        self.simbolos = expresion.free_symbols if hasattr(expresion, "free_symbols") else set()
+        self._funciones = {}
+        self._candado = threading.Lock()
+
+    # Función de NumPy (u otros módulos de lambdify) con los argumentos en el orden de "variables"
+    def funcion(self, variables, modulos="numpy"):
+        if not isinstance(variables, (tuple, list)):
+            variables = (variables,)
+        clave = (tuple(variables), modulos if modulos is None or isinstance(modulos, str) else tuple(modulos))
+        with self._candado:
+            funcion = self._funciones.get(clave)
+        if funcion is None:
+            if modulos is None:
+                funcion = sp.lambdify(tuple(variables), self.expresion)
+            else:
+                funcion = sp.lambdify(tuple(variables), self.expresion, modulos)
+            with self._candado:
+                funcion = self._funciones.setdefault(clave, funcion)
+        return funcion
+
+
+_cache = OrderedDict()
+_candado = threading.Lock()
+_estadisticas = {"aciertos": 0, "fallos": 0}
+
+
+# Devuelve la ExpresionCacheada del texto; si no está, lo interpreta con el analizador.
+# La clave es la lista de tokens: "x^2 + 1" y "x^2+1" comparten la entrada, pero "2e - 3" (2e - 3)
+# y "2e-3" (0.002) no, porque los espacios sí cambian cómo se lee el número.
+# Los errores de sintaxis no se guardan: se propagan como ValueError
+def obtener(texto, constantes=True):
+    tokens = tuple(tokenizar(str(texto), constantes))
+    clave = (tokens, constantes)
+    with _candado:
+        entrada = _cache.get(clave)
+        if entrada is not None:
+            _cache.move_to_end(clave)
+            _estadisticas["aciertos"] += 1
+            return entrada
+        _estadisticas["fallos"] += 1
+
+    entrada = ExpresionCacheada(_construir(tokens))
+
+    with _candado:
+        entrada = _cache.setdefault(clave, entrada)
+        _cache.move_to_end(clave)
+        while len(_cache) > MAXIMO_EXPRESIONES:
+            _cache.popitem(last=False)
+    return entrada
+
+
+# Atajo para los módulos que solo necesitan la expresión de sympy
+def interpretar(texto, constantes=True):
+    return obtener(texto, constantes).expresion
+
+
+# Atajo para obtener directamente la función numérica del texto
+def funcion_numpy(texto, variables, modulos="numpy", constantes=True):
+    return obtener(texto, constantes).funcion(variables, modulos)
+
+
+def estadisticas():
+    with _candado:
+        return {**_estadisticas, "entradas": len(_cache), "maximo": MAXIMO_EXPRESIONES}
+
+
+def limpiar_cache():
+    with _candado:
+        _cache.clear()
+        _estadisticas["aciertos"] = 0
+        _estadisticas["fallos"] = 0
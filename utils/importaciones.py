@@ -0,0 +1,134 @@
+# Capa de importación diferida y precarga de librerías pesadas (sympy, scipy, matplotlib).
+# El menú principal abre rápido y, mientras está en espera, un hilo en segundo plano carga
+# las librerías; así el primer módulo pesado que se abra ya las encuentra en memoria.
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Librerías que tardan en importarse, en el orden en que conviene precargarlas
+LIBRERIAS_PESADAS = [
+    "numpy",
+    "sympy",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_qt5agg",
+    "scipy.integrate",
+    "scipy.stats",
+]
+
+# Módulos de la aplicación que se abren desde el menú general
+MODULOS_APLICACION = [
+    ("Matrices", "Modulos.matrices.matrices"),
+    ("Polinomios", "Modulos.polinomios.polinomios"),
+    ("Derivadas", "Modulos.calculo_simbolico.calculosimbolico"),
+    ("Vectores", "Modulos.vectores.vectores"),
+    ("Gráficas", "Modulos.graficas.graficas"),
+    ("EDO", "Modulos.EDO.EDO"),
+    ("Vectores Propios", "Modulos.vectores_propios.vectores_propios"),
+    ("Prob y Estadistica", "Modulos.estadistica.estadistica"),
+    ("Números aleatorios", "Modulos.estadistica.numeros_aleatorios.numeros_aleatorios"),
+    ("Monte Carlo", "Modulos.estadistica.montecarlo.montecarlo"),
+    ("M. Matemático", "Modulos.modelo_matematico.modelo_matematico"),
+    ("Regresion Lineal", "Modulos.regresion_lineal.regresion_lineal"),
+    ("Regresion Lineal M", "Modulos.regresion_lineal.regresion_lineal_multiple"),
+    ("Markov", "Modulos.Cadenas_Markov.Cadenas_Markov"),
+    ("Grafos", "Modulos.Grafos.Grafos"),
+    ("Redes Petri", "Modulos.Redes_Petri.Redes_Petri"),
+    ("Algoritmos H-MH", "Modulos.Algoritmos.Algoritmanos_Heuristicos"),
+    ("Red Neuronal", "Modulos.Redes_Neuronales.Redes_Neuronales"),
+    ("Acerca De", "Modulos.acerca_de.acercade"),
+]
+
+
+# Módulo que solo se importa la primera vez que se usa uno de sus atributos
+class ModuloDiferido:
+    def __init__(self, nombre):
+        self._nombre = nombre
+        self._modulo = None
+
+    def __getattr__(self, atributo):
+        if self._modulo is None:
+            self._modulo = importlib.import_module(self._nombre)
+        return getattr(self._modulo, atributo)
+
+
+def importar_diferido(nombre):
+    # Si el módulo ya fue cargado (por ejemplo, por la precarga) se devuelve directamente
+    if nombre in sys.modules:
+        return sys.modules[nombre]
+    return ModuloDiferido(nombre)
+
+
+_hilo_precarga = None
+
+
+# Importa las librerías pesadas en un hilo de fondo. El bloqueo de importación de Python
+# garantiza que, si el usuario abre un módulo a mitad de la precarga, simplemente espera a que termine.
+def precargar_en_segundo_plano(modulos=None):
+    global _hilo_precarga
+    if _hilo_precarga is not None:
+        return _hilo_precarga
+
+    def precargar():
+        for nombre in modulos or LIBRERIAS_PESADAS:
+            try:
+                importlib.import_module(nombre)
+            except Exception:
+                # Si una librería opcional falta, el módulo que la use mostrará su propio error
+                continue
+
+    _hilo_precarga = threading.Thread(target=precargar, name="precarga-importaciones", daemon=True)
+    _hilo_precarga.start()
+    return _hilo_precarga
+
+
+# Código que ejecuta un intérprete nuevo para medir la importación de un módulo
+# (primero importa los módulos de precarga, si se indican, y luego mide el módulo pedido)
+_CODIGO_MEDICION = (
+    "import importlib, sys, time\n"
+    "for nombre in sys.argv[2:]:\n"
+    "    importlib.import_module(nombre)\n"
+    "inicio = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print(time.perf_counter() - inicio)\n"
+)
+
+
+def medir_importacion(modulo, precargados=()):
+    # Cada medición usa un intérprete nuevo para que ninguna librería esté ya cargada
+    if getattr(sys, "frozen", False):
+        inicio = time.perf_counter()
+        importlib.import_module(modulo)
+        return time.perf_counter() - inicio
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    salida = subprocess.run(
+        [sys.executable, "-c", _CODIGO_MEDICION, modulo, *precargados],
+        cwd=raiz, capture_output=True, text=True,
+    )
+    if salida.returncode != 0:
+        raise ImportError(salida.stderr.strip().splitlines()[-1] if salida.stderr.strip() else modulo)
+    return float(salida.stdout.strip())
+
+
+# Modo de perfilado de arranque: muestra cuánto tarda en importarse cada librería y cada módulo,
+# en frío y con las librerías pesadas ya precargadas (lo que ve el usuario tras la precarga)
+def reportar_tiempos_importacion(archivo=sys.stdout):
+    print("Tiempos de importación (segundos)", file=archivo)
+    print(f"{'Librería':<40}{'En frío':>10}", file=archivo)
+    for nombre in LIBRERIAS_PESADAS:
+        try:
+            print(f"{nombre:<40}{medir_importacion(nombre):>10.3f}", file=archivo)
+        except ImportError as e:
+            print(f"{nombre:<40}{'error':>10}  {e}", file=archivo)
+
+    print(file=archivo)
+    print(f"{'Módulo':<40}{'En frío':>10}{'Con precarga':>15}", file=archivo)
+    for titulo, modulo in MODULOS_APLICACION:
+        try:
+            frio = medir_importacion(modulo)
+            precargado = medir_importacion(modulo, LIBRERIAS_PESADAS)
+            print(f"{titulo:<40}{frio:>10.3f}{precargado:>15.3f}", file=archivo)
+        except ImportError as e:
+            print(f"{titulo:<40}{'error':>10}  {e}", file=archivo)
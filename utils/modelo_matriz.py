@@ -0,0 +1,62 @@
+# Modelo de tabla virtualizado para mostrar matrices grandes en un QTableView.
+# La vista solo pide los valores de las celdas visibles, así que una matriz de 10.000 × 10.000
+# (densa de NumPy o dispersa de scipy) se muestra sin crear un widget por celda.
+import numpy as np
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class ModeloMatriz(QAbstractTableModel):
+    def __init__(self, matriz=None, decimales=4, parent=None):
+        super().__init__(parent)
+        self._matriz = np.zeros((0, 0))
+        self._dispersa = False
+        self.decimales = decimales
+        if matriz is not None:
+            self.establecer_matriz(matriz)
+
+    # Reemplaza la matriz que se muestra (acepta arreglos de NumPy, listas o matrices dispersas)
+    def establecer_matriz(self, matriz):
+        self.beginResetModel()
+        self._dispersa = hasattr(matriz, "tocsr")
+        if self._dispersa:
+            self._matriz = matriz.tocsr()
+        else:
+            self._matriz = np.atleast_2d(np.asarray(matriz))
+        self.endResetModel()
+
+    def matriz(self):
+        return self._matriz
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._matriz.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._matriz.shape[1]
+
+    def valor(self, fila, columna):
+        return self._matriz[fila, columna]
+
+    # Da formato al número: enteros sin decimales y el resto con la cantidad de decimales indicada
+    def formatear(self, valor):
+        if isinstance(valor, (complex, np.complexfloating)):
+            return f"{valor:.{self.decimales}g}"
+        valor = float(valor)
+        if valor.is_integer():
+            return str(int(valor))
+        return f"{valor:.{self.decimales}f}"
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.formatear(self.valor(index.row(), index.column()))
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    # Los encabezados muestran la posición empezando en 1, como en la notación matemática
+    def headerData(self, seccion, orientacion, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return str(seccion + 1)
+        return None
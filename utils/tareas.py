@@ -0,0 +1,283 @@
+# Ejecutor de tareas en segundo plano compartido por todos los módulos.
+# Los cálculos largos se ejecutan en un hilo (QThreadPool) o en un proceso aparte que se puede
+# matar, y los resultados vuelven a la ventana mediante señales, sin congelar la interfaz.
+import inspect
+import multiprocessing
+import queue
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QProgressBar, QPushButton
+
+
+# Excepción que lanza una tarea cuando detecta que el usuario pidió cancelarla
+class TareaCancelada(Exception):
+    pass
+
+
+# Objeto que recibe la función de trabajo (si tiene un parámetro llamado "control")
+# para informar su progreso y revisar si debe detenerse
+class ControlTarea:
+    def __init__(self, notificar):
+        self._notificar = notificar
+        self._cancelada = False
+
+    def progreso(self, porcentaje):
+        self._notificar(("progreso", int(porcentaje)))
+
+    # Envía un resultado parcial (por ejemplo, los términos de una serie calculados hasta ahora)
+    # para mostrarlo mientras la tarea sigue
+    def parcial(self, valor):
+        self._notificar(("parcial", valor))
+
+    def cancelar(self):
+        self._cancelada = True
+
+    @property
+    def cancelada(self):
+        return self._cancelada
+
+    # Las funciones largas lo llaman entre pasos para detenerse en cuanto se cancela
+    def verificar(self):
+        if self._cancelada:
+            raise TareaCancelada()
+
+
+# Señales con las que una tarea avisa a la ventana (siempre se reciben en el hilo de la interfaz)
+class SenalesTarea(QObject):
+    progreso = pyqtSignal(int)
+    parcial = pyqtSignal(object)
+    resultado = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelada = pyqtSignal()
+    terminada = pyqtSignal()
+
+
+# Indica si la función de trabajo quiere recibir el objeto ControlTarea
+def _acepta_control(funcion):
+    try:
+        return "control" in inspect.signature(funcion).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _mensaje_error(e):
+    return str(e) or e.__class__.__name__
+
+
+# Tarea que corre en un hilo del QThreadPool global; se cancela de forma cooperativa
+class TareaHilo(QRunnable):
+    def __init__(self, funcion, args, kwargs):
+        super().__init__()
+        self.funcion = funcion
+        self.args = args
+        self.kwargs = kwargs
+        self.senales = SenalesTarea()
+        self.control = ControlTarea(self._notificar)
+
+    def _notificar(self, mensaje):
+        tipo, valor = mensaje
+        if tipo == "progreso":
+            self.senales.progreso.emit(valor)
+        elif tipo == "parcial":
+            self.senales.parcial.emit(valor)
+
+    def run(self):
+        kwargs = dict(self.kwargs)
+        if _acepta_control(self.funcion):
+            kwargs["control"] = self.control
+        try:
+            resultado = self.funcion(*self.args, **kwargs)
+        except TareaCancelada:
+            self.senales.cancelada.emit()
+        except Exception as e:
+            self.senales.error.emit(_mensaje_error(e))
+        else:
+            # Si se canceló mientras terminaba, el resultado se descarta
+            if self.control.cancelada:
+                self.senales.cancelada.emit()
+            else:
+                self.senales.resultado.emit(resultado)
+        finally:
+            self.senales.terminada.emit()
+
+    def iniciar(self):
+        QThreadPool.globalInstance().start(self)
+
+    def cancelar(self):
+        self.control.cancelar()
+
+
+# Función que se ejecuta dentro del proceso hijo y envía todo por la cola
+def _ejecutar_en_proceso(funcion, args, kwargs, cola):
+    control = ControlTarea(cola.put)
+    if _acepta_control(funcion):
+        kwargs = dict(kwargs, control=control)
+    try:
+        cola.put(("resultado", funcion(*args, **kwargs)))
+    except Exception as e:
+        cola.put(("error", _mensaje_error(e)))
+
+
+# Tarea que corre en un proceso aparte; cancelarla mata el proceso, así que sirve para
+# cálculos que pueden no terminar nunca (por ejemplo, integrales simbólicas difíciles).
+# La función y sus argumentos deben poder enviarse a otro proceso (funciones de módulo, no métodos de ventanas).
+class TareaProceso(QObject):
+    def __init__(self, funcion, args, kwargs, intervalo=50):
+        super().__init__()
+        self.senales = SenalesTarea()
+        self._cola = multiprocessing.Queue()
+        self._proceso = multiprocessing.Process(
+            target=_ejecutar_en_proceso, args=(funcion, args, kwargs, self._cola)
+        )
+        self._terminada = False
+        # La ventana revisa la cola periódicamente sin bloquear el bucle de eventos
+        self._temporizador = QTimer(self)
+        self._temporizador.setInterval(intervalo)
+        self._temporizador.timeout.connect(self._revisar)
+
+    def iniciar(self):
+        self._inicio = time.monotonic()
+        self._proceso.start()
+        self._temporizador.start()
+
+    def _procesar(self, mensaje):
+        tipo, valor = mensaje
+        if tipo == "progreso":
+            self.senales.progreso.emit(valor)
+            return False
+        if tipo == "parcial":
+            self.senales.parcial.emit(valor)
+            return False
+        if tipo == "resultado":
+            self.senales.resultado.emit(valor)
+        else:
+            self.senales.error.emit(valor)
+        return True
+
+    def _revisar(self):
+        if self._terminada:
+            return
+        vivo = self._proceso.is_alive()
+        while True:
+            try:
+                # Si el proceso ya terminó, se espera un poco por los últimos mensajes en tránsito
+                mensaje = self._cola.get(timeout=0.1) if not vivo else self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if self._procesar(mensaje):
+                self._finalizar()
+                return
+        if not vivo:
+            self.senales.error.emit("El proceso de cálculo terminó inesperadamente.")
+            self._finalizar()
+
+    def _matar(self):
+        if self._proceso.is_alive():
+            self._proceso.terminate()
+            self._proceso.join(1)
+            if self._proceso.is_alive():
+                self._proceso.kill()
+
+    def _finalizar(self):
+        self._terminada = True
+        self._temporizador.stop()
+        self._matar()
+        self._proceso.join()
+        self._cola.close()
+        self.senales.terminada.emit()
+
+    def cancelar(self):
+        if self._terminada:
+            return
+        self._matar()
+        self.senales.cancelada.emit()
+        self._finalizar()
+
+
+# Ejecutor compartido: lanza las tareas, conecta las funciones de respuesta y las mantiene vivas
+class EjecutorTareas(QObject):
+    def __init__(self):
+        super().__init__()
+        self._activas = set()
+
+    def ejecutar(self, funcion, *args, en_proceso=False, al_resultado=None, al_error=None,
+                 al_progreso=None, al_parcial=None, al_cancelar=None, al_terminar=None, **kwargs):
+        if en_proceso:
+            tarea = TareaProceso(funcion, args, kwargs)
+        else:
+            tarea = TareaHilo(funcion, args, kwargs)
+
+        for senal, respuesta in [
+            (tarea.senales.resultado, al_resultado),
+            (tarea.senales.error, al_error),
+            (tarea.senales.progreso, al_progreso),
+            (tarea.senales.parcial, al_parcial),
+            (tarea.senales.cancelada, al_cancelar),
+            (tarea.senales.terminada, al_terminar),
+        ]:
+            if respuesta is not None:
+                senal.connect(respuesta)
+
+        self._activas.add(tarea)
+        tarea.senales.terminada.connect(lambda: self._activas.discard(tarea))
+        tarea.iniciar()
+        return tarea
+
+    def cancelar_todas(self):
+        for tarea in list(self._activas):
+            tarea.cancelar()
+
+
+_ejecutor = None
+
+
+# Devuelve la instancia única del ejecutor de tareas
+def obtener_ejecutor():
+    global _ejecutor
+    if _ejecutor is None:
+        _ejecutor = EjecutorTareas()
+    return _ejecutor
+
+
+# Barra de progreso con botón "Cancelar" que las ventanas muestran mientras corre una tarea
+class BarraTarea(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tarea = None
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.barra = QProgressBar()
+        self.barra.setTextVisible(True)
+        layout.addWidget(self.barra, stretch=1)
+
+        self.boton_cancelar = QPushButton("Cancelar")
+        self.boton_cancelar.clicked.connect(self.cancelar)
+        layout.addWidget(self.boton_cancelar)
+
+        self.setVisible(False)
+
+    # Muestra la barra mientras la tarea está activa; sin progreso informado queda en modo "ocupado"
+    def seguir(self, tarea):
+        self.tarea = tarea
+        self.barra.setRange(0, 0)
+        tarea.senales.progreso.connect(self._actualizar)
+        tarea.senales.terminada.connect(self._ocultar)
+        self.setVisible(True)
+
+    def _actualizar(self, porcentaje):
+        self.barra.setRange(0, 100)
+        self.barra.setValue(porcentaje)
+
+    def _ocultar(self):
+        self.tarea = None
+        self.setVisible(False)
+
+    def ocupada(self):
+        return self.tarea is not None
+
+    def cancelar(self):
+        if self.tarea is not None:
+            self.tarea.cancelar()